@@ -19,6 +19,7 @@ import time
 import requests
 import signal
 import asyncio
+import threading
 import multiprocessing
 from fastapi.responses import StreamingResponse
 from typing import AsyncGenerator
@@ -42,7 +43,15 @@ from list_sync.database import (
     save_list_id,
     delete_list,
     DB_FILE,
-    init_database
+    connect_db,
+    get_connection,
+    init_database,
+    get_unique_items,
+    get_unique_items_after,
+    encode_item_cursor,
+    count_unique_items,
+    get_unique_status_counts,
+    reconcile_status_counters
 )
 from list_sync.config import load_env_config
 # Removed in-memory sync tracker - now using database-based tracking
@@ -78,10 +87,24 @@ async def startup_event():
         logging.error(f"Failed to initialize database on startup: {e}")
         # Don't stop startup, but raise HTTPException later if DB is unusable
 
+    threading.Thread(target=run_counter_reconciliation, name="counter-reconciliation", daemon=True).start()
+
     SERVER_START_TIME = time.time()
     print(f"🚀 API Server started at: {datetime.fromtimestamp(SERVER_START_TIME).isoformat()}")
     print(f"📊 Dashboard available at: http://localhost:3222")
 
+def run_counter_reconciliation():
+    """Periodically rebuild the dashboard status counters to repair any drift"""
+    interval_minutes = float(os.getenv('LISTSYNC_COUNTER_RECONCILE_MINUTES', '60') or '60')
+    while True:
+        time.sleep(interval_minutes * 60)
+        try:
+            drift = reconcile_status_counters()
+            if drift:
+                logging.warning(f"⚠️ Corrected {drift} drifted status counter rows")
+        except Exception as e:
+            logging.error(f"Status counter reconciliation failed: {e}")
+
 # Add CORS middleware
 import os
 
@@ -202,7 +225,7 @@ def parse_log_for_sync_info(log_path: str = 'data/list_sync.log', max_lines: int
         print(f"Log file not found: {log_path}")
         # Try to get last sync from database as fallback
         try:
-            conn = sqlite3.connect(DB_FILE)
+            conn = connect_db()
             cursor = conn.cursor()
             cursor.execute("SELECT MAX(last_synced) FROM synced_items")
             result = cursor.fetchone()
@@ -266,7 +289,7 @@ def parse_log_for_sync_info(log_path: str = 'data/list_sync.log', max_lines: int
         if not log_info.last_sync_complete:
             print("No sync completion found in logs, checking database...")
             try:
-                conn = sqlite3.connect(DB_FILE)
+                conn = connect_db()
                 cursor = conn.cursor()
                 cursor.execute("SELECT MAX(last_synced) FROM synced_items")
                 result = cursor.fetchone()
@@ -424,89 +447,42 @@ def normalize_list_id(list_type: str, list_id: str) -> str:
 
 
 def get_deduplicated_items():
-    """Get unique items with deduplication logic"""
+    """Get unique items from the materialized unique_items table, most recently synced first"""
     if not os.path.exists(DB_FILE):
         return []
     
     try:
-        conn = sqlite3.connect(DB_FILE)
-        cursor = conn.cursor()
-        
-        # Get all synced items including year and source list info
-        cursor.execute("SELECT id, title, media_type, year, imdb_id, overseerr_id, status, last_synced, source_list_type, source_list_id FROM synced_items")
-        items = cursor.fetchall()
-        
-        unique_items = {}
-        
-        # Define status priority (higher number = higher priority)
-        status_priority = {
-            'requested': 100,
-            'already_requested': 90,
-            'already_available': 80,
-            'available': 70,
-            'not_found': 20,
-            'error': 10,
-            'skipped': 5  # Lowest priority
-        }
-        
-        for item in items:
-            item_id, title, media_type, year, imdb_id, overseerr_id, status, last_synced, source_list_type, source_list_id = item
-            
-            # Create unique key based on title and media type
-            key = f"{title}_{media_type}".lower().strip()
-            
-            if key not in unique_items:
-                unique_items[key] = item
-            else:
-                existing_item = unique_items[key]
-                existing_status = existing_item[6]  # Status is now at index 6
-                existing_last_synced = existing_item[7]  # Last synced is now at index 7
-                
-                # Prefer item with higher status priority
-                current_priority = status_priority.get(status, 0)
-                existing_priority = status_priority.get(existing_status, 0)
-                
-                should_replace = False
-                
-                if current_priority > existing_priority:
-                    should_replace = True
-                elif current_priority == existing_priority:
-                    # Same priority, prefer item with overseerr_id
-                    if overseerr_id and not existing_item[5]:  # overseerr_id is now at index 5
-                        should_replace = True
-                    elif (overseerr_id and existing_item[5]) or (not overseerr_id and not existing_item[5]):
-                        # Both have or both don't have overseerr_id, prefer more recent
-                        if last_synced > existing_last_synced:
-                            should_replace = True
-                
-                if should_replace:
-                    unique_items[key] = item
-        
-        conn.close()
-        
-        result = list(unique_items.values())
-        print(f"DEBUG - Deduplication: {len(items)} raw items -> {len(result)} unique items")
-        
-        # Debug: Show status breakdown of unique items
-        status_counts = {}
-        for item in result:
-            status = item[6]  # Status is now at index 6
-            status_counts[status] = status_counts.get(status, 0) + 1
-        print(f"DEBUG - Unique item statuses: {status_counts}")
-        
-        return result
-        
+        return get_unique_items()
     except Exception as e:
         print(f"Error getting deduplicated items: {e}")
         return []
 
+def get_unique_items_page(page, limit, cursor="", list_type=None, list_ids=None):
+    """
+    Get one page of unique items and the cursor for the next page.
+    
+    Uses keyset pagination when a cursor is given; otherwise falls back to the
+    page number (the first page of both is the same).
+    """
+    if cursor:
+        try:
+            return get_unique_items_after(cursor, limit, list_type, list_ids)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    
+    page_items = get_unique_items(limit=limit + 1, offset=(page - 1) * limit, list_type=list_type, list_ids=list_ids)
+    if len(page_items) <= limit:
+        return page_items, None
+    last = page_items[limit - 1]
+    return page_items[:limit], encode_item_cursor(last[7], last[0])
+
 def analyze_data_quality():
     """Analyze data quality with deduplication stats"""
     if not os.path.exists(DB_FILE):
         return None
     
     try:
-        conn = sqlite3.connect(DB_FILE)
+        conn = connect_db()
         cursor = conn.cursor()
         
         # Get all synced items including year
@@ -1737,7 +1713,7 @@ async def get_system_status():
             database_status["last_modified"] = datetime.fromtimestamp(stat.st_mtime).isoformat()
             
             # Test connection
-            conn = sqlite3.connect(DB_FILE)
+            conn = connect_db()
             conn.execute("SELECT 1")
             conn.close()
             database_status["connected"] = True
@@ -1793,7 +1769,7 @@ async def get_log_info():
 async def test_database():
     """Test database connectivity"""
     try:
-        conn = sqlite3.connect(DB_FILE)
+        conn = connect_db()
         conn.execute("SELECT 1")
         conn.close()
         return {"connected": True}
@@ -2753,7 +2729,7 @@ async def sync_interval_from_env():
 async def get_sync_stats():
     """Get deduplicated sync statistics"""
     try:
-        unique_items = get_deduplicated_items()
+        status_counts = get_unique_status_counts()
         
         # Categorize statuses based on user requirements
         newly_requested_statuses = ['requested']  # Actually requested during this sync
@@ -2762,11 +2738,11 @@ async def get_sync_stats():
         skipped_statuses = ['skipped']
         error_statuses = ['not_found', 'error']
         
-        newly_requested_count = sum(1 for item in unique_items if item[6] in newly_requested_statuses)
-        already_requested_count = sum(1 for item in unique_items if item[6] in already_requested_statuses)
-        available_count = sum(1 for item in unique_items if item[6] in available_statuses)
-        skipped_count = sum(1 for item in unique_items if item[6] in skipped_statuses)
-        error_count = sum(1 for item in unique_items if item[6] in error_statuses)
+        newly_requested_count = sum(status_counts.get(status, 0) for status in newly_requested_statuses)
+        already_requested_count = sum(status_counts.get(status, 0) for status in already_requested_statuses)
+        available_count = sum(status_counts.get(status, 0) for status in available_statuses)
+        skipped_count = sum(status_counts.get(status, 0) for status in skipped_statuses)
+        error_count = sum(status_counts.get(status, 0) for status in error_statuses)
         
         # Get duplicates from the most recent sync session in logs
         duplicates_in_current_sync = get_duplicates_from_current_sync()
@@ -2781,7 +2757,7 @@ async def get_sync_stats():
             log_based_errors = error_count
         
         # Calculate simplified metrics
-        total_processed = len(unique_items)
+        total_processed = sum(status_counts.values())
         successful_items = newly_requested_count + already_requested_count + available_count + skipped_count  # All non-error items
         total_requested = newly_requested_count  # Only items actually requested during this sync
         total_errors = log_based_errors  # Use same count as /failures page for consistency
@@ -2839,27 +2815,24 @@ async def get_data_quality():
 async def get_status_breakdown():
     """Get success/failure categorization"""
     try:
-        unique_items = get_deduplicated_items()
+        status_counts = get_unique_status_counts()
         
         success_statuses = ['already_available', 'already_requested', 'available', 'requested']
         failure_statuses = ['not_found', 'error']
-        
-        successful_items = [item for item in unique_items if item[6] in success_statuses]
-        failed_items = [item for item in unique_items if item[6] in failure_statuses]
-        other_items = [item for item in unique_items if item[6] not in success_statuses + failure_statuses]
+        other_statuses = [status for status in status_counts if status not in success_statuses + failure_statuses]
         
         return {
             "successful": {
-                "count": len(successful_items),
+                "count": sum(status_counts.get(status, 0) for status in success_statuses),
                 "statuses": success_statuses
             },
             "failed": {
-                "count": len(failed_items),
+                "count": sum(status_counts.get(status, 0) for status in failure_statuses),
                 "statuses": failure_statuses
             },
             "other": {
-                "count": len(other_items),
-                "statuses": list(set(item[6] for item in other_items))
+                "count": sum(status_counts[status] for status in other_statuses),
+                "statuses": other_statuses
             }
         }
     except Exception as e:
@@ -3129,7 +3102,7 @@ async def get_lists_debug():
         import sqlite3
         from list_sync.database import DB_FILE
         
-        with sqlite3.connect(DB_FILE) as conn:
+        with get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT list_type, list_id, list_url, item_count, last_synced FROM lists")
             raw_data = cursor.fetchall()
@@ -3202,7 +3175,7 @@ async def get_list_items_endpoint(list_type: str, list_id: str, limit: int = Que
         
         if item_ids:
             try:
-                with sqlite3.connect(DB_FILE) as conn:
+                with get_connection() as conn:
                     cursor = conn.cursor()
                     placeholders = ','.join('?' * len(item_ids))
                     cursor.execute(f"SELECT id, poster_url FROM synced_items WHERE id IN ({placeholders})", item_ids)
@@ -3266,20 +3239,19 @@ async def delete_list_endpoint(list_type: str, list_id: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/items")
-async def get_items(page: int = Query(1, ge=1), limit: int = Query(50, ge=1, le=100)):
+async def get_items(
+    page: int = Query(1, ge=1),
+    limit: int = Query(50, ge=1, le=100),
+    cursor: str = Query("", description="next_cursor from the previous page; takes precedence over page")
+):
     """Get all synced items (deduplicated)"""
     try:
-        unique_items = get_deduplicated_items()
-        
         # Calculate pagination
-        total = len(unique_items)
+        total = count_unique_items()
         total_pages = (total + limit - 1) // limit
-        start = (page - 1) * limit
-        end = start + limit
         
-        # Sort by last_synced descending
-        sorted_items = sorted(unique_items, key=lambda x: x[6], reverse=True)
-        page_items = sorted_items[start:end]
+        # Sorted by last_synced descending
+        page_items, next_cursor = get_unique_items_page(page, limit, cursor)
         
         items = []
         for item in page_items:
@@ -3311,8 +3283,11 @@ async def get_items(page: int = Query(1, ge=1), limit: int = Query(50, ge=1, le=
             "total": total,
             "page": page,
             "limit": limit,
-            "total_pages": total_pages
+            "total_pages": total_pages,
+            "next_cursor": next_cursor
         }
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -3333,7 +3308,8 @@ async def clear_enriched_cache():
 async def get_enriched_items(
     page: int = Query(1, ge=1), 
     limit: int = Query(50, ge=1, le=100),
-    list_source: str = Query("", description="Filter by list source in format 'list_type:list_id'")
+    list_source: str = Query("", description="Filter by list source in format 'list_type:list_id'"),
+    cursor: str = Query("", description="next_cursor from the previous page; takes precedence over page")
 ):
     """Get synced items enriched with Trakt metadata (poster, rating, etc.)"""
     try:
@@ -3341,58 +3317,28 @@ async def get_enriched_items(
         from list_sync.database import DB_FILE
         import time
         
-        # Debug: Check item_lists table
-        try:
-            with sqlite3.connect(DB_FILE) as conn:
-                cursor = conn.cursor()
-                cursor.execute("SELECT COUNT(*) FROM item_lists")
-                item_lists_count = cursor.fetchone()[0]
-                logging.info(f"📊 item_lists table has {item_lists_count} entries")
-        except Exception as e:
-            logging.warning(f"Could not check item_lists table: {e}")
-        
-        # Get base items (deduplicated)
-        unique_items = get_deduplicated_items()
-        
-        # Filter by list source if specified (before pagination)
-        # Filter directly using source_list_type and source_list_id columns from synced_items
+        # Filter by list source if specified, using source_list_type and source_list_id of the unique items
+        filter_list_type = None
+        filter_list_ids = None
         if list_source and list_source.strip():
             try:
                 filter_list_type, filter_list_id = list_source.split(':', 1)
                 
                 # Normalize the list_id to match what's stored in database
                 normalized_list_id = normalize_list_id(filter_list_type, filter_list_id)
+                filter_list_ids = [normalized_list_id, filter_list_id]
                 
                 logging.info(f"📋 Filtering by list {filter_list_type}:{filter_list_id} (normalized: {normalized_list_id})")
-                
-                # Filter items where source_list_type and source_list_id match
-                # Item tuple: (id, title, media_type, year, imdb_id, overseerr_id, status, last_synced, source_list_type, source_list_id)
-                before_count = len(unique_items)
-                unique_items = [
-                    item for item in unique_items 
-                    if (item[8] == filter_list_type and 
-                        (item[9] == normalized_list_id or item[9] == filter_list_id))
-                ]
-                
-                logging.info(f"📋 Filtered {before_count} items → {len(unique_items)} items match list {filter_list_type}:{filter_list_id}")
             except ValueError:
                 # Invalid list_source format, ignore filter
                 logging.warning(f"Invalid list_source format: {list_source}, ignoring filter")
         
         # Calculate pagination on filtered items
-        total = len(unique_items)
+        total = count_unique_items(filter_list_type, filter_list_ids)
         total_pages = (total + limit - 1) // limit if total > 0 else 0
-        start = (page - 1) * limit
-        end = start + limit
         
-        # Sort by last_synced descending (most recently synced first)
-        # Handle None values by putting them at the end
-        sorted_items = sorted(
-            unique_items, 
-            key=lambda x: x[7] if x[7] is not None else '', 
-            reverse=True
-        )
-        page_items = sorted_items[start:end]
+        # Most recently synced first, items never synced at the end
+        page_items, next_cursor = get_unique_items_page(page, limit, cursor, filter_list_type, filter_list_ids)
         
         # Get overseerr URL for constructing links
         config_tuple = load_env_config()
@@ -3405,7 +3351,7 @@ async def get_enriched_items(
         item_lists_map = {}  # Map item_id to list of lists it belongs to
 
         try:
-            with sqlite3.connect(DB_FILE) as conn:
+            with get_connection() as conn:
                 cursor = conn.cursor()
                 placeholders = ','.join('?' * len(item_ids))
                 
@@ -3582,9 +3528,12 @@ async def get_enriched_items(
             "total": total,
             "page": page,
             "limit": limit,
-            "total_pages": total_pages
+            "total_pages": total_pages,
+            "next_cursor": next_cursor
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
         logging.error(f"Error in enriched items endpoint: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -4440,7 +4389,7 @@ async def get_processed_items(
         
         if item_ids:
             try:
-                with sqlite3.connect(DB_FILE) as conn:
+                with get_connection() as conn:
                     cursor = conn.cursor()
                     placeholders = ','.join('?' * len(item_ids))
                     
@@ -4706,7 +4655,7 @@ async def get_requested_items(
                 }
             }
         
-        conn = sqlite3.connect(DB_FILE)
+        conn = connect_db()
         cursor = conn.cursor()
         
         # Build WHERE clause for filters - ONLY include 'requested' status, not 'already_requested'
@@ -4814,10 +4763,11 @@ async def get_collections(
 ):
     """Get all collections with pagination, search, and sorting"""
     try:
-        from list_sync.providers.collections import get_all_collections
+        from list_sync.providers.collections import get_collections_catalogue
         from list_sync.database import load_list_ids
         
-        collections = get_all_collections()
+        # Search filter applied to a precomputed sort order (default: total_votes for quality content first)
+        collections = get_collections_catalogue().sorted_by(sort, search)
         
         # Get synced collections info
         all_lists = load_list_ids()
@@ -4830,40 +4780,17 @@ async def get_collections(
                     "item_count": list_item.get("item_count", 0)
                 }
         
-        # Apply search filter
-        if search.strip():
-            search_lower = search.strip().lower()
-            collections = [
-                c for c in collections
-                if search_lower in c.get("franchise", "").lower()
-            ]
-        
-        # Apply sorting (default: total_votes for quality content first)
-        if sort == "total_votes":
-            collections.sort(key=lambda x: x.get("totalVotes", 0), reverse=True)
-        elif sort == "popularity":
-            collections.sort(key=lambda x: x.get("popularityScore", 0), reverse=True)
-        elif sort == "rating":
-            collections.sort(key=lambda x: x.get("averageRating", 0), reverse=True)
-        elif sort == "movie_count":
-            collections.sort(key=lambda x: x.get("totalMovies", 0), reverse=True)
-        elif sort == "name":
-            collections.sort(key=lambda x: x.get("franchise", "").lower())
-        
         # Calculate pagination
         total = len(collections)
         total_pages = (total + limit - 1) // limit if total > 0 else 0
         start = (page - 1) * limit
         end = start + limit
-        page_collections = collections[start:end]
         
-        # Add synced info to each collection
-        for collection in page_collections:
-            franchise = collection.get("franchise")
-            if franchise in synced_info:
-                collection["_synced_info"] = synced_info[franchise]
-            else:
-                collection["_synced_info"] = None
+        # Add synced info to copies, the catalogue's collections are shared between requests
+        page_collections = [
+            {**collection, "_synced_info": synced_info.get(collection.get("franchise"))}
+            for collection in collections[start:end]
+        ]
         
         return {
             "collections": page_collections,
@@ -4882,20 +4809,22 @@ async def get_random_collections(count: int = Query(5, ge=1, le=20, description=
     """Get random collections from the full database (only collections with 3+ movies) - cached for performance"""
     try:
         import random
-        from list_sync.providers.collections import get_all_collections
+        from list_sync.providers.collections import get_collections_catalogue
         
-        # Use cached collections data (already cached in collections.py)
-        collections = get_all_collections()
+        # Use cached collections catalogue (rebuilt by collections.py when the file changes)
+        catalogue = get_collections_catalogue()
         
-        # Filter to only collections with 3 or more movies (do this once, cache the result)
-        if not hasattr(get_random_collections, '_filtered_cache'):
-            get_random_collections._filtered_cache = [
-                c for c in collections 
+        # Filter to only collections with 3 or more movies (once per catalogue, cache the result)
+        cached = getattr(get_random_collections, '_filtered_cache', None)
+        if cached is None or cached[0] is not catalogue:
+            cached = (catalogue, [
+                c for c in catalogue.collections
                 if c and c.get("franchise") and c.get("totalMovies", 0) >= 3
-            ]
-            logging.info(f"Cached {len(get_random_collections._filtered_cache)} collections with 3+ movies for random selection")
+            ])
+            get_random_collections._filtered_cache = cached
+            logging.info(f"Cached {len(cached[1])} collections with 3+ movies for random selection")
         
-        filtered_collections = get_random_collections._filtered_cache
+        filtered_collections = cached[1]
         
         if len(filtered_collections) == 0:
             logging.warning("No collections with 3+ movies available for random selection")
@@ -4932,14 +4861,11 @@ async def get_random_collections(count: int = Query(5, ge=1, le=20, description=
 async def get_popular_collections():
     """Get top 20 collections by total votes (quality content first)"""
     try:
-        from list_sync.providers.collections import get_all_collections
+        from list_sync.providers.collections import get_collections_catalogue
         from list_sync.database import load_list_ids
         
-        collections = get_all_collections()
-        
-        # Sort by total votes (quality content first) and take top 20
-        collections.sort(key=lambda x: x.get("totalVotes", 0), reverse=True)
-        top_20 = collections[:20]
+        # Top 20 by total votes (quality content first)
+        top_20 = get_collections_catalogue().sorted_by("total_votes")[:20]
         
         # Get synced collections info
         all_lists = load_list_ids()
@@ -4952,16 +4878,12 @@ async def get_popular_collections():
                     "item_count": list_item.get("item_count", 0)
                 }
         
-        # Add synced info to each collection
-        for collection in top_20:
-            franchise = collection.get("franchise")
-            if franchise in synced_info:
-                collection["_synced_info"] = synced_info[franchise]
-            else:
-                collection["_synced_info"] = None
-        
+        # Add synced info to copies, the catalogue's collections are shared between requests
         return {
-            "collections": top_20
+            "collections": [
+                {**collection, "_synced_info": synced_info.get(collection.get("franchise"))}
+                for collection in top_20
+            ]
         }
     except Exception as e:
         logging.error(f"Error getting popular collections: {e}")
@@ -6973,7 +6895,7 @@ def enrich_historic_data_with_database(historic_items):
         return historic_items
     
     try:
-        conn = sqlite3.connect(DB_FILE)
+        conn = connect_db()
         cursor = conn.cursor()
         
         # Get all database items with their IDs, year, and source list info
@@ -8350,7 +8272,7 @@ async def list_cached_images(limit: int = Query(50, ge=1, le=1000)):
         from list_sync.database import DB_FILE
         import sqlite3
 
-        with sqlite3.connect(DB_FILE) as conn:
+        with get_connection() as conn:
             conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
             cursor.execute('''
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Check that the hot synced_items queries use indexes instead of full table scans.
+
+Builds a throwaway database with the current migrations, fills it with 100k
+synthetic items, then runs EXPLAIN QUERY PLAN on each query below. Exits with
+status 1 if any query scans a table without an index.
+
+Usage: python development-files/scripts/check_query_plans.py [row_count]
+"""
+
+import os
+import random
+import sys
+import tempfile
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+# (name, SQL, parameters) for every query that runs per item or per page load
+HOT_QUERIES = [
+    ("lookup by overseerr_id", "SELECT id FROM synced_items WHERE overseerr_id = ?", (1234,)),
+    ("lookup by imdb_id", "SELECT id FROM synced_items WHERE imdb_id = ?", ("tt0001234",)),
+    ("lookup by tmdb_id", "SELECT id FROM synced_items WHERE tmdb_id = ?", ("1234",)),
+    (
+        "save_sync_results: identity key upgrade",
+        "UPDATE OR IGNORE synced_items SET identity_key = ? WHERE identity_key IN (?, ?)",
+        ("tmdb:movie:1234", "imdb:tt0001234", "title:movie:title 1234:2000"),
+    ),
+    (
+        "save_sync_results: upsert",
+        "INSERT INTO synced_items (title, media_type, status, identity_key) VALUES (?, ?, ?, ?) "
+        "ON CONFLICT(identity_key) DO UPDATE SET status = excluded.status",
+        ("Title 1234", "movie", "requested", "tmdb:movie:1234"),
+    ),
+    (
+        "should_sync_item",
+        "SELECT last_synced FROM synced_items WHERE overseerr_id = ? AND last_synced > datetime('now', '-48 hours')",
+        (1234,),
+    ),
+    (
+        "get_sync_stats",
+        "SELECT status, SUM(count) FROM sync_status_counters "
+        "WHERE hour >= strftime('%Y-%m-%d %H:00:00', datetime('now', '-7 days')) GROUP BY status",
+        (),
+    ),
+    (
+        "get_unique_items page",
+        "SELECT item_id, title, status FROM unique_items ORDER BY last_synced DESC, item_id DESC LIMIT ? OFFSET ?",
+        (50, 0),
+    ),
+    (
+        "get_unique_items_after cursor",
+        "SELECT item_id FROM unique_items WHERE last_synced IS NOT NULL AND (last_synced, item_id) < (?, ?) "
+        "ORDER BY last_synced DESC, item_id DESC LIMIT ?",
+        ("2024-01-01 00:00:00", 1234, 51),
+    ),
+    (
+        "get_unique_items by source list",
+        "SELECT item_id FROM unique_items WHERE source_list_type = ? AND source_list_id IN (?, ?) "
+        "ORDER BY last_synced DESC, item_id DESC LIMIT ? OFFSET ?",
+        ("imdb", "ls1", "ls1", 50, 0),
+    ),
+    (
+        "get_unique_status_counts by list",
+        "SELECT status, SUM(count) FROM status_counters WHERE source_list_type = ? AND source_list_id IN (?) "
+        "GROUP BY status",
+        ("imdb", "ls1"),
+    ),
+    ("get_item_lists", "SELECT list_type, list_id FROM item_lists WHERE item_id = ?", (1234,)),
+]
+
+STATUSES = ["requested", "already_available", "already_requested", "skipped", "not_found", "error"]
+
+
+def populate(conn, row_count: int) -> None:
+    """Insert synthetic synced_items and item_lists rows"""
+    rows = []
+    for i in range(1, row_count + 1):
+        media_type = random.choice(["movie", "tv"])
+        rows.append((
+            f"Title {i}", media_type, 1950 + i % 75, f"tt{i:07d}", str(i), i,
+            random.choice(STATUSES), f"tmdb:{media_type}:{i}", f"title {i}_{media_type}",
+        ))
+    conn.executemany('''
+        INSERT INTO synced_items (title, media_type, year, imdb_id, tmdb_id, overseerr_id, status, identity_key,
+                                  dedup_key, last_synced)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, datetime('now', '-' || abs(random() % 720) || ' hours'))
+    ''', rows)
+    conn.executemany(
+        "INSERT INTO item_lists (item_id, list_type, list_id) VALUES (?, 'imdb', ?)",
+        [(i, f"ls{i % 50}") for i in range(1, row_count + 1)]
+    )
+    conn.commit()
+    conn.execute("ANALYZE")
+
+
+def is_full_scan(detail: str) -> bool:
+    """A plan step is a full scan if it scans a table without using an index"""
+    return detail.startswith("SCAN") and "INDEX" not in detail and "sqlite_" not in detail
+
+
+def main() -> int:
+    row_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # DATA_DIR is relative to the working directory
+        os.chdir(tmp)
+        os.makedirs("data")
+        from list_sync.database import connect_db, get_schema_version, init_database
+
+        init_database()
+        print(f"Schema version {get_schema_version()}, populating {row_count} items...")
+
+        conn = connect_db()
+        populate(conn, row_count)
+
+        failures = 0
+        for name, sql, params in HOT_QUERIES:
+            plan = [row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", params)]
+            scans = [step for step in plan if is_full_scan(step)]
+            print(f"{'FAIL' if scans else 'ok  '} {name}")
+            for step in plan:
+                print(f"       {step}")
+            failures += bool(scans)
+
+        conn.close()
+
+    print(f"\n{failures} of {len(HOT_QUERIES)} queries fall back to a full scan")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
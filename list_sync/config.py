@@ -5,10 +5,13 @@ Configuration management for ListSync.
 import base64
 import getpass
 import json
+import logging
 import os
 import sqlite3
+import threading
 import time
-from typing import Optional, Tuple
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
 
 import requests
 from cryptography.fernet import Fernet
@@ -211,15 +214,43 @@ def get_tvdb_api_key() -> Optional[str]:
     return api_key
 
 
-def load_env_config() -> Tuple[Optional[str], Optional[str], Optional[str], float, bool, bool]:
-    """
-    Load configuration from database or environment variables (database preferred).
-    
-    Returns:
-        Tuple: Overseerr URL, API key, user ID, sync interval (float), automated mode flag, 4K flag
-    """
-    import logging
-    
+@dataclass(frozen=True)
+class ConfigSnapshot:
+    """Immutable view of the runtime configuration at one settings version"""
+    url: Optional[str]
+    api_key: Optional[str]
+    user_id: Optional[str]
+    sync_interval: float
+    automated_mode: bool
+    is_4k: bool
+    source: str
+    version: Optional[int]
+
+
+# Seconds a connectivity check result is reused before it is refreshed in the background
+CONNECTIVITY_CHECK_TTL = float(os.getenv('LISTSYNC_CONNECTIVITY_CHECK_TTL', '300') or '300')
+
+_config_snapshot: Optional[ConfigSnapshot] = None
+_config_snapshot_lock = threading.Lock()
+
+# (url, api_key) -> (ok, checked_at); checks in flight are tracked so only one runs per target
+_connectivity_results: Dict[Tuple[str, str], Tuple[bool, float]] = {}
+_connectivity_in_flight = set()
+_connectivity_lock = threading.Lock()
+
+
+def _read_settings_version() -> Optional[int]:
+    """Read the settings version counter, or None if the database is unavailable"""
+    try:
+        from .database import get_settings_version
+        return get_settings_version()
+    except Exception as e:
+        logging.debug(f"Could not read settings version: {e}")
+        return None
+
+
+def _build_config_snapshot(version: Optional[int]) -> ConfigSnapshot:
+    """Load (and decrypt) the configuration from the database or environment"""
     # Try to load from database first (if ConfigManager available)
     try:
         config_manager = ConfigManager()
@@ -248,23 +279,7 @@ def load_env_config() -> Tuple[Optional[str], Optional[str], Optional[str], floa
             is_4k = str(is_4k_val).lower() == 'true'
         
         discord_webhook_url = config_manager.get_setting('discord_webhook')
-        
-        # Log if Discord webhook is configured
-        if discord_webhook_url:
-            logging.info("Discord webhook integration enabled")
-        
-        # Only return the config if required variables are present
-        if url and api_key:
-            try:
-                # Test the API connection
-                test_overseerr_api(url, api_key)
-                logging.info("Configuration loaded from database")
-                return url, api_key, user_id, sync_interval, automated_mode, is_4k
-            except Exception as e:
-                logging.error(f"Error testing Overseerr API with database config: {e}")
-                print(color_gradient(f"\n❌  Error testing Overseerr API: {e}", "#ff0000", "#aa0000"))
-        
-        return None, None, None, 0.0, False, False
+        source = "database"
         
     except Exception as e:
         # Fallback to environment variables if database fails
@@ -277,27 +292,129 @@ def load_env_config() -> Tuple[Optional[str], Optional[str], Optional[str], floa
         url = os.getenv('OVERSEERR_URL')
         api_key = os.getenv('OVERSEERR_API_KEY')
         user_id = os.getenv('OVERSEERR_USER_ID', '1')
-        sync_interval = os.getenv('SYNC_INTERVAL', '12')
+        try:
+            sync_interval = float(os.getenv('SYNC_INTERVAL', '12'))
+        except ValueError:
+            sync_interval = 12.0
         automated_mode = os.getenv('AUTOMATED_MODE', 'true').lower() == 'true'
         is_4k = os.getenv('OVERSEERR_4K', 'false').lower() == 'true'
         discord_webhook_url = os.getenv('DISCORD_WEBHOOK_URL')
+        source = "environment variables"
+    
+    # Log if Discord webhook is configured
+    if discord_webhook_url:
+        logging.info("Discord webhook integration enabled")
+    
+    return ConfigSnapshot(url, api_key, user_id, sync_interval, automated_mode, is_4k, source, version)
+
+
+def get_config_snapshot() -> ConfigSnapshot:
+    """
+    Get the process-wide configuration snapshot.
+    
+    The snapshot is rebuilt only when the settings version counter in
+    app_settings changes, so repeated calls cost a single primary-key lookup
+    instead of reloading .env and decrypting every setting.
+    
+    Returns:
+        ConfigSnapshot: Current configuration
+    """
+    global _config_snapshot
+    version = _read_settings_version()
+    snapshot = _config_snapshot
+    if snapshot is not None and version is not None and snapshot.version == version:
+        return snapshot
+    
+    with _config_snapshot_lock:
+        if _config_snapshot is None or version is None or _config_snapshot.version != version:
+            _config_snapshot = _build_config_snapshot(version)
+            logging.info(f"Configuration loaded from {_config_snapshot.source} (settings version {version})")
+        return _config_snapshot
+
+
+def _run_connectivity_check(url: str, api_key: str, interactive: bool) -> bool:
+    """Test the Overseerr API and record the result"""
+    key = (url, api_key)
+    try:
+        if interactive:
+            test_overseerr_api(url, api_key)
+        else:
+            response = requests.get(
+                f"{url}/api/v1/status",
+                headers={"X-Api-Key": api_key, "Content-Type": "application/json"},
+                timeout=10
+            )
+            response.raise_for_status()
+        ok = True
+    except Exception as e:
+        logging.error(f"Error testing Overseerr API with {url}: {e}")
+        if interactive:
+            print(color_gradient(f"\n❌  Error testing Overseerr API: {e}", "#ff0000", "#aa0000"))
+        ok = False
+    
+    with _connectivity_lock:
+        _connectivity_results[key] = (ok, time.monotonic())
+        _connectivity_in_flight.discard(key)
+    return ok
+
+
+def check_overseerr_connectivity(url: str, api_key: str, wait: bool = False) -> Optional[bool]:
+    """
+    Get the cached Overseerr connectivity status, refreshing it when stale.
+    
+    Args:
+        url (str): Overseerr URL
+        api_key (str): Overseerr API key
+        wait (bool): Run the check in the foreground if there is no fresh result
         
-        # Log if Discord webhook is configured
-        if discord_webhook_url:
-            logging.info("Discord webhook integration enabled")
-        
-        # Only return the config if required variables are present
-        if url and api_key:
-            try:
-                # Test the API connection
-                test_overseerr_api(url, api_key)
-                logging.info("Configuration loaded from environment variables")
-                return url, api_key, user_id, float(sync_interval), automated_mode, is_4k
-            except Exception as e:
-                logging.error(f"Error testing Overseerr API with environment variables: {e}")
-                print(color_gradient(f"\n❌  Error testing Overseerr API: {e}", "#ff0000", "#aa0000"))
-        
-        return None, None, None, 0.0, False, False
+    Returns:
+        Optional[bool]: Last known status, or None if it has not been checked yet
+    """
+    key = (url, api_key)
+    with _connectivity_lock:
+        cached = _connectivity_results.get(key)
+        fresh = cached is not None and time.monotonic() - cached[1] < CONNECTIVITY_CHECK_TTL
+        if fresh:
+            return cached[0]
+        if wait:
+            _connectivity_in_flight.add(key)
+        elif key not in _connectivity_in_flight:
+            _connectivity_in_flight.add(key)
+            threading.Thread(
+                target=_run_connectivity_check,
+                args=(url, api_key, False),
+                name="overseerr-connectivity-check",
+                daemon=True
+            ).start()
+    
+    if wait:
+        return _run_connectivity_check(url, api_key, True)
+    return cached[0] if cached else None
+
+
+def load_env_config(wait_for_check: bool = False) -> Tuple[Optional[str], Optional[str], Optional[str], float, bool, bool]:
+    """
+    Load configuration from database or environment variables (database preferred).
+    
+    Values come from the cached config snapshot. The Overseerr connectivity
+    check is cached for LISTSYNC_CONNECTIVITY_CHECK_TTL seconds and refreshed
+    in the background; until a check has failed the configuration is returned.
+    
+    Args:
+        wait_for_check (bool): Block on the connectivity check when no fresh result is cached (CLI startup)
+    
+    Returns:
+        Tuple: Overseerr URL, API key, user ID, sync interval (float), automated mode flag, 4K flag
+    """
+    snapshot = get_config_snapshot()
+    
+    # Only return the config if required variables are present and the API is not known to be unreachable
+    if snapshot.url and snapshot.api_key:
+        if check_overseerr_connectivity(snapshot.url, snapshot.api_key, wait=wait_for_check) is not False:
+            return snapshot.url, snapshot.api_key, snapshot.user_id, snapshot.sync_interval, snapshot.automated_mode, snapshot.is_4k
+    
+    return None, None, None, 0.0, False, False
+
 
 def load_env_lists() -> bool:
     """
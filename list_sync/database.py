@@ -6,20 +6,48 @@ import sqlite3
 import os
 import logging
 import hashlib
-from typing import Dict, List, Optional, Any
+import time
+import json
+import base64
+from typing import Dict, List, Optional, Any, Tuple
 from pathlib import Path
 
+from .utils.db_pool import SQLitePool
 from .utils.logger import DATA_DIR
 
 # Define database file path
 DB_FILE = os.path.join(DATA_DIR, "list_sync.db")
 
+_db_pool = SQLitePool(DB_FILE)
+
+
+def get_connection():
+    """
+    Lease a pooled database connection for a `with` block.
+    
+    Commits on success and rolls back on error, like `with sqlite3.connect(DB_FILE)`.
+    
+    Returns:
+        ContextManager[sqlite3.Connection]: Pooled connection in WAL mode
+    """
+    return _db_pool.connection()
+
+
+def connect_db() -> sqlite3.Connection:
+    """
+    Check out a pooled database connection; close() returns it to the pool.
+    
+    Returns:
+        sqlite3.Connection: Pooled connection in WAL mode
+    """
+    return _db_pool.acquire()
+
 
 def update_existing_list_urls():
     """Update URLs for existing lists that may have incorrect URLs stored."""
     from .utils.helpers import construct_list_url
     
-    with sqlite3.connect(DB_FILE) as conn:
+    with get_connection() as conn:
         cursor = conn.cursor()
         
         # Get all lists to check their URLs
@@ -53,7 +81,7 @@ def update_existing_list_urls():
 
 def remove_simkl_column():
     """Remove the simkl_id column from synced_items table since SIMKL is disabled."""
-    with sqlite3.connect(DB_FILE) as conn:
+    with get_connection() as conn:
         cursor = conn.cursor()
         
         # Check if simkl_id column exists
@@ -99,7 +127,7 @@ def migrate_list_urls():
     """Migrate existing lists to populate missing URLs and add item_count and last_synced columns."""
     from .utils.helpers import construct_list_url
     
-    with sqlite3.connect(DB_FILE) as conn:
+    with get_connection() as conn:
         cursor = conn.cursor()
         
         # Add item_count column if it doesn't exist
@@ -143,9 +171,14 @@ def migrate_list_urls():
         update_existing_list_urls()
 
 
-def init_database():
-    """Initialize the SQLite database with required tables."""
-    with sqlite3.connect(DB_FILE) as conn:
+def _migrate_baseline_schema():
+    """
+    Migration 1: the schema as it was before versioned migrations.
+    
+    Every statement is idempotent, so databases created by older releases
+    (which ran this on every start) are brought up to date safely.
+    """
+    with get_connection() as conn:
         cursor = conn.cursor()
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS lists (
@@ -437,7 +470,7 @@ def init_database():
     # Migrate BLOB images to filesystem (one-time migration)
     # Only run if there are BLOB images that need migration
     try:
-        with sqlite3.connect(DB_FILE) as conn:
+        with get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute('''
                 SELECT COUNT(*) FROM cached_images
@@ -454,11 +487,500 @@ def init_database():
         logging.warning(f"Image migration check failed: {e}")
 
 
+# SQL form of make_identity_key(), used to backfill identity keys in bulk
+_IDENTITY_KEY_SQL = '''
+    CASE
+        WHEN overseerr_id IS NOT NULL THEN 'tmdb:' || media_type || ':' || overseerr_id
+        WHEN tmdb_id IS NOT NULL AND tmdb_id != '' THEN 'tmdb:' || media_type || ':' || tmdb_id
+        WHEN imdb_id IS NOT NULL AND imdb_id != '' THEN 'imdb:' || imdb_id
+        ELSE 'title:' || media_type || ':' || lower(trim(title)) || ':' || COALESCE(year, '')
+    END
+'''
+
+
+def make_identity_key(media_type: str, overseerr_id: Optional[int], tmdb_id: Optional[str], imdb_id: Optional[str], title: str, year: Optional[int]) -> str:
+    """
+    Build the unique identity key of a synced item from its strongest ID.
+    
+    Overseerr IDs are TMDB IDs, so an item is identified by TMDB ID and media
+    type when known, then by IMDb ID, then by title and year.
+    
+    Args:
+        media_type: Media type (movie/tv)
+        overseerr_id: Overseerr (TMDB) ID
+        tmdb_id: TMDB ID
+        imdb_id: IMDb ID
+        title: Media title
+        year: Release year
+    
+    Returns:
+        str: Identity key matching synced_items.identity_key
+    """
+    if overseerr_id is not None:
+        return f"tmdb:{media_type}:{overseerr_id}"
+    if tmdb_id:
+        return f"tmdb:{media_type}:{tmdb_id}"
+    if imdb_id:
+        return f"imdb:{imdb_id}"
+    return f"title:{media_type}:{(title or '').strip().lower()}:{year if year is not None else ''}"
+
+
+def _migrate_synced_items_identity():
+    """
+    Migration 2: identity keys and lookup indexes on synced_items.
+    
+    Backfills identity_key, merges rows that share one (keeping the most
+    recently synced row and moving its list links and sync history over),
+    then adds the unique identity index and the indexes behind the per-item
+    lookups, the 48-hour resync check and the status statistics.
+    """
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        
+        try:
+            cursor.execute('ALTER TABLE synced_items ADD COLUMN identity_key TEXT')
+            logging.info("Added identity_key column to synced_items table")
+        except sqlite3.OperationalError:
+            pass
+        
+        cursor.execute(f'UPDATE synced_items SET identity_key = {_IDENTITY_KEY_SQL} WHERE identity_key IS NULL')
+        
+        # Map every duplicate row onto the row that is kept
+        cursor.execute('''
+            CREATE TEMP TABLE IF NOT EXISTS identity_merge AS
+            SELECT id AS old_id, (
+                SELECT keep.id FROM synced_items keep
+                WHERE keep.identity_key = dup.identity_key
+                ORDER BY keep.last_synced DESC, keep.id DESC
+                LIMIT 1
+            ) AS new_id
+            FROM synced_items dup
+            WHERE identity_key IN (
+                SELECT identity_key FROM synced_items GROUP BY identity_key HAVING COUNT(*) > 1
+            )
+        ''')
+        cursor.execute('DELETE FROM identity_merge WHERE old_id = new_id')
+        cursor.execute('SELECT COUNT(*) FROM identity_merge')
+        duplicate_count = cursor.fetchone()[0]
+        
+        if duplicate_count:
+            logging.info(f"🔄 Merging {duplicate_count} duplicate synced_items rows")
+            cursor.execute('''
+                INSERT OR IGNORE INTO item_lists (item_id, list_type, list_id, synced_at)
+                SELECT m.new_id, il.list_type, il.list_id, il.synced_at
+                FROM item_lists il JOIN identity_merge m ON il.item_id = m.old_id
+            ''')
+            cursor.execute('DELETE FROM item_lists WHERE item_id IN (SELECT old_id FROM identity_merge)')
+            cursor.execute('''
+                UPDATE sync_items
+                SET item_id = (SELECT new_id FROM identity_merge WHERE old_id = sync_items.item_id)
+                WHERE item_id IN (SELECT old_id FROM identity_merge)
+            ''')
+            cursor.execute('DELETE FROM synced_items WHERE id IN (SELECT old_id FROM identity_merge)')
+        cursor.execute('DROP TABLE identity_merge')
+        
+        cursor.execute('CREATE UNIQUE INDEX IF NOT EXISTS ux_synced_items_identity ON synced_items(identity_key)')
+        # Per-item lookups in save_sync_result and the resync window check in should_sync_item
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_synced_items_overseerr
+            ON synced_items(overseerr_id, last_synced) WHERE overseerr_id IS NOT NULL
+        ''')
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_synced_items_imdb
+            ON synced_items(imdb_id) WHERE imdb_id IS NOT NULL
+        ''')
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_synced_items_tmdb
+            ON synced_items(tmdb_id) WHERE tmdb_id IS NOT NULL
+        ''')
+        # Covering index for get_sync_stats (time window, grouped by status)
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_synced_items_last_synced_status ON synced_items(last_synced, status)')
+        # Status filters on the item endpoints
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_synced_items_status ON synced_items(status, last_synced)')
+        
+        cursor.execute('ANALYZE synced_items')
+
+
+# Status priority used to pick the item shown for duplicate titles (higher wins)
+STATUS_PRIORITY = {
+    'requested': 100,
+    'already_requested': 90,
+    'already_available': 80,
+    'available': 70,
+    'not_found': 20,
+    'error': 10,
+    'skipped': 5,
+}
+
+_STATUS_PRIORITY_SQL = "CASE status " + " ".join(
+    f"WHEN '{status}' THEN {priority}" for status, priority in STATUS_PRIORITY.items()
+) + " ELSE 0 END"
+
+# Winner of a dedup group: highest status priority, then rows with an Overseerr ID,
+# then the most recently synced, then the oldest row
+_UNIQUE_ITEM_ORDER_SQL = f"{_STATUS_PRIORITY_SQL} DESC, (overseerr_id IS NOT NULL) DESC, last_synced DESC, id ASC"
+
+_UNIQUE_ITEM_COLUMNS = "title, media_type, year, imdb_id, overseerr_id, status, last_synced, source_list_type, source_list_id"
+
+
+def make_dedup_key(title: str, media_type: str) -> str:
+    """Build the key that groups duplicate items shown once in the UI (title and media type)"""
+    return f"{title}_{media_type}".lower().strip()
+
+
+def _refresh_unique_item_sql(key_ref: str) -> str:
+    """SQL that recomputes one unique_items row from synced_items (key_ref is NEW.dedup_key or OLD.dedup_key)"""
+    return f'''
+        DELETE FROM unique_items WHERE dedup_key = {key_ref};
+        INSERT INTO unique_items (dedup_key, item_id, {_UNIQUE_ITEM_COLUMNS})
+        SELECT dedup_key, id, {_UNIQUE_ITEM_COLUMNS} FROM synced_items
+        WHERE dedup_key = {key_ref}
+        ORDER BY {_UNIQUE_ITEM_ORDER_SQL}
+        LIMIT 1;
+    '''
+
+
+def _migrate_unique_items():
+    """
+    Migration 3: materialized unique_items table.
+    
+    unique_items holds one row per title/media type with the synced_items row
+    that wins the status-priority rules. Triggers on synced_items recompute
+    the affected group on every insert, update and delete, so readers get
+    deduplicated items with an indexed query.
+    """
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        
+        try:
+            cursor.execute('ALTER TABLE synced_items ADD COLUMN dedup_key TEXT')
+            logging.info("Added dedup_key column to synced_items table")
+        except sqlite3.OperationalError:
+            pass
+        
+        # Backfill in Python so keys match make_dedup_key exactly (SQLite lower() is ASCII-only)
+        cursor.execute('SELECT id, title, media_type FROM synced_items WHERE dedup_key IS NULL')
+        cursor.executemany(
+            'UPDATE synced_items SET dedup_key = ? WHERE id = ?',
+            [(make_dedup_key(title or '', media_type or ''), item_id) for item_id, title, media_type in cursor.fetchall()]
+        )
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_synced_items_dedup_key ON synced_items(dedup_key)')
+        
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS unique_items (
+                dedup_key TEXT PRIMARY KEY,
+                item_id INTEGER NOT NULL,
+                title TEXT NOT NULL,
+                media_type TEXT NOT NULL,
+                year INTEGER,
+                imdb_id TEXT,
+                overseerr_id INTEGER,
+                status TEXT,
+                last_synced TIMESTAMP,
+                source_list_type TEXT,
+                source_list_id TEXT
+            )
+        ''')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_unique_items_status ON unique_items(status)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_unique_items_last_synced ON unique_items(last_synced DESC, item_id DESC)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_unique_items_source ON unique_items(source_list_type, source_list_id)')
+        
+        cursor.executescript(f'''
+            DROP TRIGGER IF EXISTS trg_synced_items_unique_insert;
+            DROP TRIGGER IF EXISTS trg_synced_items_unique_update;
+            DROP TRIGGER IF EXISTS trg_synced_items_unique_delete;
+            
+            CREATE TRIGGER trg_synced_items_unique_insert AFTER INSERT ON synced_items
+            BEGIN
+                {_refresh_unique_item_sql("NEW.dedup_key")}
+            END;
+            
+            CREATE TRIGGER trg_synced_items_unique_update
+            AFTER UPDATE OF {_UNIQUE_ITEM_COLUMNS}, dedup_key ON synced_items
+            BEGIN
+                {_refresh_unique_item_sql("OLD.dedup_key")}
+                {_refresh_unique_item_sql("NEW.dedup_key")}
+            END;
+            
+            CREATE TRIGGER trg_synced_items_unique_delete AFTER DELETE ON synced_items
+            BEGIN
+                {_refresh_unique_item_sql("OLD.dedup_key")}
+            END;
+        ''')
+        
+        # Full rebuild from the current history
+        cursor.execute('DELETE FROM unique_items')
+        cursor.execute(f'''
+            INSERT INTO unique_items (dedup_key, item_id, {_UNIQUE_ITEM_COLUMNS})
+            SELECT dedup_key, id, {_UNIQUE_ITEM_COLUMNS} FROM (
+                SELECT *, ROW_NUMBER() OVER (PARTITION BY dedup_key ORDER BY {_UNIQUE_ITEM_ORDER_SQL}) AS rank
+                FROM synced_items
+                WHERE dedup_key IS NOT NULL
+            )
+            WHERE rank = 1
+        ''')
+        conn.commit()
+
+
+def _migrate_unique_items_keyset_index():
+    """
+    Migration 4: source-list index on unique_items that also covers the page order.
+    
+    Lets a list_source filtered page seek straight to its cursor instead of
+    sorting every item of the list.
+    """
+    with get_connection() as conn:
+        conn.execute('DROP INDEX IF EXISTS idx_unique_items_source')
+        conn.execute('''
+            CREATE INDEX IF NOT EXISTS idx_unique_items_source_synced
+            ON unique_items(source_list_type, source_list_id, last_synced DESC, item_id DESC)
+        ''')
+
+
+# Dimensions of status_counters; NULLs are stored as '' so they can be part of the primary key
+_COUNTER_DIMENSIONS = ("status", "media_type", "source_list_type", "source_list_id")
+
+# Hour bucket of a timestamp in sync_status_counters
+_HOUR_BUCKET_SQL = "strftime('%Y-%m-%d %H:00:00', {})"
+
+# Hour buckets older than this are dropped by reconcile_status_counters
+COUNTER_WINDOW_DAYS = 7
+
+
+def _status_counter_delta_sql(ref: str, delta: int) -> str:
+    """SQL adding delta to the status_counters row of a unique_items row (ref is NEW or OLD)"""
+    columns = ", ".join(_COUNTER_DIMENSIONS)
+    values = ", ".join(f"COALESCE({ref}.{column}, '')" for column in _COUNTER_DIMENSIONS)
+    return f"""
+        INSERT INTO status_counters ({columns}, count) VALUES ({values}, {delta})
+        ON CONFLICT({columns}) DO UPDATE SET count = count + {delta};
+    """
+
+
+def _sync_counter_delta_sql(ref: str, delta: int) -> str:
+    """SQL adding delta to the sync_status_counters row of a synced_items row (ref is NEW or OLD)"""
+    bucket = _HOUR_BUCKET_SQL.format(f"{ref}.last_synced")
+    return f"""
+        INSERT INTO sync_status_counters (hour, status, count)
+        VALUES (COALESCE({bucket}, ''), COALESCE({ref}.status, ''), {delta})
+        ON CONFLICT(hour, status) DO UPDATE SET count = count + {delta};
+    """
+
+
+def _migrate_status_counters():
+    """
+    Migration 5: precomputed status counters.
+    
+    status_counters counts unique_items per status, media type and source
+    list; sync_status_counters counts synced_items per hour of last_synced and
+    status. Triggers keep both current inside the writing transaction, so
+    dashboard stats read a few counter rows instead of grouping every item.
+    """
+    columns = ", ".join(_COUNTER_DIMENSIONS)
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute(f"""
+            CREATE TABLE IF NOT EXISTS status_counters (
+                status TEXT NOT NULL,
+                media_type TEXT NOT NULL,
+                source_list_type TEXT NOT NULL,
+                source_list_id TEXT NOT NULL,
+                count INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY ({columns})
+            )
+        """)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS sync_status_counters (
+                hour TEXT NOT NULL,
+                status TEXT NOT NULL,
+                count INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (hour, status)
+            )
+        """)
+        
+        # unique_items rows are only ever deleted and re-inserted by the refresh triggers
+        cursor.executescript(f"""
+            DROP TRIGGER IF EXISTS trg_unique_items_counter_insert;
+            DROP TRIGGER IF EXISTS trg_unique_items_counter_delete;
+            DROP TRIGGER IF EXISTS trg_synced_items_counter_insert;
+            DROP TRIGGER IF EXISTS trg_synced_items_counter_update;
+            DROP TRIGGER IF EXISTS trg_synced_items_counter_delete;
+            
+            CREATE TRIGGER trg_unique_items_counter_insert AFTER INSERT ON unique_items
+            BEGIN
+                {_status_counter_delta_sql("NEW", 1)}
+            END;
+            
+            CREATE TRIGGER trg_unique_items_counter_delete AFTER DELETE ON unique_items
+            BEGIN
+                {_status_counter_delta_sql("OLD", -1)}
+            END;
+            
+            CREATE TRIGGER trg_synced_items_counter_insert AFTER INSERT ON synced_items
+            BEGIN
+                {_sync_counter_delta_sql("NEW", 1)}
+            END;
+            
+            CREATE TRIGGER trg_synced_items_counter_update AFTER UPDATE OF status, last_synced ON synced_items
+            BEGIN
+                {_sync_counter_delta_sql("OLD", -1)}
+                {_sync_counter_delta_sql("NEW", 1)}
+            END;
+            
+            CREATE TRIGGER trg_synced_items_counter_delete AFTER DELETE ON synced_items
+            BEGIN
+                {_sync_counter_delta_sql("OLD", -1)}
+            END;
+        """)
+    
+    reconcile_status_counters()
+
+
+def _migrate_sync_item_rollups():
+    """
+    Migration 6: per-session rollups of archived sync_items.
+    
+    Keeps item counts by status, media type and list for sessions whose
+    sync_items detail rows were moved to the archive by the retention job.
+    """
+    with get_connection() as conn:
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS sync_item_rollups (
+                sync_id INTEGER NOT NULL,
+                status TEXT NOT NULL,
+                media_type TEXT NOT NULL,
+                list_type TEXT NOT NULL,
+                list_id TEXT NOT NULL,
+                count INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (sync_id, status, media_type, list_type, list_id),
+                FOREIGN KEY (sync_id) REFERENCES sync_history(id) ON DELETE CASCADE
+            )
+        ''')
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_sync_history_pruning ON sync_history(in_progress, start_time)')
+
+
+# Databases up to this many pages are switched to incremental auto-vacuum by migration 7;
+# larger ones are rebuilt later, between syncs, by the idle maintenance job
+AUTO_VACUUM_MIGRATION_MAX_PAGES = 2048
+
+
+def enable_incremental_auto_vacuum() -> bool:
+    """
+    Switch the database to auto_vacuum=INCREMENTAL.
+    
+    The mode only takes effect after a full VACUUM, which rewrites the whole
+    database file once and blocks other connections until it finishes.
+    Afterwards free pages are released in small steps by the retention job.
+    
+    Returns:
+        bool: True if the database was rebuilt, False if it was already incremental
+    """
+    with get_connection() as conn:
+        if conn.execute('PRAGMA auto_vacuum').fetchone()[0] == 2:
+            return False
+        page_count = conn.execute('PRAGMA page_count').fetchone()[0]
+        page_size = conn.execute('PRAGMA page_size').fetchone()[0]
+        logging.info(
+            f"Rebuilding database ({page_count * page_size / 1024 / 1024:.1f} MB) to enable "
+            f"incremental auto-vacuum; this runs once and may take a while"
+        )
+        conn.execute('PRAGMA auto_vacuum = INCREMENTAL')
+        conn.execute('VACUUM')
+    return True
+
+
+def _migrate_incremental_auto_vacuum():
+    """
+    Migration 7: switch the database to auto_vacuum=INCREMENTAL.
+    
+    New and small databases are rebuilt right away. A larger database would
+    block startup for the whole rebuild, so it is left to the idle maintenance
+    job, which runs the one-time rebuild when no sync is in progress.
+    """
+    with get_connection() as conn:
+        if conn.execute('PRAGMA auto_vacuum').fetchone()[0] == 2:
+            return
+        page_count = conn.execute('PRAGMA page_count').fetchone()[0]
+    
+    if page_count <= AUTO_VACUUM_MIGRATION_MAX_PAGES:
+        enable_incremental_auto_vacuum()
+    else:
+        logging.info("Incremental auto-vacuum will be enabled by a one-time database rebuild between syncs")
+
+
+# Ordered schema migrations: (version, description, step). Steps must be idempotent so a
+# step interrupted part-way (or raced by another process starting up) can simply run again.
+MIGRATIONS = [
+    (1, "baseline schema", _migrate_baseline_schema),
+    (2, "synced_items identity key and indexes", _migrate_synced_items_identity),
+    (3, "materialized unique_items", _migrate_unique_items),
+    (4, "unique_items keyset index", _migrate_unique_items_keyset_index),
+    (5, "status counters", _migrate_status_counters),
+    (6, "sync item rollups", _migrate_sync_item_rollups),
+    (7, "incremental auto-vacuum", _migrate_incremental_auto_vacuum),
+]
+
+
+def get_schema_version() -> int:
+    """
+    Get the schema version of the database.
+    
+    Returns:
+        int: Highest applied migration, or 0 for a new or pre-versioning database
+    """
+    with get_connection() as conn:
+        try:
+            result = conn.execute('SELECT MAX(version) FROM schema_version').fetchone()
+        except sqlite3.OperationalError:
+            # schema_version does not exist yet
+            return 0
+        return result[0] or 0
+
+
+def init_database():
+    """
+    Initialize the SQLite database, applying any pending schema migrations.
+    
+    When the schema is current this is a single version read.
+    """
+    current_version = get_schema_version()
+    latest_version = MIGRATIONS[-1][0]
+    if current_version >= latest_version:
+        logging.debug(f"Database schema is current (version {current_version})")
+        return
+    
+    logging.info(f"Migrating database schema from version {current_version} to {latest_version}")
+    with get_connection() as conn:
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS schema_version (
+                version INTEGER PRIMARY KEY,
+                description TEXT NOT NULL,
+                applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                duration_ms REAL
+            )
+        ''')
+    
+    for version, description, step in MIGRATIONS:
+        if version <= current_version:
+            continue
+        
+        started = time.perf_counter()
+        step()
+        duration_ms = (time.perf_counter() - started) * 1000
+        
+        with get_connection() as conn:
+            conn.execute(
+                'INSERT OR REPLACE INTO schema_version (version, description, duration_ms) VALUES (?, ?, ?)',
+                (version, description, duration_ms)
+            )
+        logging.info(f"Applied schema migration {version} ({description}) in {duration_ms:.0f} ms")
+
+
 def save_list_id(list_id: str, list_type: str, list_url: Optional[str] = None, item_count: Optional[int] = None, user_id: str = "1"):
     """Save list ID, URL, item count, and user_id to database, converting URLs to IDs if needed."""
     from .utils.helpers import construct_list_url
     
-    with sqlite3.connect(DB_FILE) as conn:
+    with get_connection() as conn:
         cursor = conn.cursor()
         
         # For IMDb URLs, store the full URL
@@ -495,7 +1017,7 @@ def save_list_id(list_id: str, list_type: str, list_url: Optional[str] = None, i
 
 def update_list_item_count(list_type: str, list_id: str, item_count: int):
     """Update the item count for an existing list."""
-    with sqlite3.connect(DB_FILE) as conn:
+    with get_connection() as conn:
         cursor = conn.cursor()
         cursor.execute(
             "UPDATE lists SET item_count = ? WHERE list_type = ? AND list_id = ?",
@@ -506,7 +1028,7 @@ def update_list_item_count(list_type: str, list_id: str, item_count: int):
 
 def update_list_last_synced(list_type: str, list_id: str):
     """Update the last_synced timestamp for a list to the current time."""
-    with sqlite3.connect(DB_FILE) as conn:
+    with get_connection() as conn:
         cursor = conn.cursor()
         cursor.execute(
             "UPDATE lists SET last_synced = CURRENT_TIMESTAMP WHERE list_type = ? AND list_id = ?",
@@ -517,7 +1039,7 @@ def update_list_last_synced(list_type: str, list_id: str):
 
 def update_list_sync_info(list_type: str, list_id: str, item_count: int):
     """Update both item count and last_synced timestamp for a list."""
-    with sqlite3.connect(DB_FILE) as conn:
+    with get_connection() as conn:
         cursor = conn.cursor()
         cursor.execute(
             "UPDATE lists SET item_count = ?, last_synced = CURRENT_TIMESTAMP WHERE list_type = ? AND list_id = ?",
@@ -528,7 +1050,7 @@ def update_list_sync_info(list_type: str, list_id: str, item_count: int):
 
 def load_list_ids() -> List[Dict[str, str]]:
     """Load all saved list IDs from database."""
-    with sqlite3.connect(DB_FILE) as conn:
+    with get_connection() as conn:
         cursor = conn.cursor()
         cursor.execute("SELECT list_type, list_id, list_url, item_count, last_synced, user_id FROM lists")
         results = []
@@ -567,7 +1089,7 @@ def load_list_ids() -> List[Dict[str, str]]:
 def delete_list(list_type: str, list_id: str) -> bool:
     """Delete a list from the database."""
     try:
-        with sqlite3.connect(DB_FILE) as conn:
+        with get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 "DELETE FROM lists WHERE list_type = ? AND list_id = ?",
@@ -582,7 +1104,7 @@ def delete_list(list_type: str, list_id: str) -> bool:
 
 def configure_sync_interval(interval_hours: float):
     """Configure the sync interval in hours (can be decimal like 0.5 for 30 minutes)."""
-    with sqlite3.connect(DB_FILE) as conn:
+    with get_connection() as conn:
         cursor = conn.cursor()
         cursor.execute("DELETE FROM sync_interval")
         cursor.execute("INSERT INTO sync_interval (interval_hours) VALUES (?)", (interval_hours,))
@@ -591,7 +1113,7 @@ def configure_sync_interval(interval_hours: float):
 
 def load_sync_interval() -> float:
     """Load the configured sync interval."""
-    with sqlite3.connect(DB_FILE) as conn:
+    with get_connection() as conn:
         cursor = conn.cursor()
         cursor.execute("SELECT interval_hours FROM sync_interval")
         result = cursor.fetchone()
@@ -600,7 +1122,7 @@ def load_sync_interval() -> float:
 
 def should_sync_item(overseerr_id: int) -> bool:
     """Check if an item should be synced based on last sync time."""
-    with sqlite3.connect(DB_FILE) as conn:
+    with get_connection() as conn:
         cursor = conn.cursor()
         cursor.execute('''
             SELECT last_synced FROM synced_items
@@ -611,6 +1133,28 @@ def should_sync_item(overseerr_id: int) -> bool:
         return result is None
 
 
+# Upsert keyed on the unique identity key; skipped results keep the previous last_synced
+# (and Overseerr ID) so skipping an item does not restart its 48-hour resync window
+_UPSERT_SYNCED_ITEM_SQL = '''
+    INSERT INTO synced_items
+    (title, media_type, year, imdb_id, tmdb_id, overseerr_id, status, last_synced, source_list_type, source_list_id, identity_key, dedup_key)
+    VALUES (?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP, ?, ?, ?, ?)
+    ON CONFLICT(identity_key) DO UPDATE SET
+        title = excluded.title,
+        dedup_key = excluded.dedup_key,
+        media_type = excluded.media_type,
+        year = excluded.year,
+        imdb_id = excluded.imdb_id,
+        tmdb_id = excluded.tmdb_id,
+        overseerr_id = CASE WHEN excluded.status = 'skipped' THEN synced_items.overseerr_id ELSE excluded.overseerr_id END,
+        status = excluded.status,
+        last_synced = CASE WHEN excluded.status = 'skipped' THEN synced_items.last_synced ELSE excluded.last_synced END,
+        source_list_type = excluded.source_list_type,
+        source_list_id = excluded.source_list_id
+    RETURNING id
+'''
+
+
 def save_sync_result(title: str, media_type: str, imdb_id: Optional[str], overseerr_id: Optional[int], status: str, year: Optional[int] = None, tmdb_id: Optional[str] = None, list_type: Optional[str] = None, list_id: Optional[str] = None):
     """
     Save the result of a sync operation and track which list(s) it came from.
@@ -625,83 +1169,164 @@ def save_sync_result(title: str, media_type: str, imdb_id: Optional[str], overse
         tmdb_id: TMDB ID
         list_type: Type of list this item came from (e.g., 'imdb', 'trakt')
         list_id: ID of the list this item came from
+    
+    Returns:
+        int: synced_items row ID
+    """
+    return save_sync_results([{
+        'title': title,
+        'media_type': media_type,
+        'imdb_id': imdb_id,
+        'overseerr_id': overseerr_id,
+        'status': status,
+        'year': year,
+        'tmdb_id': tmdb_id,
+        'list_type': list_type,
+        'list_id': list_id,
+    }])[0]
+
+
+def save_sync_results(results: List[Dict[str, Any]]) -> List[int]:
+    """
+    Save a batch of sync results in one transaction.
+    
+    Each result is written with a single UPSERT on the item's identity key
+    plus one INSERT OR IGNORE linking it to its source list. When an item now
+    has a stronger ID than before (e.g. a TMDB ID where only its IMDb ID was
+    known), the existing row's identity key is upgraded first so the UPSERT
+    updates that row instead of creating a second one; rows that would
+    collide on the upgraded key are merged into one. When it has a weaker
+    ID than its stored row (e.g. a not_found result without the TMDB ID), the
+    stored row's key is used instead.
+    
+    Args:
+        results: Dicts with the save_sync_result arguments (title, media_type, imdb_id,
+            overseerr_id, status and optionally year, tmdb_id, list_type, list_id)
+    
+    Returns:
+        List[int]: synced_items row IDs, in the same order as results
     """
-    with sqlite3.connect(DB_FILE) as conn:
+    item_ids = []
+    with get_connection() as conn:
         cursor = conn.cursor()
         
-        # Get or create the item record
-        # Try to find existing item by multiple possible keys (overseerr_id is most reliable)
-        item_db_id = None
-        
-        # Try overseerr_id first (most reliable)
-        if overseerr_id:
-            cursor.execute('SELECT id FROM synced_items WHERE overseerr_id = ?', (overseerr_id,))
-            existing = cursor.fetchone()
-            if existing:
-                item_db_id = existing[0]
-        
-        # If not found by overseerr_id, try imdb_id
-        if not item_db_id and imdb_id:
-            cursor.execute('SELECT id FROM synced_items WHERE imdb_id = ?', (imdb_id,))
-            existing = cursor.fetchone()
-            if existing:
-                item_db_id = existing[0]
-        
-        # If still not found, try tmdb_id
-        if not item_db_id and tmdb_id:
-            cursor.execute('SELECT id FROM synced_items WHERE tmdb_id = ?', (tmdb_id,))
-            existing = cursor.fetchone()
-            if existing:
-                item_db_id = existing[0]
-        
-        if status == "skipped":
-            # For skipped items, only insert if it doesn't exist (don't update last_synced)
-            if item_db_id:
-                # Item already exists, just update status if needed
-                cursor.execute('''
-                    UPDATE synced_items 
-                    SET status = ?, title = ?, media_type = ?, year = ?, imdb_id = ?, tmdb_id = ?,
-                        source_list_type = ?, source_list_id = ?
-                    WHERE id = ?
-                ''', (status, title, media_type, year, imdb_id, tmdb_id, list_type, list_id, item_db_id))
-            else:
-                # Insert new item
-                cursor.execute('''
-                    INSERT INTO synced_items 
-                    (title, media_type, year, imdb_id, tmdb_id, overseerr_id, status, last_synced, source_list_type, source_list_id)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP, ?, ?)
-                ''', (title, media_type, year, imdb_id, tmdb_id, overseerr_id, status, list_type, list_id))
-                item_db_id = cursor.lastrowid
-        else:
-            # For non-skipped items, update last_synced timestamp
-            if item_db_id:
-                # Update existing item
-                cursor.execute('''
-                    UPDATE synced_items 
-                    SET title = ?, media_type = ?, year = ?, imdb_id = ?, tmdb_id = ?, 
-                        overseerr_id = ?, status = ?, last_synced = CURRENT_TIMESTAMP,
-                        source_list_type = ?, source_list_id = ?
-                    WHERE id = ?
-                ''', (title, media_type, year, imdb_id, tmdb_id, overseerr_id, status, list_type, list_id, item_db_id))
-            else:
-                # Insert new item
+        for result in results:
+            title = result['title']
+            media_type = result['media_type']
+            imdb_id = result.get('imdb_id')
+            overseerr_id = result.get('overseerr_id')
+            tmdb_id = result.get('tmdb_id')
+            year = result.get('year')
+            list_type = result.get('list_type')
+            list_id = result.get('list_id')
+            identity_key = make_identity_key(media_type, overseerr_id, tmdb_id, imdb_id, title, year)
+            identity_key = _stored_identity_key(cursor, identity_key, imdb_id) or identity_key
+            
+            # Upgrade rows stored under a weaker key (IMDb ID or title) to this key
+            weaker_keys = _weaker_identity_keys(identity_key, media_type, imdb_id, title, year)
+            if weaker_keys:
+                _upgrade_identity_key(cursor, identity_key, weaker_keys)
+            
+            cursor.execute(_UPSERT_SYNCED_ITEM_SQL, (
+                title, media_type, year, imdb_id, tmdb_id, overseerr_id, result['status'],
+                list_type, list_id, identity_key, make_dedup_key(title, media_type)
+            ))
+            item_db_id = cursor.fetchone()[0]
+            
+            # Link item to list(s) if list information provided
+            if list_type and list_id:
                 cursor.execute('''
-                    INSERT INTO synced_items 
-                    (title, media_type, year, imdb_id, tmdb_id, overseerr_id, status, last_synced, source_list_type, source_list_id)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP, ?, ?)
-                ''', (title, media_type, year, imdb_id, tmdb_id, overseerr_id, status, list_type, list_id))
-                item_db_id = cursor.lastrowid
-        
-        # Link item to list(s) if list information provided
-        if item_db_id and list_type and list_id:
-            cursor.execute('''
-                INSERT OR IGNORE INTO item_lists (item_id, list_type, list_id, synced_at)
-                VALUES (?, ?, ?, CURRENT_TIMESTAMP)
-            ''', (item_db_id, list_type, list_id))
+                    INSERT OR IGNORE INTO item_lists (item_id, list_type, list_id, synced_at)
+                    VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+                ''', (item_db_id, list_type, list_id))
+            
+            item_ids.append(item_db_id)
         
         conn.commit()
-        
-        return item_db_id
+    
+    return item_ids
+
+
+def _stored_identity_key(cursor: sqlite3.Cursor, identity_key: str, imdb_id: Optional[str]) -> Optional[str]:
+    """Find the stronger (TMDB) identity key of a row already stored with this item's IMDb ID"""
+    if identity_key.startswith('tmdb:') or not imdb_id:
+        # Already the strongest key, or no ID to match a stored row on
+        return None
+    row = cursor.execute('''
+        SELECT identity_key FROM synced_items
+        WHERE imdb_id = ? AND identity_key LIKE 'tmdb:%'
+        ORDER BY last_synced DESC
+        LIMIT 1
+    ''', (imdb_id,)).fetchone()
+    return row[0] if row else None
+
+
+def _weaker_identity_keys(identity_key: str, media_type: str, imdb_id: Optional[str], title: str, year: Optional[int]) -> List[str]:
+    """List the keys this item may have been stored under before a stronger ID was known"""
+    keys = []
+    if imdb_id and not identity_key.startswith('imdb:'):
+        keys.append(f"imdb:{imdb_id}")
+    if not identity_key.startswith('title:'):
+        keys.append(make_identity_key(media_type, None, None, None, title, year))
+    return keys
+
+
+def _upgrade_identity_key(cursor: sqlite3.Cursor, identity_key: str, weaker_keys: List[str]) -> None:
+    """
+    Move rows stored under weaker identity keys to a stronger key.
+    
+    When no row has the stronger key yet, the most recently synced weaker row
+    takes it over. Any other weaker rows are duplicates of the same item: their
+    list links and sync history move to the surviving row and they are deleted.
+    
+    Args:
+        cursor: Cursor of the caller's transaction
+        identity_key: Stronger identity key of the item
+        weaker_keys: Keys the item may have been stored under before
+    """
+    placeholders = ','.join('?' * len(weaker_keys))
+    weaker_ids = [row[0] for row in cursor.execute(f'''
+        SELECT id FROM synced_items
+        WHERE identity_key IN ({placeholders})
+        ORDER BY last_synced DESC, id DESC
+    ''', weaker_keys)]
+    if not weaker_ids:
+        return
+    
+    row = cursor.execute('SELECT id FROM synced_items WHERE identity_key = ?', (identity_key,)).fetchone()
+    if row:
+        survivor_id, duplicate_ids = row[0], weaker_ids
+    else:
+        survivor_id, duplicate_ids = weaker_ids[0], weaker_ids[1:]
+        cursor.execute('UPDATE synced_items SET identity_key = ? WHERE id = ?', (identity_key, survivor_id))
+    if not duplicate_ids:
+        return
+    
+    placeholders = ','.join('?' * len(duplicate_ids))
+    cursor.execute(f'''
+        INSERT OR IGNORE INTO item_lists (item_id, list_type, list_id, synced_at)
+        SELECT ?, list_type, list_id, synced_at FROM item_lists WHERE item_id IN ({placeholders})
+    ''', (survivor_id, *duplicate_ids))
+    cursor.execute(f'DELETE FROM item_lists WHERE item_id IN ({placeholders})', duplicate_ids)
+    cursor.execute(f'UPDATE sync_items SET item_id = ? WHERE item_id IN ({placeholders})', (survivor_id, *duplicate_ids))
+    cursor.execute(f'DELETE FROM synced_items WHERE id IN ({placeholders})', duplicate_ids)
+    logging.debug(f"Merged {len(duplicate_ids)} duplicate synced item(s) into {identity_key}")
+
+
+def link_item_to_list(item_id: int, list_type: str, list_id: str) -> None:
+    """
+    Record that a synced item also appears in a list.
+    
+    Args:
+        item_id: synced_items row ID
+        list_type: Type of the list (e.g., 'imdb', 'trakt')
+        list_id: ID of the list
+    """
+    with get_connection() as conn:
+        conn.execute('''
+            INSERT OR IGNORE INTO item_lists (item_id, list_type, list_id, synced_at)
+            VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+        ''', (item_id, list_type, list_id))
 
 
 def get_item_lists(item_id: int) -> List[Dict[str, str]]:
@@ -714,7 +1339,7 @@ def get_item_lists(item_id: int) -> List[Dict[str, str]]:
     Returns:
         List of dictionaries with 'type' and 'id' keys for each list
     """
-    with sqlite3.connect(DB_FILE) as conn:
+    with get_connection() as conn:
         cursor = conn.cursor()
         cursor.execute('''
             SELECT list_type, list_id 
@@ -738,7 +1363,7 @@ def get_list_items(list_type: str, list_id: str) -> List[Dict[str, Any]]:
     Returns:
         List of item dictionaries with all item information
     """
-    with sqlite3.connect(DB_FILE) as conn:
+    with get_connection() as conn:
         cursor = conn.cursor()
         cursor.execute('''
             SELECT si.id, si.title, si.media_type, si.year, si.imdb_id, si.tmdb_id, 
@@ -766,26 +1391,264 @@ def get_list_items(list_type: str, list_id: str) -> List[Dict[str, Any]]:
 
 def clear_all_lists():
     """Clear all lists from the database."""
-    with sqlite3.connect(DB_FILE) as conn:
+    with get_connection() as conn:
         cursor = conn.cursor()
         cursor.execute("DELETE FROM lists")
         conn.commit()
 
 
 def get_sync_stats() -> Dict[str, int]:
-    """Get sync statistics from the database."""
-    with sqlite3.connect(DB_FILE) as conn:
+    """
+    Get sync statistics for the last 7 days (to the hour) from the sync status counters.
+    
+    Returns:
+        Dict[str, int]: {status: number of items synced}
+    """
+    with get_connection() as conn:
         cursor = conn.cursor()
-        cursor.execute('''
-            SELECT status, COUNT(*) 
-            FROM synced_items 
-            WHERE last_synced > datetime('now', '-7 days') 
+        cursor.execute(f'''
+            SELECT status, SUM(count)
+            FROM sync_status_counters
+            WHERE hour >= {_HOUR_BUCKET_SQL.format("datetime('now', '-7 days')")}
             GROUP BY status
+            HAVING SUM(count) > 0
         ''')
         stats = dict(cursor.fetchall())
         return stats
 
 
+def _unique_items_filter(list_type: Optional[str], list_ids: Optional[List[str]], *extra: str) -> tuple:
+    """Build the WHERE clause and parameters for a source-list filter on unique_items, plus extra conditions"""
+    conditions = list(extra)
+    params = []
+    if list_type:
+        ids = list(dict.fromkeys(list_ids or []))
+        conditions.insert(0, f"source_list_type = ? AND source_list_id IN ({','.join('?' * len(ids))})")
+        params = [list_type, *ids]
+    return (f"WHERE {' AND '.join(conditions)}" if conditions else ""), params
+
+
+def get_unique_items(limit: Optional[int] = None, offset: int = 0, list_type: Optional[str] = None, list_ids: Optional[List[str]] = None) -> List[tuple]:
+    """
+    Get deduplicated items (one per title and media type), most recently synced first.
+    
+    Args:
+        limit: Maximum number of items, or None for all
+        offset: Number of items to skip
+        list_type: Only items whose source list has this type
+        list_ids: Accepted source list IDs when filtering by list_type
+    
+    Returns:
+        List[tuple]: (id, title, media_type, year, imdb_id, overseerr_id, status, last_synced,
+            source_list_type, source_list_id) rows
+    """
+    where, params = _unique_items_filter(list_type, list_ids)
+    sql = f'''
+        SELECT item_id, {_UNIQUE_ITEM_COLUMNS} FROM unique_items
+        {where}
+        ORDER BY last_synced DESC, item_id DESC
+    '''
+    if limit is not None:
+        sql += ' LIMIT ? OFFSET ?'
+        params += [limit, offset]
+    with get_connection() as conn:
+        return conn.execute(sql, params).fetchall()
+
+
+def encode_item_cursor(last_synced: Optional[str], item_id: int) -> str:
+    """
+    Build the opaque cursor pointing after an item in get_unique_items_after order.
+    
+    Args:
+        last_synced: Last synced timestamp of the item
+        item_id: synced_items ID of the item
+    
+    Returns:
+        str: URL-safe cursor
+    """
+    payload = json.dumps([last_synced, item_id], separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip('=')
+
+
+def decode_item_cursor(cursor: str) -> Tuple[Optional[str], int]:
+    """
+    Decode a cursor from encode_item_cursor.
+    
+    Args:
+        cursor: Cursor string
+    
+    Returns:
+        Tuple[Optional[str], int]: (last_synced, item_id)
+    
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        last_synced, item_id = json.loads(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)))
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+    if not isinstance(item_id, int) or not (last_synced is None or isinstance(last_synced, str)):
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return last_synced, item_id
+
+
+def get_unique_items_after(cursor: Optional[str] = None, limit: int = 50, list_type: Optional[str] = None, list_ids: Optional[List[str]] = None) -> Tuple[List[tuple], Optional[str]]:
+    """
+    Get one page of deduplicated items with keyset pagination.
+    
+    Items are ordered like get_unique_items (most recently synced first, never
+    synced last). Each page is an index range seek from the cursor, so a deep
+    page costs the same as the first one.
+    
+    Args:
+        cursor: Cursor returned with the previous page, or None for the first page
+        limit: Maximum number of items
+        list_type: Only items whose source list has this type
+        list_ids: Accepted source list IDs when filtering by list_type
+    
+    Returns:
+        Tuple[List[tuple], Optional[str]]: get_unique_items rows and the cursor for the
+            next page (None on the last page)
+    
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    after_synced, after_id = decode_item_cursor(cursor) if cursor else (None, None)
+    rows = []
+    
+    with get_connection() as conn:
+        # Rows with a sync time, from (last_synced, item_id) downwards
+        if after_id is None or after_synced is not None:
+            extra = ['last_synced IS NOT NULL']
+            if after_id is not None:
+                extra.append('(last_synced, item_id) < (?, ?)')
+            where, params = _unique_items_filter(list_type, list_ids, *extra)
+            if after_id is not None:
+                params += [after_synced, after_id]
+            rows = conn.execute(f'''
+                SELECT item_id, {_UNIQUE_ITEM_COLUMNS} FROM unique_items
+                {where}
+                ORDER BY last_synced DESC, item_id DESC
+                LIMIT ?
+            ''', params + [limit + 1]).fetchall()
+        
+        # Then rows that were never synced, which sort last
+        if len(rows) <= limit:
+            extra = ['last_synced IS NULL']
+            if after_id is not None and after_synced is None:
+                extra.append('item_id < ?')
+            where, params = _unique_items_filter(list_type, list_ids, *extra)
+            if after_id is not None and after_synced is None:
+                params.append(after_id)
+            rows += conn.execute(f'''
+                SELECT item_id, {_UNIQUE_ITEM_COLUMNS} FROM unique_items
+                {where}
+                ORDER BY item_id DESC
+                LIMIT ?
+            ''', params + [limit + 1 - len(rows)]).fetchall()
+    
+    if len(rows) <= limit:
+        return rows, None
+    last = rows[limit - 1]
+    return rows[:limit], encode_item_cursor(last[7], last[0])
+
+
+def count_unique_items(list_type: Optional[str] = None, list_ids: Optional[List[str]] = None) -> int:
+    """
+    Count deduplicated items.
+    
+    Args:
+        list_type: Only items whose source list has this type
+        list_ids: Accepted source list IDs when filtering by list_type
+    
+    Returns:
+        int: Number of unique items
+    """
+    return sum(get_unique_status_counts(list_type=list_type, list_ids=list_ids).values())
+
+
+def get_unique_status_counts(media_type: Optional[str] = None, list_type: Optional[str] = None, list_ids: Optional[List[str]] = None) -> Dict[str, int]:
+    """
+    Count deduplicated items by status, from the status counters.
+    
+    Args:
+        media_type: Only items of this media type
+        list_type: Only items whose source list has this type
+        list_ids: Accepted source list IDs when filtering by list_type
+    
+    Returns:
+        Dict[str, int]: {status: count}
+    """
+    where, params = _unique_items_filter(list_type, list_ids, *(['media_type = ?'] if media_type else []))
+    if media_type:
+        params.append(media_type)
+    with get_connection() as conn:
+        rows = conn.execute(f'''
+            SELECT status, SUM(count) FROM status_counters
+            {where}
+            GROUP BY status
+            HAVING SUM(count) > 0
+        ''', params).fetchall()
+    return {status or None: count for status, count in rows}
+
+
+def reconcile_status_counters() -> int:
+    """
+    Rebuild the status counters from unique_items and synced_items.
+    
+    The triggers keep the counters exact, so this only repairs drift (e.g. rows
+    changed with the triggers disabled) and drops hour buckets that have left
+    the stats window. Runs in one write transaction.
+    
+    Returns:
+        int: Number of counter rows that were wrong before the rebuild
+    """
+    columns = ", ".join(_COUNTER_DIMENSIONS)
+    grouped = ", ".join(f"COALESCE({column}, '')" for column in _COUNTER_DIMENSIONS)
+    hour = _HOUR_BUCKET_SQL.format("last_synced")
+    cutoff = _HOUR_BUCKET_SQL.format(f"datetime('now', '-{COUNTER_WINDOW_DAYS + 1} days')")
+    
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute('BEGIN IMMEDIATE')
+        
+        cursor.execute(f'SELECT {grouped}, COUNT(*) FROM unique_items GROUP BY {grouped}')
+        expected_status = {row[:-1]: row[-1] for row in cursor.fetchall()}
+        cursor.execute(f'''
+            SELECT {hour}, COALESCE(status, ''), COUNT(*) FROM synced_items
+            WHERE last_synced >= {cutoff}
+            GROUP BY 1, 2
+        ''')
+        expected_sync = {row[:-1]: row[-1] for row in cursor.fetchall()}
+        
+        cursor.execute(f'SELECT {columns}, count FROM status_counters WHERE count != 0')
+        actual_status = {row[:-1]: row[-1] for row in cursor.fetchall()}
+        cursor.execute(f'''
+            SELECT hour, status, count FROM sync_status_counters
+            WHERE count != 0 AND hour >= {cutoff}
+        ''')
+        actual_sync = {row[:-1]: row[-1] for row in cursor.fetchall()}
+        
+        drift = sum(
+            1 for expected, actual in ((expected_status, actual_status), (expected_sync, actual_sync))
+            for key in expected.keys() | actual.keys()
+            if expected.get(key) != actual.get(key)
+        )
+        
+        cursor.execute('DELETE FROM status_counters')
+        cursor.executemany(
+            f'INSERT INTO status_counters ({columns}, count) VALUES (?, ?, ?, ?, ?)',
+            [(*key, count) for key, count in expected_status.items()]
+        )
+        cursor.execute('DELETE FROM sync_status_counters')
+        cursor.executemany(
+            'INSERT INTO sync_status_counters (hour, status, count) VALUES (?, ?, ?)',
+            [(*key, count) for key, count in expected_sync.items()]
+        )
+    
+    return drift
+
+
 # ============================================================================
 # Sync History Management - Database-Based Sync Tracking
 # ============================================================================
@@ -811,7 +1674,7 @@ def start_sync_in_db(
         int: The sync_id (primary key) of the created sync record
     """
     import os
-    with sqlite3.connect(DB_FILE) as conn:
+    with get_connection() as conn:
         cursor = conn.cursor()
         cursor.execute('''
             INSERT INTO sync_history (
@@ -842,7 +1705,7 @@ def update_sync_lists_in_db(
     if not synced_lists:
         return False
     
-    with sqlite3.connect(DB_FILE) as conn:
+    with get_connection() as conn:
         cursor = conn.cursor()
         
         # For full syncs, store a summary of all lists synced
@@ -896,7 +1759,7 @@ def end_sync_in_db(
     Returns:
         bool: True if updated successfully
     """
-    with sqlite3.connect(DB_FILE) as conn:
+    with get_connection() as conn:
         cursor = conn.cursor()
         cursor.execute('''
             UPDATE sync_history
@@ -951,7 +1814,7 @@ def add_item_to_sync(
     Returns:
         int: The sync_items record ID
     """
-    with sqlite3.connect(DB_FILE) as conn:
+    with get_connection() as conn:
         cursor = conn.cursor()
         cursor.execute('''
             INSERT INTO sync_items (
@@ -972,7 +1835,7 @@ def get_current_sync_status() -> Optional[Dict[str, Any]]:
     Returns:
         dict: Current sync status or None if no sync in progress
     """
-    with sqlite3.connect(DB_FILE) as conn:
+    with get_connection() as conn:
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
         cursor.execute('''
@@ -998,7 +1861,7 @@ def get_sync_history(limit: int = 50, include_completed: bool = True) -> List[Di
     Returns:
         list: List of sync history records
     """
-    with sqlite3.connect(DB_FILE) as conn:
+    with get_connection() as conn:
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
         if include_completed:
@@ -1027,7 +1890,7 @@ def get_sync_items(sync_id: int) -> List[Dict[str, Any]]:
     Returns:
         list: List of sync items
     """
-    with sqlite3.connect(DB_FILE) as conn:
+    with get_connection() as conn:
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
         cursor.execute('''
@@ -1040,7 +1903,7 @@ def get_sync_items(sync_id: int) -> List[Dict[str, Any]]:
 
 def cleanup_old_sync_results(days: int = 30):
     """Clean up sync results older than specified days."""
-    with sqlite3.connect(DB_FILE) as conn:
+    with get_connection() as conn:
         cursor = conn.cursor()
         cursor.execute('''
             DELETE FROM synced_items 
@@ -1060,7 +1923,7 @@ def create_settings_tables():
     Create app_settings and setup_status tables for database-backed configuration.
     Called during database initialization.
     """
-    with sqlite3.connect(DB_FILE) as conn:
+    with get_connection() as conn:
         cursor = conn.cursor()
         
         # App settings table - stores all configuration
@@ -1095,6 +1958,35 @@ def create_settings_tables():
         logging.info("Configuration tables initialized")
 
 
+# Reserved app_settings row counting every settings change, so cached config knows when to reload
+SETTINGS_VERSION_KEY = '_settings_version'
+
+
+def _bump_settings_version(cursor):
+    """Increment the settings version counter inside the caller's transaction."""
+    cursor.execute('''
+        INSERT INTO app_settings (key, value, is_encrypted, setting_type, updated_at)
+        VALUES (?, '1', 0, 'integer', CURRENT_TIMESTAMP)
+        ON CONFLICT(key) DO UPDATE SET
+            value = CAST(value AS INTEGER) + 1,
+            updated_at = CURRENT_TIMESTAMP
+    ''', (SETTINGS_VERSION_KEY,))
+
+
+def get_settings_version() -> int:
+    """
+    Get the settings version counter.
+    
+    Returns:
+        int: Number of settings changes so far (0 if settings were never saved)
+    """
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute('SELECT value FROM app_settings WHERE key = ?', (SETTINGS_VERSION_KEY,))
+        result = cursor.fetchone()
+        return int(result[0]) if result else 0
+
+
 def save_setting(key: str, value: str, is_encrypted: bool = False, setting_type: str = 'string'):
     """
     Save a configuration setting to the database.
@@ -1105,13 +1997,14 @@ def save_setting(key: str, value: str, is_encrypted: bool = False, setting_type:
         is_encrypted: Whether the value is encrypted
         setting_type: Type of setting (string, boolean, integer, list)
     """
-    with sqlite3.connect(DB_FILE) as conn:
+    with get_connection() as conn:
         cursor = conn.cursor()
         cursor.execute('''
             INSERT OR REPLACE INTO app_settings 
             (key, value, is_encrypted, setting_type, updated_at)
             VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
         ''', (key, value, 1 if is_encrypted else 0, setting_type))
+        _bump_settings_version(cursor)
         conn.commit()
 
 
@@ -1125,7 +2018,7 @@ def get_setting(key: str) -> Optional[tuple]:
     Returns:
         tuple: (value, is_encrypted, setting_type) or None if not found
     """
-    with sqlite3.connect(DB_FILE) as conn:
+    with get_connection() as conn:
         cursor = conn.cursor()
         cursor.execute('''
             SELECT value, is_encrypted, setting_type
@@ -1143,27 +2036,29 @@ def get_all_settings() -> Dict[str, tuple]:
     Returns:
         dict: Dictionary of {key: (value, is_encrypted, setting_type)}
     """
-    with sqlite3.connect(DB_FILE) as conn:
+    with get_connection() as conn:
         cursor = conn.cursor()
         cursor.execute('''
             SELECT key, value, is_encrypted, setting_type
             FROM app_settings
-        ''')
+            WHERE key != ?
+        ''', (SETTINGS_VERSION_KEY,))
         results = cursor.fetchall()
         return {row[0]: (row[1], row[2], row[3]) for row in results}
 
 
 def delete_setting(key: str):
     """Delete a configuration setting from the database."""
-    with sqlite3.connect(DB_FILE) as conn:
+    with get_connection() as conn:
         cursor = conn.cursor()
         cursor.execute('DELETE FROM app_settings WHERE key = ?', (key,))
+        _bump_settings_version(cursor)
         conn.commit()
 
 
 def is_setup_completed() -> bool:
     """Check if the initial setup wizard has been completed."""
-    with sqlite3.connect(DB_FILE) as conn:
+    with get_connection() as conn:
         cursor = conn.cursor()
         cursor.execute('SELECT is_completed FROM setup_status WHERE id = 1')
         result = cursor.fetchone()
@@ -1172,7 +2067,7 @@ def is_setup_completed() -> bool:
 
 def mark_setup_complete():
     """Mark the initial setup wizard as completed."""
-    with sqlite3.connect(DB_FILE) as conn:
+    with get_connection() as conn:
         cursor = conn.cursor()
         cursor.execute('''
             UPDATE setup_status
@@ -1185,7 +2080,7 @@ def mark_setup_complete():
 
 def reset_setup_status():
     """Reset setup status (for testing/debugging)."""
-    with sqlite3.connect(DB_FILE) as conn:
+    with get_connection() as conn:
         cursor = conn.cursor()
         cursor.execute('''
             UPDATE setup_status
@@ -1197,9 +2092,9 @@ def reset_setup_status():
 
 def count_settings() -> int:
     """Count the number of settings in the database."""
-    with sqlite3.connect(DB_FILE) as conn:
+    with get_connection() as conn:
         cursor = conn.cursor()
-        cursor.execute('SELECT COUNT(*) FROM app_settings')
+        cursor.execute('SELECT COUNT(*) FROM app_settings WHERE key != ?', (SETTINGS_VERSION_KEY,))
         result = cursor.fetchone()
         return result[0] if result else 0
 
@@ -1215,7 +2110,7 @@ def save_overseerr_users(users: List[Dict[str, Any]]):
     Args:
         users: List of user dictionaries with keys: id, display_name, email, avatar
     """
-    with sqlite3.connect(DB_FILE) as conn:
+    with get_connection() as conn:
         cursor = conn.cursor()
         
         # Clear existing users
@@ -1244,7 +2139,7 @@ def get_overseerr_users() -> List[Dict[str, Any]]:
     Returns:
         List of user dictionaries with keys: id, display_name, email, avatar, last_synced
     """
-    with sqlite3.connect(DB_FILE) as conn:
+    with get_connection() as conn:
         cursor = conn.cursor()
         cursor.execute('''
             SELECT id, display_name, email, avatar, last_synced
@@ -1275,7 +2170,7 @@ def get_overseerr_user_by_id(user_id: str) -> Optional[Dict[str, Any]]:
     Returns:
         User dictionary or None if not found
     """
-    with sqlite3.connect(DB_FILE) as conn:
+    with get_connection() as conn:
         cursor = conn.cursor()
         cursor.execute('''
             SELECT id, display_name, email, avatar, last_synced
@@ -1298,7 +2193,7 @@ def get_overseerr_user_by_id(user_id: str) -> Optional[Dict[str, Any]]:
 
 def clear_overseerr_users():
     """Clear all Overseerr users from database."""
-    with sqlite3.connect(DB_FILE) as conn:
+    with get_connection() as conn:
         cursor = conn.cursor()
         cursor.execute("DELETE FROM overseerr_users")
         conn.commit()
@@ -1316,7 +2211,7 @@ def save_collection_sync_result(franchise_name: str, item_count: Optional[int] =
     """
     from datetime import datetime
     
-    with sqlite3.connect(DB_FILE) as conn:
+    with get_connection() as conn:
         cursor = conn.cursor()
         
         # Use existing save_list_id function with list_type='collections'
@@ -1339,7 +2234,7 @@ def get_synced_collections() -> List[str]:
     Returns:
         List[str]: List of franchise names that have been synced
     """
-    with sqlite3.connect(DB_FILE) as conn:
+    with get_connection() as conn:
         cursor = conn.cursor()
         cursor.execute(
             "SELECT list_id FROM lists WHERE list_type = 'collections' ORDER BY last_synced DESC"
@@ -1469,7 +2364,7 @@ def save_cached_image(image_url: str, image_data: bytes, mime_type: str = None,
         file_size = len(image_data)
         
         # Store in database (preserve existing cached_at if record exists)
-        with sqlite3.connect(DB_FILE) as conn:
+        with get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute('''
                 INSERT INTO cached_images
@@ -1504,7 +2399,7 @@ def get_cached_image(image_url: str) -> Optional[Dict[str, Any]]:
     Returns:
         dict: Image metadata including local_path, or None if not found
     """
-    with sqlite3.connect(DB_FILE) as conn:
+    with get_connection() as conn:
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
         cursor.execute('''
@@ -1540,7 +2435,7 @@ def update_item_poster_url(item_id: int, poster_url: str):
         item_id: Database ID of the synced item
         poster_url: Poster URL (should be our proxy URL, not direct Trakt URL)
     """
-    with sqlite3.connect(DB_FILE) as conn:
+    with get_connection() as conn:
         cursor = conn.cursor()
         cursor.execute('''
             UPDATE synced_items
@@ -1559,7 +2454,7 @@ def update_collection_poster_url(list_type: str, list_id: str, poster_url: str):
         list_id: Franchise name
         poster_url: Poster URL (should be our proxy URL, not direct Trakt URL)
     """
-    with sqlite3.connect(DB_FILE) as conn:
+    with get_connection() as conn:
         cursor = conn.cursor()
         cursor.execute('''
             UPDATE lists
@@ -1579,7 +2474,7 @@ def get_expired_cached_images(hours: int = 24) -> List[Dict[str, Any]]:
     Returns:
         List of image records that can be cleaned up
     """
-    with sqlite3.connect(DB_FILE) as conn:
+    with get_connection() as conn:
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
         cursor.execute('''
@@ -1601,7 +2496,7 @@ def cleanup_expired_images(hours: int = 24) -> int:
     Returns:
         int: Number of images removed
     """
-    with sqlite3.connect(DB_FILE) as conn:
+    with get_connection() as conn:
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
         
@@ -1648,7 +2543,7 @@ def migrate_blob_images_to_files() -> Dict[str, Any]:
     try:
         images_dir = _ensure_images_directory()
         
-        with sqlite3.connect(DB_FILE) as conn:
+        with get_connection() as conn:
             conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
             
@@ -1736,7 +2631,7 @@ def get_cached_image_stats() -> Dict[str, Any]:
     Returns:
         dict: Statistics about image cache
     """
-    with sqlite3.connect(DB_FILE) as conn:
+    with get_connection() as conn:
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
 
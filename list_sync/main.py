@@ -3,15 +3,17 @@ Main entry point for the List-Sync application.
 """
 
 import datetime
+import itertools
 import logging
 import os
+import queue
 import re
 import signal
 import sys
 import threading
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Any, Optional, Tuple
 
 from .api.overseerr import OverseerrClient
 from .config import (
@@ -21,16 +23,18 @@ from .config import (
 from .database import (
     init_database, load_list_ids, save_list_id, delete_list,
     load_sync_interval, configure_sync_interval, should_sync_item,
-    save_sync_result, update_list_item_count, update_list_sync_info, DB_FILE,
+    save_sync_result, link_item_to_list, update_list_item_count, update_list_sync_info, DB_FILE,
     start_sync_in_db, end_sync_in_db, add_item_to_sync, update_sync_lists_in_db
 )
 from .notifications.discord import send_to_discord_webhook
-from .providers import get_provider, get_available_providers, SyncCancelledException
+from .providers import get_provider, get_available_providers, iter_provider_pages, SyncCancelledException
+from .retention import run_idle_maintenance
 from .ui.cli import handle_menu_choice, manage_lists
 from .ui.display import (
     display_ascii_art, display_banner, display_menu, display_lists,
     display_item_status, display_summary, SyncResults
 )
+from .utils.fetch_limits import ProviderFetchLimits, get_list_fetch_concurrency
 from .utils.helpers import custom_input, format_time_remaining, init_selenium_driver, color_gradient, construct_list_url
 from .utils.logger import setup_logging, ensure_data_directory_exists
 from .utils.log_rotation import get_log_rotator, check_and_rotate_logs
@@ -157,9 +161,8 @@ def handle_cancellation(sync_tracker, session_id: Optional[str] = None):
     # Update database if session_id provided
     if session_id:
         try:
-            import sqlite3
-            from .database import DB_FILE
-            conn = sqlite3.connect(DB_FILE)
+            from .database import connect_db
+            conn = connect_db()
             cursor = conn.cursor()
             cursor.execute("""
                 UPDATE sync_history 
@@ -217,7 +220,7 @@ def get_credentials() -> tuple:
         tuple: Overseerr URL, API key, requester user ID
     """
     # Check for Docker environment variables first
-    url, api_key, user_id, _, _, _ = load_env_config()
+    url, api_key, user_id, _, _, _ = load_env_config(wait_for_check=True)
     
     if url and api_key:
         logging.info("Using credentials from environment variables")
@@ -259,171 +262,280 @@ def fetch_media_from_lists(list_ids: List[Dict[str, str]], is_single_list: bool
     Returns:
         tuple: (List of media items from all sources, List of synced list info with URLs)
     """
-    all_media = []
     synced_lists = []
+    unique_media = list(stream_media_from_lists(list_ids, synced_lists, is_single_list))
+    return unique_media, synced_lists
+
+
+# Sentinel that marks the end of a list-fetching stream
+_STREAM_END = object()
+
+
+def stream_media_from_lists(
+    list_ids: List[Dict[str, str]],
+    synced_lists: List[Dict[str, Any]],
+    is_single_list: bool = False
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield unique media items from all configured lists as providers produce them.
     
-    for list_info in list_ids:
-        # Check for cancellation request
-        if check_cancellation_requested():
-            logging.warning("⚠️ Cancellation detected while fetching lists")
-            # Return what we have so far
-            return all_media, synced_lists
-        
-        list_type = list_info["type"]
-        list_id = list_info["id"]
-        list_user_id = list_info.get("user_id", "1")
+    Lists are fetched on a background thread, so the caller can resolve and
+    request the first items while later pages and later lists are still being
+    scraped. Duplicates are merged into the item that was yielded first (its
+    `_source_lists` grows as later lists are fetched, and lists found after
+    it was saved are linked to its synced_items row directly).
+    
+    Only v2 providers (registered with register_stream_provider, currently
+    tmdb and trakt_special) stream page by page; every other provider still
+    fetches its whole list before its items reach the queue as one page.
+    
+    Args:
+        list_ids (List[Dict[str, str]]): List of dictionaries with list type and ID
+        synced_lists (List[Dict[str, Any]]): Filled with synced list info (with URLs) as each list finishes
+        is_single_list (bool): Whether this is a single list sync (affects log message format)
         
+    Yields:
+        Dict[str, Any]: Unique media items, in list order
+    """
+    page_queue = queue.Queue()
+    stop_event = threading.Event()
+    producer = threading.Thread(
+        target=_fetch_lists_into_queue,
+        args=(list_ids, page_queue, stop_event),
+        name="list-fetcher",
+        daemon=True
+    )
+    producer.start()
+    
+    deduplicator = MediaDeduplicator()
+    try:
+        while True:
+            message = page_queue.get()
+            if message is _STREAM_END:
+                break
+            kind, payload = message
+            if kind == 'list':
+                synced_lists.append(payload)
+                continue
+            for item in payload:
+                if deduplicator.add(item):
+                    yield item
+    finally:
+        # Stop fetching further lists if the consumer gave up early (e.g. cancellation)
+        stop_event.set()
+    
+    if deduplicator.duplicates:
+        print(color_gradient(f"\n🔄  Removed {deduplicator.duplicates} duplicate items", "#ffaa00", "#ff5500"))
+    
+    # Use different log message for single list syncs to avoid false FULL sync detection
+    if is_single_list:
+        print(color_gradient(f"\n📋  Found {deduplicator.unique} unique media items from list", "#00aaff", "#00ffaa"))
+        logging.info(f"Fetched {deduplicator.unique} unique media items from single list")
+    else:
+        print(color_gradient(f"\n📊  Total unique media items ready for sync: {deduplicator.unique}", "#00aaff", "#00ffaa"))
+        logging.info(f"Fetched {deduplicator.unique} unique media items from all lists")
+
+
+def _fetch_lists_into_queue(list_ids: List[Dict[str, str]], page_queue: "queue.Queue", stop_event: threading.Event) -> None:
+    """
+    Fetch every list, putting ('items', page) and ('list', info) messages on the queue.
+    
+    Lists are fetched concurrently under per-provider limits (browser providers
+    share a limit sized to the browser pool). Each list writes to its own queue
+    and those queues are relayed in configuration order, so items and synced
+    lists come out in the same order as a sequential fetch.
+    
+    Args:
+        list_ids (List[Dict[str, str]]): List of dictionaries with list type and ID
+        page_queue (queue.Queue): Queue read by stream_media_from_lists
+        stop_event (threading.Event): Set when the consumer stops reading
+    """
+    limits = ProviderFetchLimits()
+    list_queues = [queue.Queue() for _ in list_ids]
+    
+    def fetch_one(list_info: Dict[str, str], list_queue: "queue.Queue") -> None:
         try:
-            # Display progress message to user
-            print(color_gradient(f"\n🔍  Fetching items from {list_type.upper()} list: {list_id}... (check backend logs for details - this can take some time)", "#ffaa00", "#ff5500"))
-            
-            logging.info(f"Fetching {list_type.upper()} list: {list_id}")
-            # Get the appropriate provider function
-            provider_func = get_provider(list_type)
-            media_items = provider_func(list_id)
-            
-            # Construct the URL for this list
-            list_url = construct_list_url(list_type, list_id)
-            
-            if media_items:
-                # Filter out items with empty titles and clean up problematic characters
-                valid_items = []
-                for item in media_items:
-                    title = item.get('title', '').strip()
-                    # Clean up backslashes and other problematic characters
-                    title = title.replace('\\', '').strip()
-                    if title:  # Only keep items with non-empty titles
-                        item['title'] = title  # Update the cleaned title
-                        # Attach list information to each item
-                        # This allows tracking which list(s) each item came from (with user)
-                        item['_source_list_type'] = list_type
-                        item['_source_list_id'] = list_id
-                        item['_source_list_user_id'] = list_user_id
-                        valid_items.append(item)
-                    else:
-                        logging.warning(f"Skipping item with empty title from {list_type.upper()} list: {list_id}")
-                
-                # Display success message to user
-                print(color_gradient(f"✅  Found {len(valid_items)} items in {list_type.upper()} list: {list_id}", "#00ff00", "#00aa00"))
-                logging.info(f"Found {len(valid_items)} items in {list_type.upper()} list: {list_id}")
-                all_media.extend(valid_items)
+            with limits.slot(list_info["type"]):
+                if stop_event.is_set():
+                    return
                 
-                # Track this list as successfully synced
-                synced_lists.append({
-                    'type': list_type,
-                    'id': list_id,
-                    'url': list_url,
-                    'item_count': len(media_items),
-                    'user_id': list_user_id
-                })
-            else:
-                # Display warning message to user
-                print(color_gradient(f"⚠️   No items found in {list_type.upper()} list: {list_id}", "#ffaa00", "#ff5500"))
-                logging.warning(f"No items found in {list_type.upper()} list: {list_id}")
+                # Check for cancellation request
+                if check_cancellation_requested():
+                    logging.warning("⚠️ Cancellation detected while fetching lists")
+                    stop_event.set()
+                    return
                 
-                # Still track the list even if no items found
-                synced_lists.append({
-                    'type': list_type,
-                    'id': list_id,
-                    'url': list_url,
-                    'item_count': 0,
-                    'user_id': list_user_id
-                })
-        except SyncCancelledException:
-            # Cancellation was requested - return what we have so far
-            logging.warning(f"⚠️ Sync cancelled during fetch of {list_type.upper()} list: {list_id}")
-            print(color_gradient(f"⚠️  Sync cancelled - stopping list fetch", "#ffaa00", "#ff5500"))
-            return all_media, synced_lists
-        except Exception as e:
-            # Display error message to user
-            print(color_gradient(f"❌  Error fetching {list_type.upper()} list {list_id}: {str(e)}", "#ff0000", "#aa0000"))
-            logging.error(f"Error fetching {list_type.upper()} list {list_id}: {str(e)}")
+                if not _fetch_list_into_queue(list_info, list_queue):
+                    stop_event.set()
+        finally:
+            list_queue.put(_STREAM_END)
+    
+    executor = ThreadPoolExecutor(max_workers=get_list_fetch_concurrency(), thread_name_prefix="list-fetch")
+    try:
+        for list_info, list_queue in zip(list_ids, list_queues):
+            executor.submit(fetch_one, list_info, list_queue)
+        
+        for list_queue in list_queues:
+            while True:
+                message = list_queue.get()
+                if message is _STREAM_END:
+                    break
+                page_queue.put(message)
+            if stop_event.is_set():
+                return
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+        page_queue.put(_STREAM_END)
+
+
+def _fetch_list_into_queue(list_info: Dict[str, str], page_queue: "queue.Queue") -> bool:
+    """
+    Fetch one list page by page onto the queue.
+    
+    Args:
+        list_info (Dict[str, str]): List type, ID and optional user_id
+        page_queue (queue.Queue): Queue read by stream_media_from_lists
+        
+    Returns:
+        bool: False if the sync was cancelled and fetching should stop
+    """
+    list_type = list_info["type"]
+    list_id = list_info["id"]
+    list_user_id = list_info.get("user_id", "1")
+    item_count = 0
+    
+    try:
+        # Display progress message to user
+        print(color_gradient(f"\n🔍  Fetching items from {list_type.upper()} list: {list_id}... (check backend logs for details - this can take some time)", "#ffaa00", "#ff5500"))
+        
+        logging.info(f"Fetching {list_type.upper()} list: {list_id}")
+        
+        # Construct the URL for this list
+        list_url = construct_list_url(list_type, list_id)
+        
+        valid_count = 0
+        for media_items in iter_provider_pages(list_type, list_id):
+            item_count += len(media_items)
+            
+            # Filter out items with empty titles and clean up problematic characters
+            valid_items = []
+            for item in media_items:
+                title = item.get('title', '').strip()
+                # Clean up backslashes and other problematic characters
+                title = title.replace('\\', '').strip()
+                if title:  # Only keep items with non-empty titles
+                    item['title'] = title  # Update the cleaned title
+                    # Attach list information to each item
+                    # This allows tracking which list(s) each item came from (with user)
+                    item['_source_list_type'] = list_type
+                    item['_source_list_id'] = list_id
+                    item['_source_list_user_id'] = list_user_id
+                    valid_items.append(item)
+                else:
+                    logging.warning(f"Skipping item with empty title from {list_type.upper()} list: {list_id}")
+            
+            valid_count += len(valid_items)
+            page_queue.put(('items', valid_items))
+        
+        if item_count:
+            # Display success message to user
+            print(color_gradient(f"✅  Found {valid_count} items in {list_type.upper()} list: {list_id}", "#00ff00", "#00aa00"))
+            logging.info(f"Found {valid_count} items in {list_type.upper()} list: {list_id}")
+        else:
+            # Display warning message to user
+            print(color_gradient(f"⚠️   No items found in {list_type.upper()} list: {list_id}", "#ffaa00", "#ff5500"))
+            logging.warning(f"No items found in {list_type.upper()} list: {list_id}")
+        
+        # Track this list as synced (even if no items were found)
+        page_queue.put(('list', {
+            'type': list_type,
+            'id': list_id,
+            'url': list_url,
+            'item_count': item_count,
+            'user_id': list_user_id
+        }))
+        return True
+    except SyncCancelledException:
+        # Cancellation was requested - keep what was already streamed
+        logging.warning(f"⚠️ Sync cancelled during fetch of {list_type.upper()} list: {list_id}")
+        print(color_gradient(f"⚠️  Sync cancelled - stopping list fetch", "#ffaa00", "#ff5500"))
+        return False
+    except Exception as e:
+        # Display error message to user
+        print(color_gradient(f"❌  Error fetching {list_type.upper()} list {list_id}: {str(e)}", "#ff0000", "#aa0000"))
+        logging.error(f"Error fetching {list_type.upper()} list {list_id}: {str(e)}")
+        
+        # Track failed lists too
+        list_url = construct_list_url(list_type, list_id)
+        page_queue.put(('list', {
+            'type': list_type,
+            'id': list_id,
+            'url': list_url,
+            'item_count': 0,
+            'error': str(e)
+        }))
+        return True
+
+
+class MediaDeduplicator:
+    """Removes duplicate items across lists while tracking every list each item came from"""
+    
+    def __init__(self):
+        self.seen_imdb_ids = {}
+        self.seen_tmdb_ids = {}
+        self.seen_titles = {}
+        self.unique = 0
+        self.duplicates = 0
+    
+    def add(self, item: Dict[str, Any]) -> bool:
+        """
+        Register an item, merging its source list into an earlier duplicate.
+        
+        Args:
+            item (Dict[str, Any]): Media item with _source_list_* fields
             
-            # Track failed lists too
-            list_url = construct_list_url(list_type, list_id)
-            synced_lists.append({
-                'type': list_type,
-                'id': list_id,
-                'url': list_url,
-                'item_count': 0,
-                'error': str(e)
-            })
-    
-    # Remove duplicates (by IMDb ID if available) while preserving list information
-    # Track all lists each item came from
-    seen_imdb_ids = {}
-    seen_tmdb_ids = {}
-    seen_titles = {}
-    unique_media = []
-    
-    for item in all_media:
+        Returns:
+            bool: True if the item is new, False if it duplicated an earlier one
+        """
         imdb_id = item.get("imdb_id")
         tmdb_id = item.get("tmdb_id")
         title_key = f"{item.get('title', '')}|{item.get('year', '')}|{item.get('media_type', '')}"
-        list_type = item.get('_source_list_type')
-        list_id = item.get('_source_list_id')
         
         # Track which list this item came from
+        list_type = item.get('_source_list_type')
+        list_id = item.get('_source_list_id')
         list_user_id = item.get('_source_list_user_id', "1")
         list_info = {'type': list_type, 'id': list_id, 'user_id': list_user_id}
         
-        # Try to match by IMDb ID first (most reliable)
+        # Try to match by IMDb ID first (most reliable), then TMDB ID, then title + year + media_type
         if imdb_id:
-            if imdb_id not in seen_imdb_ids:
-                seen_imdb_ids[imdb_id] = item
-                # Initialize source_lists array
-                item['_source_lists'] = [list_info]
-                unique_media.append(item)
-            else:
-                # Item already exists, add this list to source_lists if not already present
-                existing_item = seen_imdb_ids[imdb_id]
-                if '_source_lists' not in existing_item:
-                    existing_item['_source_lists'] = []
-                # Check if this list is already tracked (by comparing type and id)
-                list_key = f"{list_type}:{list_id}:{list_user_id}"
-                existing_keys = [f"{l['type']}:{l['id']}:{l.get('user_id','1')}" for l in existing_item['_source_lists']]
-                if list_key not in existing_keys:
-                    existing_item['_source_lists'].append(list_info)
-        # Try TMDB ID as fallback
+            seen, key = self.seen_imdb_ids, imdb_id
         elif tmdb_id:
-            if tmdb_id not in seen_tmdb_ids:
-                seen_tmdb_ids[tmdb_id] = item
-                item['_source_lists'] = [list_info]
-                unique_media.append(item)
-            else:
-                existing_item = seen_tmdb_ids[tmdb_id]
-                if '_source_lists' not in existing_item:
-                    existing_item['_source_lists'] = []
-                list_key = f"{list_type}:{list_id}:{list_user_id}"
-                existing_keys = [f"{l['type']}:{l['id']}:{l.get('user_id','1')}" for l in existing_item['_source_lists']]
-                if list_key not in existing_keys:
-                    existing_item['_source_lists'].append(list_info)
-        # Fallback to title + year + media_type
+            seen, key = self.seen_tmdb_ids, tmdb_id
         else:
-            if title_key not in seen_titles:
-                seen_titles[title_key] = item
-                item['_source_lists'] = [list_info]
-                unique_media.append(item)
-            else:
-                existing_item = seen_titles[title_key]
-                if '_source_lists' not in existing_item:
-                    existing_item['_source_lists'] = []
-                list_key = f"{list_type}:{list_id}:{list_user_id}"
-                existing_keys = [f"{l['type']}:{l['id']}:{l.get('user_id','1')}" for l in existing_item['_source_lists']]
-                if list_key not in existing_keys:
-                    existing_item['_source_lists'].append(list_info)
-    
-    if len(all_media) != len(unique_media):
-        print(color_gradient(f"\n🔄  Removed {len(all_media) - len(unique_media)} duplicate items", "#ffaa00", "#ff5500"))
-    
-    # Use different log message for single list syncs to avoid false FULL sync detection
-    if is_single_list:
-        print(color_gradient(f"\n📋  Found {len(unique_media)} unique media items from list", "#00aaff", "#00ffaa"))
-        logging.info(f"Fetched {len(unique_media)} unique media items from single list")
-    else:
-        print(color_gradient(f"\n📊  Total unique media items ready for sync: {len(unique_media)}", "#00aaff", "#00ffaa"))
-        logging.info(f"Fetched {len(unique_media)} unique media items from all lists")
-    return unique_media, synced_lists
+            seen, key = self.seen_titles, title_key
+        
+        if key not in seen:
+            seen[key] = item
+            # Initialize source_lists array
+            item['_source_lists'] = [list_info]
+            self.unique += 1
+            return True
+        
+        # Item already exists, add this list to source_lists if not already present
+        existing_item = seen[key]
+        if '_source_lists' not in existing_item:
+            existing_item['_source_lists'] = []
+        # Check if this list is already tracked (by comparing type, id and user)
+        list_key = f"{list_type}:{list_id}:{list_user_id}"
+        existing_keys = [f"{l['type']}:{l['id']}:{l.get('user_id','1')}" for l in existing_item['_source_lists']]
+        if list_key not in existing_keys:
+            existing_item['_source_lists'].append(list_info)
+            # A streamed item may already have been processed and saved with its earlier lists
+            if existing_item.get('_synced_item_id') and list_type and list_id:
+                link_item_to_list(existing_item['_synced_item_id'], list_type, list_id)
+        self.duplicates += 1
+        return False
 
 
 def get_source_lists_from_item(item: Dict[str, Any], list_type: Optional[str] = None, list_id: Optional[str] = None) -> List[Dict[str, str]]:
@@ -653,7 +765,7 @@ def process_media_item(item: Dict[str, Any], overseerr_client: OverseerrClient,
                 logging.info(f"⏭️  SKIP: Recently synced (within skip window)")
                 # Save relationship for all source lists
                 for source_list in source_lists:
-                    save_sync_result(title, media_type, imdb_id, overseerr_id, "skipped", year, tmdb_id, source_list['type'], source_list['id'])
+                    item['_synced_item_id'] = save_sync_result(title, media_type, imdb_id, overseerr_id, "skipped", year, tmdb_id, source_list['type'], source_list['id'])
                 return {"title": title, "status": "skipped", "year": year, "media_type": media_type}
 
             logging.info(f"🔍 Checking media status in Overseerr...")
@@ -667,13 +779,13 @@ def process_media_item(item: Dict[str, Any], overseerr_client: OverseerrClient,
                 logging.info(f"☑️ STATUS: Already available in library")
                 # Save relationship for all source lists
                 for source_list in source_lists:
-                    save_sync_result(title, media_type, imdb_id, overseerr_id, "already_available", year, tmdb_id, source_list['type'], source_list['id'])
+                    item['_synced_item_id'] = save_sync_result(title, media_type, imdb_id, overseerr_id, "already_available", year, tmdb_id, source_list['type'], source_list['id'])
                 return {"title": title, "status": "already_available", "year": year, "media_type": media_type}
             elif is_requested:
                 logging.info(f"📌 STATUS: Already requested (pending)")
                 # Save relationship for all source lists
                 for source_list in source_lists:
-                    save_sync_result(title, media_type, imdb_id, overseerr_id, "already_requested", year, tmdb_id, source_list['type'], source_list['id'])
+                    item['_synced_item_id'] = save_sync_result(title, media_type, imdb_id, overseerr_id, "already_requested", year, tmdb_id, source_list['type'], source_list['id'])
                 return {"title": title, "status": "already_requested", "year": year, "media_type": media_type}
             else:
                 logging.info(f"🚀 STATUS: Requesting media...")
@@ -693,19 +805,19 @@ def process_media_item(item: Dict[str, Any], overseerr_client: OverseerrClient,
                     logging.info(f"✅ SUCCESS: Request submitted successfully!")
                     # Save relationship for all source lists
                     for source_list in source_lists:
-                        save_sync_result(title, media_type, imdb_id, overseerr_id, "requested", year, tmdb_id, source_list['type'], source_list['id'])
+                        item['_synced_item_id'] = save_sync_result(title, media_type, imdb_id, overseerr_id, "requested", year, tmdb_id, source_list['type'], source_list['id'])
                     return {"title": title, "status": "requested", "year": year, "media_type": media_type}
                 elif request_status == "already_requested":
                     logging.info(f"📌 STATUS: Already requested (detected from API response)")
                     # Save relationship for all source lists
                     for source_list in source_lists:
-                        save_sync_result(title, media_type, imdb_id, overseerr_id, "already_requested", year, tmdb_id, source_list['type'], source_list['id'])
+                        item['_synced_item_id'] = save_sync_result(title, media_type, imdb_id, overseerr_id, "already_requested", year, tmdb_id, source_list['type'], source_list['id'])
                     return {"title": title, "status": "already_requested", "year": year, "media_type": media_type}
                 else:
                     logging.error(f"❌ ERROR: Request failed")
                     # Save relationship for all source lists
                     for source_list in source_lists:
-                        save_sync_result(title, media_type, imdb_id, overseerr_id, "request_failed", year, tmdb_id, source_list['type'], source_list['id'])
+                        item['_synced_item_id'] = save_sync_result(title, media_type, imdb_id, overseerr_id, "request_failed", year, tmdb_id, source_list['type'], source_list['id'])
                     return {"title": title, "status": "request_failed", "year": year, "media_type": media_type}
         else:
             logging.error(f"❌ ERROR: Could not find match using any method")
@@ -714,7 +826,7 @@ def process_media_item(item: Dict[str, Any], overseerr_client: OverseerrClient,
             # Save relationship for all source lists
             if source_lists:
                 for source_list in source_lists:
-                    save_sync_result(title, media_type, imdb_id, None, "not_found", year, tmdb_id, source_list['type'], source_list['id'])
+                    item['_synced_item_id'] = save_sync_result(title, media_type, imdb_id, None, "not_found", year, tmdb_id, source_list['type'], source_list['id'])
             else:
                 logging.error(f"❌ CRITICAL: Cannot save 'not_found' item without list information!")
             return {"title": title, "status": "not_found", "year": year, "media_type": media_type}
@@ -733,14 +845,14 @@ def process_media_item(item: Dict[str, Any], overseerr_client: OverseerrClient,
                 year = item.get('year')
                 tmdb_id = item.get('tmdb_id')
                 for source_list in source_lists:
-                    save_sync_result(title, media_type, imdb_id, None, "error", year, tmdb_id, source_list['type'], source_list['id'])
+                    item['_synced_item_id'] = save_sync_result(title, media_type, imdb_id, None, "error", year, tmdb_id, source_list['type'], source_list['id'])
         except Exception as save_error:
             logging.error(f"Failed to save error status: {save_error}")
         return result
 
 
 def sync_media_to_overseerr(
-    media_items: List[Dict[str, Any]],
+    media_items: Iterable[Dict[str, Any]],
     overseerr_client: OverseerrClient,
     synced_lists: List[Dict[str, str]] = None,
     is_4k: bool = False,
@@ -753,7 +865,8 @@ def sync_media_to_overseerr(
     Sync media items to Overseerr using ThreadPoolExecutor for concurrent processing.
     
     Args:
-        media_items (List[Dict[str, Any]]): List of media items to sync
+        media_items (Iterable[Dict[str, Any]]): Media items to sync; a list, or a stream
+            from stream_media_from_lists that is consumed while lists are still being fetched
         overseerr_client (OverseerrClient): Overseerr API client
         synced_lists (List[Dict[str, str]], optional): List of synced list information. Defaults to None.
         is_4k (bool, optional): Whether to request 4K. Defaults to False.
@@ -764,11 +877,22 @@ def sync_media_to_overseerr(
         SyncResults: Sync results
     """
     sync_results = SyncResults()
-    sync_results.total_items = len(media_items)
-    sync_results.synced_lists = synced_lists or []
+    # Keep the caller's list object: a streaming fetch keeps appending to it
+    sync_results.synced_lists = synced_lists if synced_lists is not None else []
     current_item = 0
-
-    print(f"\n🎬  Processing {sync_results.total_items} media items...")
+    
+    streaming = not isinstance(media_items, list)
+    if streaming:
+        # The total is only known once every list has been fetched
+        sync_results.total_items = 0
+        media_items = _count_streamed_items(media_items, sync_results)
+        print("\n🎬  Processing media items as lists are fetched...")
+    else:
+        sync_results.total_items = len(media_items)
+        print(f"\n🎬  Processing {sync_results.total_items} media items...")
+    
+    def progress(index: int) -> str:
+        return f"{index}" if streaming else f"{index}/{sync_results.total_items}"
     
     # Intelligent batching for optimal performance with readable logs
     batch_size = int(os.getenv('LISTSYNC_BATCH_SIZE', '3') or '3')  # Default batch size of 3
@@ -782,7 +906,7 @@ def sync_media_to_overseerr(
         for i, item in enumerate(media_items, 1):
             # Check for cancellation request
             if check_cancellation_requested():
-                logging.warning(f"⚠️ Cancellation detected during sequential processing at item {i}/{sync_results.total_items}")
+                logging.warning(f"⚠️ Cancellation detected during sequential processing at item {progress(i)}")
                 handle_cancellation(get_sync_tracker(), session_id)
                 sync_results.cancelled = True
                 return sync_results
@@ -798,15 +922,15 @@ def sync_media_to_overseerr(
                 year_str = f" ({year})" if year else ""
                 
                 if status == "requested":
-                    print(f"✅ {title}{year_str}: Successfully Requested ({i}/{sync_results.total_items})")
+                    print(f"✅ {title}{year_str}: Successfully Requested ({progress(i)})")
                 elif status == "already_available":
-                    print(f"☑️ {title}{year_str}: Already Available ({i}/{sync_results.total_items})")
+                    print(f"☑️ {title}{year_str}: Already Available ({progress(i)})")
                 elif status == "already_requested":
-                    print(f"📌 {title}{year_str}: Already Requested ({i}/{sync_results.total_items})")
+                    print(f"📌 {title}{year_str}: Already Requested ({progress(i)})")
                 elif status == "skipped":
-                    print(f"⏭️  {title}{year_str}: Skipped ({i}/{sync_results.total_items})")
+                    print(f"⏭️  {title}{year_str}: Skipped ({progress(i)})")
                 else:
-                    print(f"❓ {title}{year_str}: {status} ({i}/{sync_results.total_items})")
+                    print(f"❓ {title}{year_str}: {status} ({progress(i)})")
                 
                 current_item += 1
                 
@@ -819,27 +943,33 @@ def sync_media_to_overseerr(
         print(f"⚡ Intelligent batching mode enabled - processing {batch_size} items at a time")
         
         # Process items in batches for optimal performance with clean logging
-        total_batches = (len(media_items) + batch_size - 1) // batch_size
+        total_batches = None if streaming else (len(media_items) + batch_size - 1) // batch_size
+        batch_label = lambda num: f"{num}" if total_batches is None else f"{num}/{total_batches}"
         
-        for batch_num in range(total_batches):
+        items_iter = iter(media_items)
+        start_idx = 0
+        batch_num = 0
+        while True:
+            batch_items = list(itertools.islice(items_iter, batch_size))
+            if not batch_items:
+                break
+            
             # Check for cancellation request before each batch
             if check_cancellation_requested():
-                logging.warning(f"⚠️ Cancellation detected before batch {batch_num + 1}/{total_batches}")
+                logging.warning(f"⚠️ Cancellation detected before batch {batch_label(batch_num + 1)}")
                 handle_cancellation(get_sync_tracker(), session_id)
                 sync_results.cancelled = True
                 return sync_results
             
-            start_idx = batch_num * batch_size
-            end_idx = min(start_idx + batch_size, len(media_items))
-            batch_items = media_items[start_idx:end_idx]
+            end_idx = start_idx + len(batch_items)
             
-            logging.info(f"📦 BATCH {batch_num + 1}/{total_batches}: Processing items {start_idx + 1}-{end_idx}")
+            logging.info(f"📦 BATCH {batch_label(batch_num + 1)}: Processing items {start_idx + 1}-{end_idx}")
             
             # Process batch items sequentially to maintain clean log boundaries
             for i, item in enumerate(batch_items):
                 # Add clear log boundary before each item
                 logging.info(f"\n{'='*80}")
-                logging.info(f"🎬 PROCESSING ITEM {start_idx + i + 1}/{sync_results.total_items}")
+                logging.info(f"🎬 PROCESSING ITEM {progress(start_idx + i + 1)}")
                 logging.info(f"{'='*80}")
                 
                 try:
@@ -849,7 +979,7 @@ def sync_media_to_overseerr(
                     
                     # Add clear log boundary after each item
                     logging.info(f"{'='*80}")
-                    logging.info(f"✅ COMPLETED ITEM {start_idx + i + 1}/{sync_results.total_items} - Status: {status.upper()}")
+                    logging.info(f"✅ COMPLETED ITEM {progress(start_idx + i + 1)} - Status: {status.upper()}")
                     logging.info(f"{'='*80}\n")
                     
                     # Display each item individually
@@ -859,21 +989,21 @@ def sync_media_to_overseerr(
                     index = start_idx + i + 1
                     
                     if status == "requested":
-                        print(f"✅ {title}{year_str}: Successfully Requested ({index}/{sync_results.total_items})")
+                        print(f"✅ {title}{year_str}: Successfully Requested ({progress(index)})")
                     elif status == "already_available":
-                        print(f"☑️ {title}{year_str}: Already Available ({index}/{sync_results.total_items})")
+                        print(f"☑️ {title}{year_str}: Already Available ({progress(index)})")
                     elif status == "already_requested":
-                        print(f"📌 {title}{year_str}: Already Requested ({index}/{sync_results.total_items})")
+                        print(f"📌 {title}{year_str}: Already Requested ({progress(index)})")
                     elif status == "skipped":
-                        print(f"⏭️ {title}{year_str}: Skipped ({index}/{sync_results.total_items})")
+                        print(f"⏭️ {title}{year_str}: Skipped ({progress(index)})")
                     else:
-                        print(f"❓ {title}{year_str}: {status} ({index}/{sync_results.total_items})")
+                        print(f"❓ {title}{year_str}: {status} ({progress(index)})")
                     
                     current_item += 1
                     
                     # Check for cancellation after processing each item
                     if check_cancellation_requested():
-                        logging.warning(f"⚠️ Cancellation detected after item {start_idx + i + 1}/{sync_results.total_items}")
+                        logging.warning(f"⚠️ Cancellation detected after item {progress(start_idx + i + 1)}")
                         handle_cancellation(get_sync_tracker(), session_id)
                         sync_results.cancelled = True
                         return sync_results
@@ -915,17 +1045,26 @@ def sync_media_to_overseerr(
                 except Exception as e:
                     # Add clear log boundary for errors too
                     logging.error(f"{'='*80}")
-                    logging.error(f"❌ ERROR PROCESSING ITEM {start_idx + i + 1}/{sync_results.total_items}: {str(e)}")
+                    logging.error(f"❌ ERROR PROCESSING ITEM {progress(start_idx + i + 1)}: {str(e)}")
                     logging.error(f"{'='*80}\n")
                     sync_results.results["error"] += 1
                     current_item += 1
             
             # Display progress
-            logging.info(f"📊 PROGRESS: {current_item}/{sync_results.total_items} items processed")
+            logging.info(f"📊 PROGRESS: {progress(current_item)} items processed")
+            start_idx = end_idx
+            batch_num += 1
 
     return sync_results
 
 
+def _count_streamed_items(media_items: Iterable[Dict[str, Any]], sync_results: SyncResults) -> Iterator[Dict[str, Any]]:
+    """Pass items through while counting them into sync_results.total_items"""
+    for item in media_items:
+        sync_results.total_items += 1
+        yield item
+
+
 def automated_sync(
     overseerr_client: OverseerrClient,
     initial_interval_hours: float,
@@ -1286,6 +1425,9 @@ def automated_sync(
             except Exception as e:
                 logging.warning(f"Pause wait check failed: {e}")
             
+            # Retention and vacuum while idle; an immediate sync request cuts the vacuum short
+            run_idle_maintenance(should_stop=immediate_sync_requested.is_set)
+            
             # Wait for the interval or immediate sync signal
             logging.info(f"Waiting for sync... (Timeout: {wait_seconds}s)")
             if immediate_sync_requested.wait(timeout=wait_seconds):
@@ -1333,6 +1475,44 @@ def schedule_next_sync(interval_hours: float, is_4k: bool = False, automated_mod
     scheduler_thread.start()
 
 
+def is_streaming_sync_enabled() -> bool:
+    """
+    Check whether items should be synced while lists are still being fetched.
+    
+    Returns:
+        bool: False if LISTSYNC_STREAMING_SYNC is set to 'false'
+    """
+    return os.getenv('LISTSYNC_STREAMING_SYNC', 'true').lower() != 'false'
+
+
+def _end_sync_without_items(session_id: str) -> None:
+    """Log and record a full sync that found no media items"""
+    logging.warning("No media items found in configured lists")
+    print("\n⚠️  No media items found in configured lists.")
+    # Log sync end marker for early exit
+    sync_end_marker = f"========== SYNC COMPLETE [FULL] - Session: {session_id} - Status: NO_ITEMS =========="
+    logging.info(sync_end_marker)
+    # Mark sync as ended in database
+    end_sync_in_db(session_id=session_id, status='no_items')
+
+
+def _record_synced_lists(session_id: str, synced_lists: List[Dict[str, Any]]) -> None:
+    """Store the synced lists on the sync history entry and update each list's item count"""
+    # Update sync_history with list information for full syncs
+    try:
+        update_sync_lists_in_db(session_id=session_id, synced_lists=synced_lists)
+    except Exception as e:
+        logging.warning(f"Failed to update sync lists in database: {e}")
+    
+    # Update item counts and last_synced timestamps in database for all processed lists
+    for list_info in synced_lists:
+        try:
+            update_list_sync_info(list_info['type'], list_info['id'], list_info['item_count'])
+            logging.info(f"Updated sync info for {list_info['type']} list {list_info['id']}: {list_info['item_count']} items")
+        except Exception as e:
+            logging.warning(f"Failed to update sync info for {list_info['type']} list {list_info['id']}: {e}")
+
+
 def run_sync(
     overseerr_client: OverseerrClient,
     dry_run: bool = False,
@@ -1389,32 +1569,19 @@ def run_sync(
             end_sync_in_db(session_id=session_id, status='no_lists')
             return
         
-        # Fetch media from lists
-        media_items, synced_lists = fetch_media_from_lists(list_ids)
-        
-        if not media_items:
-            logging.warning("No media items found in configured lists")
-            print("\n⚠️  No media items found in configured lists.")
-            # Log sync end marker for early exit
-            sync_end_marker = f"========== SYNC COMPLETE [FULL] - Session: {session_id} - Status: NO_ITEMS =========="
-            logging.info(sync_end_marker)
-            # Mark sync as ended in database
-            end_sync_in_db(session_id=session_id, status='no_items')
-            return
-        
-        # Update sync_history with list information for full syncs
-        try:
-            update_sync_lists_in_db(session_id=session_id, synced_lists=synced_lists)
-        except Exception as e:
-            logging.warning(f"Failed to update sync lists in database: {e}")
-        
-        # Update item counts and last_synced timestamps in database for all processed lists
-        for list_info in synced_lists:
-            try:
-                update_list_sync_info(list_info['type'], list_info['id'], list_info['item_count'])
-                logging.info(f"Updated sync info for {list_info['type']} list {list_info['id']}: {list_info['item_count']} items")
-            except Exception as e:
-                logging.warning(f"Failed to update sync info for {list_info['type']} list {list_info['id']}: {e}")
+        # Fetch media from lists; when streaming, items are synced while later lists are still being fetched
+        streaming = is_streaming_sync_enabled()
+        if streaming:
+            synced_lists = []
+            media_items = stream_media_from_lists(list_ids, synced_lists)
+        else:
+            media_items, synced_lists = fetch_media_from_lists(list_ids)
+            
+            if not media_items:
+                _end_sync_without_items(session_id)
+                return
+            
+            _record_synced_lists(session_id, synced_lists)
         
         # Perform the sync
         sync_results = sync_media_to_overseerr(
@@ -1428,6 +1595,12 @@ def run_sync(
             session_id=session_id
         )
         
+        if streaming:
+            if not sync_results.total_items and not sync_results.cancelled:
+                _end_sync_without_items(session_id)
+                return
+            _record_synced_lists(session_id, synced_lists)
+        
         # Display summary
         summary_text = str(sync_results)
         display_summary(sync_results)
@@ -1456,6 +1629,22 @@ def run_sync(
         _current_sync_session_id = None
 
 
+def _end_single_sync_without_items(session_id: str, list_type: str, list_id: str, synced_lists: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Record a single list sync that found no media items and build its result"""
+    result = {
+        "success": True,
+        "message": f"No items found in {list_type}:{list_id}",
+        "items_processed": 0,
+        "items_requested": 0,
+        "errors": 0,
+        "list_info": synced_lists[0] if synced_lists else None
+    }
+    logging.info(f"Single list sync completed - no items found")
+    # Mark sync as ended in database
+    end_sync_in_db(session_id=session_id, status='no_items')
+    return result
+
+
 def sync_single_list(
     list_type: str,
     list_id: str,
@@ -1555,22 +1744,16 @@ def sync_single_list(
             # Create a single list info dictionary (carry user_id so requests use correct requester)
             single_list_info = [{"type": list_type, "id": list_id, "user_id": user_id}]
             
-            # Fetch media from the single list
-            media_items, synced_lists = fetch_media_from_lists(single_list_info, is_single_list=True)
-            
-            if not media_items:
-                result = {
-                    "success": True,
-                    "message": f"No items found in {list_type}:{list_id}",
-                    "items_processed": 0,
-                    "items_requested": 0,
-                    "errors": 0,
-                    "list_info": synced_lists[0] if synced_lists else None
-                }
-                logging.info(f"Single list sync completed - no items found")
-                # Mark sync as ended in database
-                end_sync_in_db(session_id=session_id, status='no_items')
-                return result
+            # Fetch media from the single list; when streaming, items are synced as pages arrive
+            streaming = is_streaming_sync_enabled()
+            if streaming:
+                synced_lists = []
+                media_items = stream_media_from_lists(single_list_info, synced_lists, is_single_list=True)
+            else:
+                media_items, synced_lists = fetch_media_from_lists(single_list_info, is_single_list=True)
+                
+                if not media_items:
+                    return _end_single_sync_without_items(session_id, list_type, list_id, synced_lists)
             
             # Sync the media items to Overseerr
             sync_results = sync_media_to_overseerr(
@@ -1584,6 +1767,9 @@ def sync_single_list(
                 session_id=session_id
             )
             
+            if streaming and not sync_results.total_items and not sync_results.cancelled:
+                return _end_single_sync_without_items(session_id, list_type, list_id, synced_lists)
+            
             # Update item count for the synced list
             if synced_lists:
                 list_info = synced_lists[0]
@@ -1711,7 +1897,7 @@ def main():
         display_banner()
         
         # Check for Docker environment variables
-        url, api_key, user_id, _, automated_mode, is_4k = load_env_config()
+        url, api_key, user_id, _, automated_mode, is_4k = load_env_config(wait_for_check=True)
         
         # If in automated mode, bypass menu and start syncing
         if url and api_key and automated_mode:
@@ -2,8 +2,9 @@
 List provider registration and management.
 """
 
+import functools
 import logging
-from typing import Dict, Callable, List, Any
+from typing import Dict, Callable, Iterator, List, Any
 
 
 class SyncCancelledException(Exception):
@@ -42,6 +43,9 @@ def check_and_raise_if_cancelled():
 # Registry to store provider functions by type
 PROVIDERS = {}
 
+# Registry of v2 (streaming) provider generators by type
+STREAM_PROVIDERS = {}
+
 
 def register_provider(provider_type: str):
     """
@@ -59,6 +63,70 @@ def register_provider(provider_type: str):
     return decorator
 
 
+def register_stream_provider(provider_type: str):
+    """
+    Decorator to register a v2 provider that yields items as they are parsed.
+    
+    The decorated generator takes a list ID and yields either single media
+    item dicts or lists of them (one per page). A list-returning wrapper is
+    registered as well, so `get_provider` keeps working for v2 providers.
+    
+    Args:
+        provider_type (str): Type of provider (e.g., 'imdb', 'trakt')
+        
+    Returns:
+        Callable: Decorator function
+    """
+    def decorator(func):
+        STREAM_PROVIDERS[provider_type] = func
+        
+        @functools.wraps(func)
+        def collect(list_id):
+            return [item for page in _normalize_pages(func(list_id)) for item in page]
+        
+        PROVIDERS[provider_type] = collect
+        return func
+    return decorator
+
+
+def _normalize_pages(stream) -> Iterator[List[Dict[str, Any]]]:
+    """Turn a v2 provider's yields (items or pages) into non-empty pages."""
+    for chunk in stream:
+        if isinstance(chunk, dict):
+            yield [chunk]
+        elif chunk:
+            yield list(chunk)
+
+
+def iter_provider_pages(provider_type: str, list_id: str) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Iterate over a list's items page by page, whatever protocol its provider uses.
+    
+    v2 providers stream pages as they are parsed; list-returning providers
+    are wrapped and produce their whole list as a single page.
+    
+    Args:
+        provider_type (str): Type of provider
+        list_id (str): List ID or URL
+        
+    Yields:
+        List[Dict[str, Any]]: Media items in list order
+        
+    Raises:
+        ValueError: If provider type is not supported
+    """
+    provider_func = get_provider(provider_type)
+    stream_func = STREAM_PROVIDERS.get(provider_type)
+    
+    if stream_func is not None:
+        yield from _normalize_pages(stream_func(list_id))
+        return
+    
+    media_items = provider_func(list_id)
+    if media_items:
+        yield media_items
+
+
 def get_provider(provider_type: str) -> Callable:
     """
     Get the provider function for a given type.
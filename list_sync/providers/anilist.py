@@ -9,7 +9,8 @@ Supports:
 URL Format: https://anilist.co/user/{username}/animelist/{status}
             https://anilist.co/user/{username}/animelist
 
-The provider resolves anime titles to TMDB IDs via Trakt API for Overseerr compatibility.
+The provider resolves anime to TMDB IDs for Overseerr compatibility, first through
+the offline AniList/MAL mapping and then via Trakt title search for unmapped entries.
 """
 
 import logging
@@ -18,6 +19,8 @@ import requests
 from typing import Dict, Any, List, Optional
 from . import register_provider
 from .trakt import search_trakt_by_title
+from ..utils.anime_mapping import get_anime_mapping
+from ..utils.http_cache import cached_request_json
 
 # AniList GraphQL API endpoint
 ANILIST_GRAPHQL_URL = "https://graphql.anilist.co"
@@ -131,10 +134,8 @@ def fetch_anilist_animelist_graphql(username: str, status_filter: Optional[str]
     try:
         logging.info(f"🔍 AniList API: Fetching anime list for user '{username}'")
         
-        response = requests.post(ANILIST_GRAPHQL_URL, json=payload, timeout=30)
-        response.raise_for_status()
-        
-        data = response.json()
+        # Cached by query and variables; revalidated when AniList sends validators
+        data = cached_request_json('POST', ANILIST_GRAPHQL_URL, json_body=payload, timeout=30)
         
         # Check for GraphQL errors
         if "errors" in data:
@@ -252,7 +253,7 @@ def extract_media_from_anilist_entry(entry: Dict[str, Any]) -> Optional[Dict[str
 @register_provider("anilist")
 def fetch_anilist_list(list_id: str) -> List[Dict[str, Any]]:
     """
-    Fetch anime list from AniList and resolve to TMDB IDs via Trakt.
+    Fetch anime list from AniList and resolve to TMDB IDs via the offline mapping or Trakt.
     
     This is the main entry point for the AniList provider, decorated with @register_provider.
     
@@ -282,6 +283,8 @@ def fetch_anilist_list(list_id: str) -> List[Dict[str, Any]]:
     
     # Extract and normalize media items
     media_items = []
+    mapping = get_anime_mapping()
+    mapped_count = 0
     
     for entry in entries:
         media = extract_media_from_anilist_entry(entry)
@@ -291,14 +294,22 @@ def fetch_anilist_list(list_id: str) -> List[Dict[str, Any]]:
         
         title = media["title"]
         year = media.get("year")
-        
-        # Try to resolve TMDB ID via Trakt API
-        # Try English title first, then Romaji if English fails
+        media_type = "tv"
         tmdb_id = None
         imdb_id = None
         
+        # Attempt 0: offline AniList/MAL → TMDB mapping (no network calls)
+        mapped = mapping.lookup(media.get("anilist_id"), media.get("mal_id")) if mapping else None
+        if mapped:
+            tmdb_id, media_type = mapped
+            mapped_count += 1
+            logging.debug(f"  ✓ Resolved via anime mapping: {title} -> TMDB {tmdb_id} ({media_type})")
+        
+        # Otherwise try to resolve TMDB ID via Trakt API
+        # Try English title first, then Romaji if English fails
+        
         # Attempt 1: English title
-        if media.get("title_english"):
+        if not tmdb_id and media.get("title_english"):
             trakt_result = search_trakt_by_title(media["title_english"], year, "tv")
             if trakt_result and trakt_result.get("tmdb_id"):
                 tmdb_id = trakt_result["tmdb_id"]
@@ -317,7 +328,7 @@ def fetch_anilist_list(list_id: str) -> List[Dict[str, Any]]:
         media_items.append({
             "title": title,
             "year": year,
-            "media_type": "tv",
+            "media_type": media_type,
             "tmdb_id": tmdb_id,
             "imdb_id": imdb_id,
             # Keep AniList metadata for reference
@@ -332,7 +343,7 @@ def fetch_anilist_list(list_id: str) -> List[Dict[str, Any]]:
     
     # Final summary
     resolved_count = sum(1 for m in media_items if m.get("tmdb_id"))
-    logging.info(f"✅ AniList Provider: {len(media_items)} anime processed, {resolved_count} resolved to TMDB IDs ({resolved_count/len(media_items)*100:.1f}%)")
+    logging.info(f"✅ AniList Provider: {len(media_items)} anime processed, {resolved_count} resolved to TMDB IDs ({resolved_count/len(media_items)*100:.1f}%), {mapped_count} from the offline mapping")
     
     return media_items
 
@@ -6,6 +6,7 @@ Loads popular movie collections from JSON file and provides them as a list sourc
 import json
 import logging
 import os
+import threading
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 
@@ -14,59 +15,150 @@ from . import register_provider
 # Path to the popular collections JSON file
 COLLECTIONS_FILE = Path(__file__).parent / "popular-collections-revised.json"
 
-# Cache for loaded collections data
-_collections_cache: Optional[Dict[str, Any]] = None
-_cache_file_mtime: Optional[float] = None
+# Sort modes offered by the collections API: (key, descending)
+COLLECTION_SORTS = {
+    "total_votes": (lambda c: c.get("totalVotes", 0), True),
+    "popularity": (lambda c: c.get("popularityScore", 0), True),
+    "rating": (lambda c: c.get("averageRating", 0), True),
+    "movie_count": (lambda c: c.get("totalMovies", 0), True),
+    "name": (lambda c: c.get("franchise", "").lower(), False),
+}
 
 
-def _load_collections() -> Dict[str, Any]:
-    """Load collections data from JSON file with caching and auto-reload on file change."""
-    global _collections_cache, _cache_file_mtime
+def _pick_representative_movie_id(collection: Dict[str, Any]) -> Optional[int]:
+    """
+    Find the movie ID with the most votes from a collection for poster fetching.
     
-    # Check if file has been modified since last load
-    if _collections_cache is not None and COLLECTIONS_FILE.exists():
-        try:
-            current_mtime = COLLECTIONS_FILE.stat().st_mtime
-            if _cache_file_mtime is not None and current_mtime == _cache_file_mtime:
-                # File hasn't changed, return cached data
-                return _collections_cache
-            # File has changed, clear cache and reload
-            logging.info(f"Collections file modified, reloading...")
-            _collections_cache = None
-        except OSError:
-            # File might have been deleted, clear cache
-            _collections_cache = None
-            _cache_file_mtime = None
+    Special case: Marvel Cinematic Universe uses the 2nd most popular movie
+    to avoid duplicate poster with The Avengers collection.
+    """
+    movie_ratings = collection.get("movieRatings", [])
     
+    # Sort movies by vote count (descending)
+    movies_with_votes = sorted(
+        (movie for movie in movie_ratings if movie.get("voteCount", 0) > 0),
+        key=lambda x: x.get("voteCount", 0),
+        reverse=True
+    )
+    
+    if not movies_with_votes:
+        # Fallback to first movie ID if movieRatings or votes are not available
+        movie_ids = collection.get("movieIds", [])
+        return movie_ids[0] if movie_ids else None
+    
+    # For Marvel Cinematic Universe, use 2nd most popular (index 1)
+    # For all others, use most popular (index 0)
+    use_second_most = collection.get("franchise", "") == "Marvel Cinematic Universe"
+    index = 1 if use_second_most and len(movies_with_votes) > 1 else 0
+    return movies_with_votes[index].get("id")
+
+
+class CollectionsCatalogue:
+    """Collections from the JSON file, indexed by franchise name with precomputed sort orders"""
+    
+    def __init__(self, collections: List[Dict[str, Any]]):
+        """
+        Build the indexes.
+        
+        Args:
+            collections: Collections in file order
+        """
+        self.collections = collections
+        
+        # First collection wins for duplicate names, like the old linear scan
+        self.by_name: Dict[str, Dict[str, Any]] = {}
+        for collection in collections:
+            self.by_name.setdefault(collection.get("franchise"), collection)
+        
+        self.representative_movie_ids = {
+            name: _pick_representative_movie_id(collection) for name, collection in self.by_name.items()
+        }
+        
+        # Each sort order keeps lowercased names alongside for substring search
+        self._sorted = {
+            sort: [
+                (collection.get("franchise", "").lower(), collection)
+                for collection in sorted(collections, key=key, reverse=descending)
+            ]
+            for sort, (key, descending) in COLLECTION_SORTS.items()
+        }
+    
+    def get(self, franchise_name: str) -> Optional[Dict[str, Any]]:
+        """Get a collection by franchise name"""
+        return self.by_name.get(franchise_name)
+    
+    def sorted_by(self, sort: str, search: str = "") -> List[Dict[str, Any]]:
+        """
+        Get collections in a precomputed sort order.
+        
+        Args:
+            sort: One of COLLECTION_SORTS
+            search: Only collections whose franchise name contains this (case-insensitive)
+        
+        Returns:
+            List[Dict[str, Any]]: New list of the shared collection dicts
+        """
+        ordered = self._sorted.get(sort, self._sorted["total_votes"])
+        search = search.strip().lower()
+        if not search:
+            return [collection for _, collection in ordered]
+        return [collection for name, collection in ordered if search in name]
+    
+    def __len__(self) -> int:
+        return len(self.collections)
+
+
+_catalogue: Optional[CollectionsCatalogue] = None
+_catalogue_file_mtime: Optional[float] = None
+_catalogue_lock = threading.Lock()
+
+
+def _read_collections_file() -> List[Dict[str, Any]]:
+    """Load the collections array from the JSON file"""
     try:
         if not COLLECTIONS_FILE.exists():
             logging.error(f"Collections file not found: {COLLECTIONS_FILE}")
-            return {"collections": [], "totalCollections": 0}
+            return []
         
         with open(COLLECTIONS_FILE, 'r', encoding='utf-8') as f:
             data = json.load(f)
-        
-        # Update cache and modification time
-        _collections_cache = data
-        _cache_file_mtime = COLLECTIONS_FILE.stat().st_mtime
-        
-        # Update totalCollections count based on actual collections array length
-        actual_count = len(data.get("collections", []))
-        if "totalCollections" not in data or data.get("totalCollections") != actual_count:
-            data["totalCollections"] = actual_count
-        
-        logging.info(f"Loaded {actual_count} collections from JSON file")
-        return data
+        return data.get("collections", [])
     except Exception as e:
         logging.error(f"Error loading collections file: {str(e)}")
-        return {"collections": [], "totalCollections": 0}
+        return []
+
+
+def get_collections_catalogue() -> CollectionsCatalogue:
+    """
+    Get the collections catalogue, rebuilding it when the JSON file changes.
+    
+    Returns:
+        CollectionsCatalogue: Catalogue of the current file (empty if it cannot be read)
+    """
+    global _catalogue, _catalogue_file_mtime
+    try:
+        current_mtime = COLLECTIONS_FILE.stat().st_mtime
+    except OSError:
+        current_mtime = None
+    
+    with _catalogue_lock:
+        if _catalogue is not None and current_mtime is not None and current_mtime == _catalogue_file_mtime:
+            return _catalogue
+        if _catalogue is not None:
+            logging.info(f"Collections file modified, reloading...")
+        
+        _catalogue = CollectionsCatalogue(_read_collections_file())
+        _catalogue_file_mtime = current_mtime
+        logging.info(f"Loaded {len(_catalogue)} collections from JSON file")
+        return _catalogue
 
 
 def clear_collections_cache():
     """Clear the collections cache to force reload on next access."""
-    global _collections_cache, _cache_file_mtime
-    _collections_cache = None
-    _cache_file_mtime = None
+    global _catalogue, _catalogue_file_mtime
+    with _catalogue_lock:
+        _catalogue = None
+        _catalogue_file_mtime = None
     logging.info("Collections cache cleared")
 
 
@@ -77,8 +169,7 @@ def get_all_collections() -> List[Dict[str, Any]]:
     Returns:
         List[Dict[str, Any]]: List of all collections
     """
-    data = _load_collections()
-    return data.get("collections", [])
+    return list(get_collections_catalogue().collections)
 
 
 def get_collection_by_name(franchise_name: str) -> Optional[Dict[str, Any]]:
@@ -91,11 +182,7 @@ def get_collection_by_name(franchise_name: str) -> Optional[Dict[str, Any]]:
     Returns:
         Optional[Dict[str, Any]]: Collection data or None if not found
     """
-    collections = get_all_collections()
-    for collection in collections:
-        if collection.get("franchise") == franchise_name:
-            return collection
-    return None
+    return get_collections_catalogue().get(franchise_name)
 
 
 def get_oldest_movie_id(collection: Dict[str, Any]) -> Optional[int]:
@@ -112,36 +199,11 @@ def get_oldest_movie_id(collection: Dict[str, Any]) -> Optional[int]:
     Returns:
         Optional[int]: TMDB ID of the movie with most votes (or 2nd for MCU), or None if not found
     """
-    movie_ratings = collection.get("movieRatings", [])
-    if not movie_ratings:
-        # Fallback to movieIds if movieRatings not available
-        movie_ids = collection.get("movieIds", [])
-        return movie_ids[0] if movie_ids else None
-    
-    # Check if this is Marvel Cinematic Universe (use 2nd most popular)
-    franchise = collection.get("franchise", "")
-    use_second_most = (franchise == "Marvel Cinematic Universe")
-    
-    # Sort movies by vote count (descending)
-    movies_with_votes = [
-        movie for movie in movie_ratings 
-        if movie.get("voteCount", 0) > 0
-    ]
-    
-    if not movies_with_votes:
-        # Fallback to first movie ID if no votes found
-        movie_ids = collection.get("movieIds", [])
-        return movie_ids[0] if movie_ids else None
-    
-    # Sort by vote count descending
-    movies_with_votes.sort(key=lambda x: x.get("voteCount", 0), reverse=True)
-    
-    # For Marvel Cinematic Universe, use 2nd most popular (index 1)
-    # For all others, use most popular (index 0)
-    index = 1 if use_second_most and len(movies_with_votes) > 1 else 0
-    
-    selected_movie = movies_with_votes[index]
-    return selected_movie.get("id")
+    catalogue = get_collections_catalogue()
+    franchise = collection.get("franchise")
+    if catalogue.get(franchise) is collection:
+        return catalogue.representative_movie_ids[franchise]
+    return _pick_representative_movie_id(collection)
 
 
 @register_provider("collections")
@@ -2,13 +2,43 @@
 IMDb list provider for ListSync.
 """
 
+import html
+import json
 import logging
 import re
-from typing import List, Dict, Any
-
-from seleniumbase import SB
+import time
+from typing import List, Dict, Any, Optional
 
 from . import register_provider, check_and_raise_if_cancelled, SyncCancelledException
+from ..utils.browser_pool import lease_browser
+from ..utils.scrape_profile import LIGHTWEIGHT_PROFILE
+from ..utils.page_waits import (
+    PageTimer,
+    wait_for_any_selector,
+    wait_for_item_count_stable,
+    wait_for_network_idle,
+)
+
+# Containers that signal an IMDb list page has rendered, in order of preference
+IMDB_LIST_CONTENT_SELECTORS = [
+    '[data-testid="list-page-mc-list-content"]',
+    'ul.ipc-metadata-list',
+    'li.ipc-metadata-list-summary-item',
+]
+IMDB_LIST_ITEM_SELECTOR = "li.ipc-metadata-list-summary-item"
+
+# Reads the Next.js payload and JSON-LD blocks in a single WebDriver round-trip
+_STRUCTURED_DATA_JS = """
+var next = document.getElementById('__NEXT_DATA__');
+var ld = Array.prototype.map.call(
+    document.querySelectorAll('script[type="application/ld+json"]'),
+    function (el) { return el.textContent; }
+);
+return {next: next ? next.textContent : null, ld: ld};
+"""
+
+_IMDB_ID_PATTERN = re.compile(r'^tt\d+$')
+_IMDB_URL_ID_PATTERN = re.compile(r'/title/(tt\d+)')
 
 
 @register_provider("imdb")
@@ -29,7 +59,7 @@ def fetch_imdb_list(list_id: str) -> List[Dict[str, Any]]:
     logging.info(f"Fetching IMDb list: {list_id}")
     
     try:
-        with SB(uc=True, headless=True) as sb:
+        with lease_browser(profile=LIGHTWEIGHT_PROFILE) as sb:
             # Handle full URLs vs list IDs
             if list_id.startswith(('http://', 'https://')):
                 url = list_id.rstrip('/')  # Use the provided URL directly
@@ -53,39 +83,41 @@ def fetch_imdb_list(list_id: str) -> List[Dict[str, Any]]:
                 else:
                     raise ValueError("Invalid IMDb list ID format")
             
-            logging.info(f"Attempting to load URL: {url}")
-            sb.open(url)
-            
-            # Common wait logic for all IMDb pages (both lists and charts)
             logging.info(f"Attempting to load IMDb page: {url}")
+            page_timer = PageTimer("IMDb")
+            page_timer.start(1)
             sb.open(url)
             
-            # Initial wait for page load
-            sb.sleep(5)  # Longer initial wait to ensure page starts loading
+            # Fast path: parse the JSON IMDb embeds in the page instead of walking the DOM
+            structured_items = _fetch_imdb_structured(sb, url, is_chart, page_timer)
+            if structured_items is not None:
+                media_items.extend(structured_items)
+                logging.info(f"Found {len(media_items)} items from IMDb list {list_id} via structured data ({page_timer.summary()})")
+                return media_items
+            
+            logging.info("Structured data unavailable - falling back to DOM selectors")
+            
+            # Let the initial burst of requests settle instead of sleeping for a fixed time
+            wait_for_network_idle(sb, timeout=10)
             
             # Add some human-like scrolling behavior to avoid bot detection
             try:
                 sb.execute_script("window.scrollTo(0, 300);")
-                sb.sleep(1)
                 sb.execute_script("window.scrollTo(0, 600);")
-                sb.sleep(1)
             except Exception as e:
                 logging.warning(f"Could not perform scrolling: {str(e)}")
             
-            # Wait for any potential captcha/anti-bot verification to load
-            sb.sleep(3)
-            
             # Check for cancellation before processing
             check_and_raise_if_cancelled()
             
             if is_chart:
                 # Process chart page (IMDb top charts)
-                media_items.extend(_process_imdb_chart(sb))
+                media_items.extend(_process_imdb_chart(sb, page_timer))
             else:
                 # Process regular list page
-                media_items.extend(_process_imdb_list(sb, url))
+                media_items.extend(_process_imdb_list(sb, url, page_timer))
             
-            logging.info(f"Found {len(media_items)} items from IMDb list {list_id}")
+            logging.info(f"Found {len(media_items)} items from IMDb list {list_id} ({page_timer.summary()})")
             return media_items
     
     except SyncCancelledException:
@@ -97,79 +129,242 @@ def fetch_imdb_list(list_id: str) -> List[Dict[str, Any]]:
         raise
 
 
-def _process_imdb_chart(sb) -> List[Dict[str, Any]]:
+def _fetch_imdb_structured(sb, url: str, is_chart: bool, page_timer: PageTimer) -> Optional[List[Dict[str, Any]]]:
+    """
+    Extract list items from the structured data embedded in IMDb pages.
+    
+    IMDb server-renders its item data into ``__NEXT_DATA__`` (and JSON-LD),
+    so a whole page can be read with one ``execute_script`` and parsed in
+    Python. List pages beyond the first are loaded by URL so each one is
+    server-rendered with its own payload.
+    
+    Args:
+        sb: SeleniumBase instance with the first page already open
+        url: URL of the list or chart
+        is_chart: Whether the page is an IMDb chart
+        page_timer: Timer recording per-page load and parse times
+        
+    Returns:
+        Optional[List[Dict[str, Any]]]: Media items, or None if the fast path
+        could not produce a complete list and the DOM walker should be used
+    """
+    media_items = []
+    seen_ids = set()
+    current_page = 1
+    total_items = None
+    
+    while True:
+        check_and_raise_if_cancelled()
+        page_items, page_total = _extract_imdb_structured_items(sb)
+        page_timer.ready()
+        
+        new_items = [item for item in page_items if item['imdb_id'] not in seen_ids]
+        for item in new_items:
+            seen_ids.add(item['imdb_id'])
+            media_items.append(item)
+        page_timer.finish(len(new_items))
+        
+        if total_items is None:
+            total_items = page_total
+        
+        if not new_items:
+            break
+        if is_chart or not total_items or len(media_items) >= total_items:
+            break
+        
+        # Load the next page by URL so it is server-rendered with fresh structured data
+        current_page += 1
+        page_timer.start(current_page)
+        sb.open(f"{url}/?page={current_page}")
+    
+    if not media_items:
+        return None
+    
+    if total_items and len(media_items) < total_items:
+        logging.warning(f"Structured data yielded {len(media_items)} of {total_items} items - using DOM fallback")
+        if current_page > 1:
+            page_timer.start(1)
+            sb.open(url)
+        return None
+    
+    for item in media_items:
+        logging.debug(f"Added {item['media_type']}: {item['title']} ({item['year']}) (IMDB ID: {item['imdb_id']})")
+    return media_items
+
+
+def _extract_imdb_structured_items(sb) -> tuple:
+    """
+    Read and parse the structured data of the currently open IMDb page.
+    
+    Args:
+        sb: SeleniumBase instance
+        
+    Returns:
+        tuple: (list of media items, total item count reported by the page or None)
+    """
+    try:
+        payload = sb.execute_script(_STRUCTURED_DATA_JS) or {}
+    except Exception as e:
+        logging.debug(f"Could not read IMDb structured data: {e}")
+        return [], None
+    
+    items = []
+    total = None
+    
+    if payload.get('next'):
+        try:
+            items, total = _parse_imdb_next_data(json.loads(payload['next']))
+        except ValueError as e:
+            logging.debug(f"Could not parse IMDb __NEXT_DATA__: {e}")
+    
+    if not items:
+        for block in payload.get('ld') or []:
+            try:
+                items.extend(_parse_imdb_json_ld(json.loads(block)))
+            except ValueError as e:
+                logging.debug(f"Could not parse IMDb JSON-LD block: {e}")
+    
+    return items, total
+
+
+def _parse_imdb_next_data(data: Any) -> tuple:
+    """
+    Collect title entries from an IMDb ``__NEXT_DATA__`` payload.
+    
+    The payload is searched for paginated title searches (objects with an
+    ``edges`` list); the one holding the most titles is the page's main list.
+    This covers lists, watchlists and charts without depending on one page
+    layout, and ignores titles from side panels and recommendations.
+    
+    Args:
+        data: Decoded ``__NEXT_DATA__`` JSON
+        
+    Returns:
+        tuple: (list of media items in page order, total item count or None)
+    """
+    best_items = []
+    best_total = None
+    stack = [data]
+    
+    while stack:
+        node = stack.pop()
+        if isinstance(node, list):
+            stack.extend(node)
+        elif isinstance(node, dict):
+            if isinstance(node.get('edges'), list):
+                items = _collect_imdb_titles(node['edges'])
+                if len(items) > len(best_items):
+                    best_items = items
+                    best_total = node.get('total') if isinstance(node.get('total'), int) else None
+                continue
+            stack.extend(node.values())
+    
+    return best_items, best_total
+
+
+def _collect_imdb_titles(data: Any) -> List[Dict[str, Any]]:
+    """Walk JSON for IMDb title objects (an ``id`` like ``tt0111161`` with a ``titleText``)."""
+    items = []
+    seen_ids = set()
+    stack = [data]
+    
+    while stack:
+        node = stack.pop()
+        if isinstance(node, list):
+            stack.extend(reversed(node))
+            continue
+        if not isinstance(node, dict):
+            continue
+        
+        imdb_id = node.get('id')
+        title_text = node.get('titleText')
+        if isinstance(imdb_id, str) and _IMDB_ID_PATTERN.match(imdb_id) and isinstance(title_text, dict):
+            if imdb_id not in seen_ids and title_text.get('text'):
+                seen_ids.add(imdb_id)
+                title_type = node.get('titleType') or {}
+                release_year = node.get('releaseYear') or {}
+                is_tv = title_type.get('canHaveEpisodes') or title_type.get('id') in ('tvSeries', 'tvMiniSeries')
+                items.append({
+                    "title": title_text['text'].strip(),
+                    "imdb_id": imdb_id,
+                    "media_type": "tv" if is_tv else "movie",
+                    "year": release_year.get('year')
+                })
+            continue
+        
+        stack.extend(reversed(list(node.values())))
+    
+    return items
+
+
+def _parse_imdb_json_ld(data: Any) -> List[Dict[str, Any]]:
+    """
+    Collect title entries from an IMDb JSON-LD ``ItemList`` block.
+    
+    Args:
+        data: Decoded JSON-LD document
+        
+    Returns:
+        List[Dict[str, Any]]: Media items in list order
+    """
+    items = []
+    if not isinstance(data, dict):
+        return items
+    
+    for element in data.get('itemListElement') or []:
+        entry = element.get('item', element) if isinstance(element, dict) else None
+        if not isinstance(entry, dict):
+            continue
+        match = _IMDB_URL_ID_PATTERN.search(entry.get('url') or '')
+        if not match or not entry.get('name'):
+            continue
+        year = None
+        year_match = re.search(r'(\d{4})', str(entry.get('datePublished') or ''))
+        if year_match:
+            year = int(year_match.group(1))
+        items.append({
+            "title": html.unescape(entry['name']).strip(),
+            "imdb_id": match.group(1),
+            "media_type": "tv" if entry.get('@type') in ('TVSeries', 'TVMiniSeries') else "movie",
+            "year": year
+        })
+    return items
+
+
+def _process_imdb_chart(sb, page_timer: PageTimer) -> List[Dict[str, Any]]:
     """
     Process an IMDb chart page.
     
     Args:
         sb: SeleniumBase instance
+        page_timer: Timer recording when the page became ready
         
     Returns:
         List[Dict[str, Any]]: List of media items
     """
     media_items = []
-    chart_found = False
     
-    # Try different approaches to find chart content
-    # First, try direct data-testid selectors
-    data_testid_selectors = [
+    # Wait for whichever chart container renders first (data-testid first, then class-based)
+    chart_selectors = [
         '[data-testid="chart-layout-parent"]',
         '[data-testid="chart-layout-main-column"]',
-        '[data-testid="chart-layout-total-items"]'
+        '[data-testid="chart-layout-total-items"]',
+        'ul.ipc-metadata-list.compact-list-view',
+        'ul.ipc-metadata-list.detailed-list-view',
+        '.ipc-metadata-list.ipc-metadata-list--dividers-between',
+        'ul.ipc-metadata-list'  # Most generic one
     ]
+    matched_selector = wait_for_any_selector(sb, chart_selectors, timeout=10)
+    chart_found = matched_selector is not None
+    if chart_found:
+        logging.info(f"Chart found with selector: {matched_selector}")
     
-    for selector in data_testid_selectors:
-        try:
-            logging.info(f"Trying to find chart with data-testid selector: {selector}")
-            # Use a longer timeout for charts
-            sb.wait_for_element_present(selector, timeout=10)
-            chart_found = True
-            logging.info(f"Chart parent found with selector: {selector}")
-            # Add extra wait after finding the element to ensure it's fully loaded
-            sb.sleep(2)
-            break
-        except Exception as e:
-            logging.warning(f"Could not find chart with data-testid selector {selector}: {str(e)}")
-    
-    # If not found, try different class-based selectors for the list itself
     if not chart_found:
-        class_selectors = [
-            'ul.ipc-metadata-list.compact-list-view',
-            'ul.ipc-metadata-list.detailed-list-view',
-            '.ipc-metadata-list.ipc-metadata-list--dividers-between',
-            'ul.ipc-metadata-list'  # Most generic one
-        ]
-        
-        for selector in class_selectors:
-            try:
-                logging.info(f"Trying to find chart with class selector: {selector}")
-                # Use a longer timeout for charts
-                sb.wait_for_element_present(selector, timeout=10)
-                chart_found = True
-                logging.info(f"Chart found with selector: {selector}")
-                # Add extra wait after finding the element
-                sb.sleep(2)
-                break
-            except Exception as e:
-                logging.warning(f"Could not find chart with class selector {selector}: {str(e)}")
-    
-    if not chart_found:
-        # Try a more aggressive approach with longer waits and more scrolling
+        # Try a more aggressive approach: scroll through the page and wait for it to settle
         logging.warning("Could not find chart with standard selectors, trying more aggressive approach")
-        sb.sleep(8)  # Wait longer for full page load
-        
-        # Add more extensive human-like behavior
-        sb.execute_script("window.scrollTo(0, 300);")
-        sb.sleep(2)
-        sb.execute_script("window.scrollTo(0, 600);")
-        sb.sleep(2)
-        sb.execute_script("window.scrollTo(0, 900);")
-        sb.sleep(2)
-        sb.execute_script("window.scrollTo(0, 1200);")
-        sb.sleep(2)
-        # Scroll back up a bit to simulate natural browsing
-        sb.execute_script("window.scrollTo(0, 800);")
-        sb.sleep(3)
+        for scroll_pos in [300, 600, 900, 1200, 800]:
+            sb.execute_script(f"window.scrollTo(0, {scroll_pos});")
+        wait_for_network_idle(sb, timeout=10)
         
         # Try a very generic selector that should match any list with a much longer timeout
         try:
@@ -191,6 +386,10 @@ def _process_imdb_chart(sb) -> List[Dict[str, Any]]:
     if not chart_found:
         raise ValueError("Could not find chart content on IMDb page after multiple attempts")
     
+    # Wait until the chart has finished rendering its rows
+    wait_for_item_count_stable(sb, "li.ipc-metadata-list-summary-item", timeout=5)
+    page_timer.ready()
+    
     # Get total number of items if possible
     try:
         total_elements = sb.find_elements('[data-testid="chart-layout-total-items"]')
@@ -381,16 +580,53 @@ def _process_imdb_chart(sb) -> List[Dict[str, Any]]:
             logging.warning(f"Failed to parse IMDb chart item: {str(e)}")
             continue
     
+    page_timer.finish(len(media_items))
     return media_items
 
 
-def _process_imdb_list(sb, url) -> List[Dict[str, Any]]:
+def _first_item_href(sb) -> Optional[str]:
+    """Return the title link of the first list row, used to detect page changes."""
+    try:
+        return sb.execute_script(
+            "var a = document.querySelector(arguments[0] + ' a[href*=\"/title/\"]');"
+            "return a ? a.getAttribute('href') : null;",
+            IMDB_LIST_ITEM_SELECTOR
+        )
+    except Exception:
+        return None
+
+
+def _wait_for_imdb_page(sb, previous_first_href: Optional[str] = None, timeout: float = 10) -> None:
+    """
+    Wait for an IMDb list page to render after navigation.
+    
+    Args:
+        sb: SeleniumBase instance
+        previous_first_href: First row link of the previous page; when given, also wait for the rows to change
+        timeout: Maximum seconds to wait for each condition
+        
+    Raises:
+        ValueError: If no list content appears before the timeout
+    """
+    if not wait_for_any_selector(sb, IMDB_LIST_CONTENT_SELECTORS, timeout=timeout):
+        raise ValueError("List content did not load")
+    
+    if previous_first_href:
+        deadline = time.monotonic() + timeout
+        while _first_item_href(sb) == previous_first_href and time.monotonic() < deadline:
+            time.sleep(0.2)
+    
+    wait_for_item_count_stable(sb, IMDB_LIST_ITEM_SELECTOR, timeout=timeout)
+
+
+def _process_imdb_list(sb, url, page_timer: PageTimer) -> List[Dict[str, Any]]:
     """
     Process a regular IMDb list page.
     
     Args:
         sb: SeleniumBase instance
         url: URL of the list
+        page_timer: Timer recording per-page load and parse times
         
     Returns:
         List[Dict[str, Any]]: List of media items
@@ -401,90 +637,49 @@ def _process_imdb_list(sb, url) -> List[Dict[str, Any]]:
         # Wait for list content to load with a more resilient approach
         logging.info("Waiting for list content to load...")
         
-        # Try multiple selector approaches in sequence with longer timeouts
-        content_found = False
-        
-        # First try the data-testid attribute
-        try:
-            logging.info("Looking for content by data-testid attribute...")
-            sb.wait_for_element_present('[data-testid="list-page-mc-list-content"]', timeout=10)
-            content_found = True
-            logging.info("Found content by data-testid attribute")
-            # Add extra wait after finding the element
-            sb.sleep(2)
-        except Exception as e:
-            logging.warning(f"Could not find content by data-testid: {str(e)}")
-        
-        # If that fails, try looking for the list element directly
-        if not content_found:
-            try:
-                logging.info("Looking for list element directly...")
-                sb.wait_for_element_present("ul.ipc-metadata-list", timeout=10)
-                content_found = True
-                logging.info("Found list element directly")
-                # Add extra wait after finding the element
-                sb.sleep(2)
-            except Exception as e:
-                logging.warning(f"Could not find list element: {str(e)}")
-        
-        # If that also fails, try looking for list items
-        if not content_found:
-            try:
-                logging.info("Looking for list items...")
-                sb.wait_for_element_present("li.ipc-metadata-list-summary-item", timeout=10)
-                content_found = True
-                logging.debug("Found list items")
-                # Add extra wait after finding the element
-                sb.sleep(2)
-            except Exception as e:
-                logging.warning(f"Could not find list items: {str(e)}")
+        # Return as soon as any of the known content containers is present
+        matched_selector = wait_for_any_selector(sb, IMDB_LIST_CONTENT_SELECTORS, timeout=10)
+        content_found = matched_selector is not None
+        if content_found:
+            logging.info(f"Found list content using selector: {matched_selector}")
         
-        # If everything fails, try a more aggressive approach with longer waits and scrolling
+        # If everything fails, try a more aggressive approach with scrolling and a reload
         if not content_found:
             logging.warning("Could not find list content, attempting more aggressive approach...")
-            # Scroll more and wait longer
-            sb.sleep(8)
             
             # Add more extensive human-like behavior
-            sb.execute_script("window.scrollTo(0, 300);")
-            sb.sleep(2)
-            sb.execute_script("window.scrollTo(0, 600);")
-            sb.sleep(2)
-            sb.execute_script("window.scrollTo(0, 900);")
-            sb.sleep(2)
-            sb.execute_script("window.scrollTo(0, 1200);")
-            sb.sleep(2)
-            # Scroll back up a bit to simulate natural browsing
-            sb.execute_script("window.scrollTo(0, 800);")
-            sb.sleep(3)
+            for scroll_pos in [300, 600, 900, 1200, 800]:
+                sb.execute_script(f"window.scrollTo(0, {scroll_pos});")
             
             # Reload the page to handle potential temporary glitches
             sb.open(url)
-            sb.sleep(10)  # Wait longer after reload
+            wait_for_network_idle(sb, timeout=15)
+            content_found = wait_for_any_selector(sb, IMDB_LIST_CONTENT_SELECTORS, timeout=5) is not None
             
             # Try once more with very generic selectors and longer timeouts
-            try:
-                # Try to find any ul element with items
-                sb.wait_for_element_present("ul", timeout=15)
-                uls = sb.find_elements("ul")
-                for ul in uls:
-                    try:
-                        items = ul.find_elements("css selector", "li")
-                        if len(items) > 5:  # If we find a list with several items, it's likely our list
-                            logging.info(f"Found a ul with {len(items)} items, likely our list content")
-                            content_found = True
-                            break
-                    except Exception:
-                        pass
-                
-                if not content_found:
+            if not content_found:
+                try:
+                    # Try to find any ul element with items
+                    sb.wait_for_element_present("ul", timeout=15)
+                    uls = sb.find_elements("ul")
+                    for ul in uls:
+                        try:
+                            items = ul.find_elements("css selector", "li")
+                            if len(items) > 5:  # If we find a list with several items, it's likely our list
+                                logging.info(f"Found a ul with {len(items)} items, likely our list content")
+                                content_found = True
+                                break
+                        except Exception:
+                            pass
+                    
+                    if not content_found:
+                        raise ValueError("Could not find list content on IMDb page after multiple attempts")
+                except Exception as e:
+                    logging.error(f"Could not find any list content after multiple attempts: {str(e)}")
                     raise ValueError("Could not find list content on IMDb page after multiple attempts")
-            except Exception as e:
-                logging.error(f"Could not find any list content after multiple attempts: {str(e)}")
-                raise ValueError("Could not find list content on IMDb page after multiple attempts")
         
-        # Additional wait to ensure everything is loaded
-        sb.sleep(3)
+        # Wait until the rendered rows stop changing instead of sleeping
+        wait_for_item_count_stable(sb, IMDB_LIST_ITEM_SELECTOR, timeout=8)
     
     except Exception as e:
         logging.error(f"Failed to load IMDb list page: {str(e)}")
@@ -554,6 +749,8 @@ def _process_imdb_list(sb, url) -> List[Dict[str, Any]]:
     while True:
         # Check for cancellation at the start of each page
         check_and_raise_if_cancelled()
+        page_timer.ready()
+        items_before_page = len(media_items)
         # Try multiple approaches to find list items
         items = []
         
@@ -596,8 +793,11 @@ def _process_imdb_list(sb, url) -> List[Dict[str, Any]]:
                 next_page = current_page + 1
                 next_url = f"{url}/?page={next_page}"
                 logging.info(f"Attempting to navigate directly to page {next_page}: {next_url}")
+                page_timer.finish(0)
+                page_timer.start(next_page)
                 sb.open(next_url)
-                sb.sleep(5)  # Wait longer for page load
+                wait_for_any_selector(sb, IMDB_LIST_CONTENT_SELECTORS, timeout=10)
+                wait_for_item_count_stable(sb, IMDB_LIST_ITEM_SELECTOR, timeout=8)
                 current_page += 1
                 continue
             else:
@@ -728,6 +928,8 @@ def _process_imdb_list(sb, url) -> List[Dict[str, Any]]:
                 logging.warning(f"Failed to parse IMDb item: {str(e)}")
                 continue
         
+        page_timer.finish(len(media_items) - items_before_page)
+        
         # Check if we've processed all expected pages
         if expected_pages and current_page >= expected_pages:
             logging.info(f"Reached final page {current_page} of {expected_pages}")
@@ -757,13 +959,13 @@ def _process_imdb_list(sb, url) -> List[Dict[str, Any]]:
                         break
                     
                     # Button is enabled, so click it
+                    previous_first_href = _first_item_href(sb)
+                    page_timer.start(current_page + 1)
                     sb.execute_script("arguments[0].scrollIntoView(true);", next_button)
-                    sb.sleep(1)  # Give time for scrolling
                     next_button.click()
                     
-                    # Wait for loading spinner to disappear and content to load
-                    sb.wait_for_element_present('[data-testid="list-page-mc-list-content"]', timeout=10)
-                    sb.sleep(3)  # Additional wait for content to fully render
+                    # Wait for the rows of the next page to replace the current ones
+                    _wait_for_imdb_page(sb, previous_first_href)
                     
                     # Verify we have items on the page
                     new_items = sb.find_elements("css selector", "li.ipc-metadata-list-summary-item")
@@ -773,20 +975,18 @@ def _process_imdb_list(sb, url) -> List[Dict[str, Any]]:
                         next_page = current_page + 1
                         next_url = f"{url}/?page={next_page}"
                         sb.open(next_url)
-                        sb.wait_for_element_present('[data-testid="list-page-mc-list-content"]', timeout=10)
-                        sb.sleep(3)
+                        _wait_for_imdb_page(sb)
             except Exception as e:
                 logging.info(f"Could not click next button: {str(e)}")
                 # Fall back to direct URL navigation
                 next_page = current_page + 1
                 next_url = f"{url}/?page={next_page}"
                 logging.info(f"Attempting to navigate directly to page {next_page}: {next_url}")
+                page_timer.start(next_page)
                 sb.open(next_url)
-                sb.wait_for_element_present('[data-testid="list-page-mc-list-content"]', timeout=10)
-                sb.sleep(3)
+                _wait_for_imdb_page(sb)
             
             current_page += 1
-            sb.sleep(2)
         except Exception as e:
             logging.info(f"No more pages available: {str(e)}")
             break
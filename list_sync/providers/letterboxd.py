@@ -3,12 +3,74 @@ Letterboxd provider for ListSync.
 """
 
 import logging
+import os
 import re
-from typing import List, Dict, Any
-
-from seleniumbase import SB
+import requests
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from html.parser import HTMLParser
+from typing import List, Dict, Any, Optional, Tuple
 
 from . import register_provider, check_and_raise_if_cancelled, SyncCancelledException
+from ..utils.browser_pool import lease_browser
+from ..utils.scrape_profile import LIGHTWEIGHT_PROFILE
+from ..utils.dom_extract import extract_items, field
+from ..utils.rate_limiter import get_rate_limiter, parse_retry_after
+
+LETTERBOXD_RATE_LIMIT_PER_SECOND = 4
+LETTERBOXD_MAX_CONCURRENCY = int(os.getenv('LISTSYNC_LETTERBOXD_CONCURRENCY', '4') or '4')
+LETTERBOXD_HEADERS = {
+    'User-Agent': ('Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+                   '(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'),
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+}
+
+# Markers of a bot-challenge interstitial instead of the real page
+_CHALLENGE_MARKERS = ('cf-chl', 'challenge-platform', 'Just a moment...')
+_PAGINATION_PATTERN = re.compile(r'class="[^"]*\bpagination\b')
+_PAGE_LINK_PATTERN = re.compile(r'href="[^"]*/page/(\d+)/?"')
+
+# Bulk extraction specs for the browser fallback
+LETTERBOXD_LIST_SPEC = {
+    'item_name': field(attr='data-item-name'),
+    'film_id': field(attr='data-film-id'),
+    'slug': field(attr='data-item-slug'),
+}
+LETTERBOXD_WATCHLIST_SPEC = {
+    **LETTERBOXD_LIST_SPEC,
+    'react_found': field('div.react-component', 'class'),
+    'react_item_name': field('div.react-component', 'data-item-name'),
+    'react_film_id': field('div.react-component', 'data-film-id'),
+    'react_slug': field('div.react-component', 'data-item-slug'),
+}
+
+
+class LetterboxdBlockedError(Exception):
+    """Raised when Letterboxd refuses a plain HTTP request"""
+    pass
+
+
+class _LetterboxdItemParser(HTMLParser):
+    """Collects poster attributes from server-rendered Letterboxd list HTML"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.items = []
+        self._seen = set()
+
+    def handle_starttag(self, tag, attrs):
+        attributes = dict(attrs)
+        item_name = attributes.get('data-item-name')
+        if not item_name:
+            return
+        film_id = attributes.get('data-film-id')
+        slug = attributes.get('data-item-slug')
+        # A film can be rendered by more than one element (poster and detail figure)
+        key = film_id or slug or item_name
+        if key in self._seen:
+            return
+        self._seen.add(key)
+        self.items.append({'item_name': item_name, 'film_id': film_id, 'slug': slug})
 
 
 def _determine_media_type(title: str) -> str:
@@ -56,7 +118,10 @@ def _determine_media_type(title: str) -> str:
 @register_provider("letterboxd")
 def fetch_letterboxd_list(list_id: str) -> List[Dict[str, Any]]:
     """
-    Fetch Letterboxd list using Selenium with pagination, supporting both regular lists and watchlists
+    Fetch Letterboxd list with pagination, supporting both regular lists and watchlists.
+    
+    Pages are fetched over plain HTTP and parsed from the server-rendered HTML;
+    a Selenium session is only used when that fast path is blocked.
     
     Args:
         list_id (str): Letterboxd list ID (username/list-slug) or full URL
@@ -64,26 +129,199 @@ def fetch_letterboxd_list(list_id: str) -> List[Dict[str, Any]]:
     Returns:
         List[Dict[str, Any]]: List of media items
     """
-    media_items = []
     logging.info(f"Fetching Letterboxd list: {list_id}")
     
+    # Handle full URLs vs list IDs
+    if list_id.startswith(('http://', 'https://')):
+        base_url = list_id.rstrip('/')
+    else:
+        base_url = f"https://letterboxd.com/{list_id}"
+    
+    # Determine if this is a watchlist or regular list
+    is_watchlist = '/watchlist' in base_url or list_id.endswith('/watchlist')
+    
+    # Use detail view for better data extraction (only for custom lists, not watchlists)
+    if not is_watchlist and not base_url.endswith('/detail/'):
+        base_url = f"{base_url}/detail/"
+    
+    logging.info(f"Processing Letterboxd {'watchlist' if is_watchlist else 'list'}: {base_url}")
+    
+    if is_letterboxd_http_enabled():
+        try:
+            media_items = _fetch_letterboxd_http(base_url, is_watchlist)
+            if media_items is not None:
+                return media_items
+        except SyncCancelledException:
+            raise
+        except Exception as e:
+            logging.warning(f"⚠️ Letterboxd HTTP fetch failed ({str(e)}), falling back to browser")
+    
+    return _fetch_letterboxd_selenium(base_url, is_watchlist)
+
+
+def is_letterboxd_http_enabled() -> bool:
+    """
+    Check whether Letterboxd lists should be fetched over plain HTTP first.
+    
+    Returns:
+        bool: False if LISTSYNC_LETTERBOXD_HTTP is set to 'false'
+    """
+    return os.getenv('LISTSYNC_LETTERBOXD_HTTP', 'true').lower() != 'false'
+
+
+def _letterboxd_page_url(base_url: str, page: int, is_watchlist: bool) -> str:
+    """Build the URL of a given list page"""
+    if page == 1:
+        return base_url
+    if is_watchlist:
+        return f"{base_url}/page/{page}/"
+    return f"{base_url}page/{page}/"
+
+
+def _fetch_letterboxd_http(base_url: str, is_watchlist: bool) -> Optional[List[Dict[str, Any]]]:
+    """
+    Fetch Letterboxd list pages over HTTP and parse them without a browser.
+    
+    Page 1 is fetched first to read the page count from the pagination links;
+    the remaining pages are then fetched concurrently and reassembled in order.
+    
+    Args:
+        base_url (str): Normalized list URL (detail view for custom lists)
+        is_watchlist (bool): Whether the URL is a watchlist
+        
+    Returns:
+        Optional[List[Dict[str, Any]]]: List of media items, or None if the
+        first page did not contain any items and the browser should be used
+    """
+    with requests.Session() as session:
+        session.headers.update(LETTERBOXD_HEADERS)
+        
+        first_page = _fetch_letterboxd_page(session, base_url)
+        page_items, last_page = _parse_letterboxd_page(first_page)
+        if not page_items:
+            logging.info("No items in server-rendered Letterboxd page, falling back to browser")
+            return None
+        
+        pages = {1: page_items}
+        if last_page > 1:
+            max_workers = min(LETTERBOXD_MAX_CONCURRENCY, last_page - 1)
+            logging.info(f"Fetching {last_page - 1} additional Letterboxd pages with {max_workers} workers...")
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(
+                        _fetch_letterboxd_page, session, _letterboxd_page_url(base_url, page, is_watchlist)
+                    ): page
+                    for page in range(2, last_page + 1)
+                }
+                for future in as_completed(futures):
+                    check_and_raise_if_cancelled()
+                    # A blocked or failed page propagates so the browser refetches the whole list
+                    pages[futures[future]] = _parse_letterboxd_page(future.result())[0]
+    
+    media_items = []
+    for page in sorted(pages):
+        for raw_item in pages[page]:
+            title, year = _parse_item_name(raw_item['item_name'])
+            if not title:
+                logging.warning("Skipping item with empty title")
+                continue
+            media_items.append({
+                "title": title,
+                "media_type": "movie",
+                "year": year,
+                "film_id": raw_item['film_id'],
+                "slug": raw_item['slug']
+            })
+    
+    logging.info(f"Letterboxd list fetched over HTTP. Found {len(media_items)} items across {len(pages)} pages.")
+    return media_items
+
+
+def _fetch_letterboxd_page(session: requests.Session, url: str) -> str:
+    """
+    Fetch one Letterboxd page through the shared rate limiter
+    
+    Args:
+        session (requests.Session): Pooled HTTP session
+        url (str): Page URL
+        
+    Returns:
+        str: Page HTML
+        
+    Raises:
+        LetterboxdBlockedError: If the request was refused or challenged
+    """
+    limiter = get_rate_limiter('letterboxd', LETTERBOXD_RATE_LIMIT_PER_SECOND, burst=LETTERBOXD_MAX_CONCURRENCY)
+    limiter.acquire()
+    logging.info(f"Loading URL: {url}")
+    response = session.get(url, timeout=30)
+    
+    if response.status_code in (403, 429, 503):
+        if response.status_code == 429:
+            limiter.penalize(parse_retry_after(response.headers.get('Retry-After'), 5))
+        raise LetterboxdBlockedError(f"HTTP {response.status_code} for {url}")
+    response.raise_for_status()
+    
+    page_html = response.text
+    if any(marker in page_html for marker in _CHALLENGE_MARKERS):
+        raise LetterboxdBlockedError(f"Challenge page returned for {url}")
+    return page_html
+
+
+def _parse_letterboxd_page(page_html: str) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Parse poster attributes and the last page number from Letterboxd HTML
+    
+    Args:
+        page_html (str): Page HTML
+        
+    Returns:
+        Tuple[List[Dict[str, Any]], int]: Raw items in page order and the last page number
+    """
+    parser = _LetterboxdItemParser()
+    parser.feed(page_html)
+    parser.close()
+    
+    last_page = 1
+    pagination = _PAGINATION_PATTERN.search(page_html)
+    if pagination:
+        page_numbers = [int(n) for n in _PAGE_LINK_PATTERN.findall(page_html, pagination.start(), pagination.start() + 20000)]
+        last_page = max(page_numbers + [1])
+    
+    return parser.items, last_page
+
+
+def _parse_item_name(item_name: str) -> Tuple[str, Optional[int]]:
+    """
+    Split a Letterboxd item name of the form "Title (Year)"
+    
+    Args:
+        item_name (str): Value of the data-item-name attribute
+        
+    Returns:
+        Tuple[str, Optional[int]]: Title and year (None if absent)
+    """
+    year_match = re.search(r'(.+?)\s*\((\d{4})\)', item_name)
+    if year_match:
+        return year_match.group(1).strip(), int(year_match.group(2))
+    return item_name.strip(), None
+
+
+def _fetch_letterboxd_selenium(base_url: str, is_watchlist: bool) -> List[Dict[str, Any]]:
+    """
+    Fetch Letterboxd list pages by driving a headless browser
+    
+    Args:
+        base_url (str): Normalized list URL (detail view for custom lists)
+        is_watchlist (bool): Whether the URL is a watchlist
+        
+    Returns:
+        List[Dict[str, Any]]: List of media items
+    """
+    media_items = []
+    
     try:
-        with SB(uc=True, headless=True) as sb:
-            # Handle full URLs vs list IDs
-            if list_id.startswith(('http://', 'https://')):
-                base_url = list_id.rstrip('/')
-            else:
-                base_url = f"https://letterboxd.com/{list_id}"
-            
-            # Determine if this is a watchlist or regular list
-            is_watchlist = '/watchlist' in base_url or list_id.endswith('/watchlist')
-            
-            # Use detail view for better data extraction (only for custom lists, not watchlists)
-            if not is_watchlist and not base_url.endswith('/detail/'):
-                base_url = f"{base_url}/detail/"
-            
-            logging.info(f"Processing Letterboxd {'watchlist' if is_watchlist else 'list'}: {base_url}")
-            
+        with lease_browser(profile=LIGHTWEIGHT_PROFILE) as sb:
             page = 1
             next_page_url = None  # Track the next page URL
             while True:
@@ -137,12 +375,12 @@ def fetch_letterboxd_list(list_id: str) -> List[Dict[str, Any]]:
                 logging.info("Extracting data from attributes...")
                 
                 if is_watchlist:
-                    # Watchlists use li.griditem structure
-                    figures = sb.find_elements("li.griditem")
+                    # Watchlists use li.griditem structure with the data on a react-component div
+                    figures = extract_items(sb, "li.griditem", LETTERBOXD_WATCHLIST_SPEC)
                     logging.info(f"Found {len(figures)} grid items (watchlist)")
                 else:
                     # Custom lists use detail view with figures
-                    figures = sb.find_elements("div.react-component.figure[data-item-name]")
+                    figures = extract_items(sb, "div.react-component.figure[data-item-name]", LETTERBOXD_LIST_SPEC)
                     logging.info(f"Found {len(figures)} figures (custom list)")
                 
                 # If we find 0 items, we've gone too far - break
@@ -156,34 +394,17 @@ def fetch_letterboxd_list(list_id: str) -> List[Dict[str, Any]]:
                         check_and_raise_if_cancelled()
                     
                     try:
-                        # Extract data - different attributes for watchlist vs custom list
-                        if is_watchlist:
-                            # For watchlists, find the react-component div within the grid item
-                            try:
-                                react_div = figure.find_element("css selector", "div.react-component")
-                            except:
-                                react_div = figure
-                            
-                            item_name = react_div.get_attribute("data-item-name")
-                            film_id = react_div.get_attribute("data-film-id")
-                            slug = react_div.get_attribute("data-item-slug")
-                        else:
-                            # For custom lists, use the figure element directly
-                            item_name = figure.get_attribute("data-item-name")
-                            film_id = figure.get_attribute("data-film-id")
-                            slug = figure.get_attribute("data-item-slug")
+                        # Watchlist grid items fall back to their own attributes without a react-component div
+                        prefix = 'react_' if is_watchlist and figure.get('react_found') else ''
+                        item_name = figure.get(f"{prefix}item_name")
+                        film_id = figure.get(f"{prefix}film_id")
+                        slug = figure.get(f"{prefix}slug")
                         
                         if not item_name:
                             continue
                         
                         # Parse title and year (format: "Title (Year)")
-                        year_match = re.search(r'(.+?)\s*\((\d{4})\)', item_name)
-                        if year_match:
-                            title = year_match.group(1).strip()
-                            year = int(year_match.group(2))
-                        else:
-                            title = item_name
-                            year = None
+                        title, year = _parse_item_name(item_name)
                         
                         # Skip items with empty titles
                         if not title:
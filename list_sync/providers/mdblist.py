@@ -4,17 +4,28 @@ MDBList provider for ListSync.
 
 import logging
 import re
-from typing import List, Dict, Any
-
-from seleniumbase import SB
+import requests
+from typing import List, Dict, Any, Optional
 
 from . import register_provider
+from ..utils.browser_pool import lease_browser
+from ..utils.dom_extract import extract_items, field
+from ..utils.http_cache import cached_get_json
+
+MDBLIST_HEADERS = {'Accept': 'application/json'}
+
+# Fields read from each MDBList card in a single round-trip
+MDBLIST_CARD_SPEC = {
+    'title': field('.header.movie-title'),
+    # First link pointing at a movie or show page, in document order
+    'href': field('a[href*="/movie/"], a[href*="/show/"]', 'href'),
+}
 
 
 @register_provider("mdblist")
 def fetch_mdblist_list(list_id: str) -> List[Dict[str, Any]]:
     """
-    Fetch MDBList list using Selenium with infinite scrolling support
+    Fetch MDBList list from its JSON export, falling back to Selenium with infinite scrolling
     
     Args:
         list_id (str): MDBList list ID in format 'username/listname' or full URL
@@ -25,24 +36,113 @@ def fetch_mdblist_list(list_id: str) -> List[Dict[str, Any]]:
     Raises:
         ValueError: If list ID format is invalid
     """
-    media_items = []
     logging.info(f"Fetching MDBList: {list_id}")
     
+    # Handle full URLs vs list IDs
+    if list_id.startswith(('http://', 'https://')):
+        url = list_id.rstrip('/')  # Use the provided URL directly
+        if 'mdblist.com/lists/' not in url:
+            raise ValueError("Invalid MDBList URL format")
+    else:
+        # Assume it's a username/listname format
+        parts = list_id.split('/')
+        if len(parts) == 2:
+            url = f"https://mdblist.com/lists/{parts[0]}/{parts[1]}"
+        else:
+            raise ValueError("Invalid MDBList format - must be 'username/listname' or a full URL")
+    
     try:
-        with SB(uc=True, headless=True) as sb:
-            # Handle full URLs vs list IDs
-            if list_id.startswith(('http://', 'https://')):
-                url = list_id.rstrip('/')  # Use the provided URL directly
-                if 'mdblist.com/lists/' not in url:
-                    raise ValueError("Invalid MDBList URL format")
-            else:
-                # Assume it's a username/listname format
-                parts = list_id.split('/')
-                if len(parts) == 2:
-                    url = f"https://mdblist.com/lists/{parts[0]}/{parts[1]}"
-                else:
-                    raise ValueError("Invalid MDBList format - must be 'username/listname' or a full URL")
-            
+        media_items = _fetch_mdblist_json(url)
+        if media_items:
+            return media_items
+        logging.info("MDBList JSON export returned no items, falling back to browser")
+    except Exception as e:
+        logging.warning(f"⚠️ MDBList JSON fetch failed ({str(e)}), falling back to browser")
+    
+    return _fetch_mdblist_selenium(url)
+
+
+def _fetch_mdblist_json(url: str) -> List[Dict[str, Any]]:
+    """
+    Fetch MDBList list contents from the list's JSON export.
+    
+    The export already carries IMDb and TMDB IDs, so items resolve by direct
+    TMDB ID lookup during sync. The request is revalidated against the
+    conditional-request cache when LISTSYNC_HTTP_CACHE is enabled.
+    
+    Args:
+        url (str): MDBList list URL
+        
+    Returns:
+        List[Dict[str, Any]]: List of media items
+    """
+    json_url = f"{url}/json"
+    logging.info(f"Fetching MDBList JSON export: {json_url}")
+    
+    with requests.Session() as session:
+        data = cached_get_json(json_url, headers=MDBLIST_HEADERS, session=session)
+    
+    if not isinstance(data, list):
+        raise ValueError(f"Unexpected MDBList JSON response type: {type(data).__name__}")
+    
+    media_items = []
+    for entry in data:
+        item = _process_mdblist_json_item(entry)
+        if item:
+            media_items.append(item)
+    
+    logging.info(f"MDBList fetched from JSON export. Found {len(media_items)} items.")
+    return media_items
+
+
+def _process_mdblist_json_item(entry: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Convert an MDBList JSON export entry into a media item.
+    
+    Args:
+        entry (Dict[str, Any]): Export entry
+        
+    Returns:
+        Optional[Dict[str, Any]]: Media item, or None if the entry has no title
+    """
+    title = (entry.get('title') or '').strip()
+    if not title:
+        logging.warning("Skipping item with empty title")
+        return None
+    
+    media_type = "tv" if entry.get('mediatype') in ('show', 'tv') else "movie"
+    # The export's `id` is the TMDB ID
+    tmdb_id = entry.get('tmdb_id') or entry.get('id')
+    
+    year = entry.get('release_year')
+    try:
+        year = int(year) if year else None
+    except (ValueError, TypeError):
+        year = None
+    
+    return {
+        "title": title,
+        "imdb_id": entry.get('imdb_id') or None,
+        "tmdb_id": tmdb_id,
+        "media_type": media_type,
+        "year": year
+    }
+
+
+def _fetch_mdblist_selenium(url: str) -> List[Dict[str, Any]]:
+    """
+    Fetch MDBList list using Selenium with infinite scrolling support
+    
+    Args:
+        url (str): MDBList list URL
+        
+    Returns:
+        List[Dict[str, Any]]: List of media items
+    """
+    media_items = []
+    
+    try:
+        with lease_browser() as sb:
             logging.info(f"Attempting to load URL: {url}")
             sb.open(url)
             
@@ -65,7 +165,7 @@ def fetch_mdblist_list(list_id: str) -> List[Dict[str, Any]]:
                 new_height = sb.execute_script("return document.body.scrollHeight")
                 
                 # Count current number of items
-                current_items = len(sb.find_elements(".header.movie-title"))
+                current_items = sb.execute_script("return document.querySelectorAll('.header.movie-title').length;")
                 
                 if new_height == last_height and current_items == items_count:
                     # If heights are the same and no new items, we've reached the end
@@ -77,40 +177,35 @@ def fetch_mdblist_list(list_id: str) -> List[Dict[str, Any]]:
                 logging.info(f"Scrolled and found {items_count} items so far, continuing...")
             
             # Now extract all items using .card selector (more reliable)
-            items = sb.find_elements(".card")
+            items = extract_items(sb, ".card", MDBLIST_CARD_SPEC)
             logging.info(f"Found {len(items)} total card items on the page")
             
             for item in items:
                 try:
                     # Check if this card has a movie title (skip non-movie cards)
-                    title_elem = item.find_element("css selector", ".header.movie-title")
-                    if not title_elem:
+                    if item['title'] is None:
                         logging.debug("Skipping card without movie title")
                         continue
                     
                     # Extract media type from link
-                    links = item.find_elements("css selector", "a")
+                    href = item['href']
                     media_type = "unknown"
                     imdb_id = None
                     
-                    for link in links:
-                        href = link.get_attribute("href")
-                        if href:
-                            if "/movie/" in href:
-                                media_type = "movie"
-                                imdb_match = re.search(r'/movie/(tt\d+)', href)
-                                if imdb_match:
-                                    imdb_id = imdb_match.group(1)
-                                break
-                            elif "/show/" in href:
-                                media_type = "tv"
-                                imdb_match = re.search(r'/show/(tt\d+)', href)
-                                if imdb_match:
-                                    imdb_id = imdb_match.group(1)
-                                break
+                    if href:
+                        if "/movie/" in href:
+                            media_type = "movie"
+                            imdb_match = re.search(r'/movie/(tt\d+)', href)
+                            if imdb_match:
+                                imdb_id = imdb_match.group(1)
+                        elif "/show/" in href:
+                            media_type = "tv"
+                            imdb_match = re.search(r'/show/(tt\d+)', href)
+                            if imdb_match:
+                                imdb_id = imdb_match.group(1)
                     
                     # Extract title and year
-                    full_title = title_elem.text.strip()
+                    full_title = item['title'].strip()
                     # Parse title and year (format: "Title (Year)")
                     year_match = re.search(r'(.+?)\s*\((\d{4})\)', full_title)
                     if year_match:
@@ -3,19 +3,33 @@ SIMKL list provider for ListSync.
 Uses official SIMKL API for authenticated user watchlists.
 """
 
+import hashlib
+import json
 import logging
 import os
+import threading
 import time
 from typing import List, Dict, Any, Optional
 
 import requests
 from . import register_provider
+from ..utils.logger import DATA_DIR
+from ..utils.rate_limiter import parse_retry_after
 
 # SIMKL API configuration
 SIMKL_API_BASE = "https://api.simkl.com"
 SIMKL_CLIENT_ID = os.getenv('SIMKL_CLIENT_ID')
 SIMKL_USER_TOKEN = os.getenv('SIMKL_USER_TOKEN')
 
+# Last activity timestamps and item snapshots from the previous fetch
+SIMKL_STATE_FILE = os.path.join(DATA_DIR, "simkl_sync_state.json")
+SIMKL_WATCHLIST_STATUSES = ('watching', 'plantowatch', 'completed', 'hold', 'dropped')
+# all-items media type -> section of the /sync/activities response
+SIMKL_ACTIVITY_SECTIONS = {'movies': 'movies', 'shows': 'tv_shows', 'anime': 'anime'}
+
+# SIMKL lists are fetched concurrently; serializes read-merge-write of the state file
+_simkl_state_lock = threading.Lock()
+
 
 def get_simkl_headers() -> Dict[str, str]:
     """Get headers for SIMKL API requests."""
@@ -29,10 +43,123 @@ def get_simkl_headers() -> Dict[str, str]:
     }
 
 
+def _simkl_get(url: str, params: Optional[Dict[str, Any]] = None) -> requests.Response:
+    """GET a SIMKL API URL, waiting out a single HTTP 429."""
+    response = requests.get(url, headers=get_simkl_headers(), params=params, timeout=30)
+    
+    # Handle rate limiting
+    if response.status_code == 429:
+        retry_after = parse_retry_after(response.headers.get('Retry-After'), 10)
+        logging.warning(f"⚠️  SIMKL API rate limit hit. Waiting {retry_after:.0f} seconds...")
+        time.sleep(retry_after)
+        response = requests.get(url, headers=get_simkl_headers(), params=params, timeout=30)
+    
+    return response
+
+
+def _get_simkl_activities() -> Optional[Dict[str, Any]]:
+    """
+    Fetch the user's last-activity timestamps from SIMKL.
+    
+    Returns:
+        Optional[Dict[str, Any]]: Activity timestamps per section, or None on failure
+    """
+    url = f"{SIMKL_API_BASE}/sync/activities"
+    try:
+        response = _simkl_get(url)
+        if response.status_code == 405:
+            # Some API deployments only accept POST for this endpoint
+            response = requests.post(url, headers=get_simkl_headers(), timeout=30)
+        response.raise_for_status()
+        return response.json()
+    except Exception as e:
+        logging.warning(f"⚠️  SIMKL API: Could not fetch activities, doing a full fetch: {str(e)}")
+        return None
+
+
+def _load_simkl_state() -> Dict[str, Any]:
+    """Load the stored activity timestamps and item snapshots for the configured user."""
+    try:
+        with open(SIMKL_STATE_FILE, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    
+    # Snapshots belong to one SIMKL account
+    if state.get('token_hash') != _token_hash():
+        return {}
+    return state.get('types', {})
+
+
+def _update_simkl_state(media_type: str, entry: Dict[str, Any]) -> None:
+    """Store one media type's activity and snapshot, keeping the other types' entries."""
+    with _simkl_state_lock:
+        types = _load_simkl_state()
+        types[media_type] = entry
+        _save_simkl_state(types)
+
+
+def _save_simkl_state(types: Dict[str, Any]) -> None:
+    """Atomically write the activity timestamps and item snapshots."""
+    tmp_path = f"{SIMKL_STATE_FILE}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(SIMKL_STATE_FILE), exist_ok=True)
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'token_hash': _token_hash(), 'types': types}, f)
+        os.replace(tmp_path, SIMKL_STATE_FILE)
+    except OSError as e:
+        logging.warning(f"Could not write SIMKL state file: {e}")
+
+
+def _token_hash() -> str:
+    return hashlib.sha256(f"{SIMKL_CLIENT_ID}:{SIMKL_USER_TOKEN}".encode('utf-8')).hexdigest()
+
+
+def _parse_simkl_items(data: Any, media_type: str) -> List[tuple]:
+    """
+    Convert SIMKL all-items entries into media items.
+    
+    Args:
+        data: Decoded all-items response
+        media_type (str): Type of media fetched ('movies', 'shows', 'anime')
+        
+    Returns:
+        List[tuple]: (snapshot key, media item or None) pairs; None marks an
+        entry whose status no longer belongs on the watchlist
+    """
+    parsed = []
+    for item in data or []:
+        ids = item.get('ids', {})
+        key = str(ids.get('simkl') or ids.get('tmdb') or ids.get('imdb') or ids.get('tvdb') or item.get('title', ''))
+        
+        # Map SIMKL status to our format
+        status = item.get('status', '')
+        if status not in SIMKL_WATCHLIST_STATUSES:
+            parsed.append((key, None))
+            continue
+        
+        parsed.append((key, {
+            "title": item.get('title', ''),
+            "media_type": "movie" if media_type == "movies" else "show",
+            "year": item.get('year'),
+            "tmdb_id": ids.get('tmdb'),
+            "imdb_id": ids.get('imdb'),
+            "tvdb_id": ids.get('tvdb'),
+            "status": status
+        }))
+    return parsed
+
+
 def fetch_simkl_watchlist(media_type: str) -> List[Dict[str, Any]]:
     """
     Fetch user's watchlist from SIMKL API.
     
+    The user's activity timestamps are checked first: if nothing changed
+    since the last fetch the stored snapshot is returned without downloading
+    the watchlist, and if items were only added or updated just the delta
+    since the last activity is fetched with `date_from`. Removals trigger a
+    full fetch.
+    
     Args:
         media_type (str): Type of media to fetch ('movies', 'shows', 'anime')
         
@@ -49,40 +176,41 @@ def fetch_simkl_watchlist(media_type: str) -> List[Dict[str, Any]]:
     logging.info(f"🎯 SIMKL API: Fetching {media_type} watchlist")
     
     try:
-        response = requests.get(url, headers=get_simkl_headers(), params=params, timeout=30)
+        with _simkl_state_lock:
+            previous = _load_simkl_state().get(media_type)
+        activities = _get_simkl_activities()
+        section_activity = (activities or {}).get(SIMKL_ACTIVITY_SECTIONS.get(media_type, media_type))
         
-        # Handle rate limiting
-        if response.status_code == 429:
-            retry_after = int(response.headers.get('Retry-After', 10))
-            logging.warning(f"⚠️  SIMKL API rate limit hit. Waiting {retry_after} seconds...")
-            time.sleep(retry_after)
-            response = requests.get(url, headers=get_simkl_headers(), params=params, timeout=30)
+        if previous and section_activity and previous.get('activity') == section_activity:
+            logging.info(f"✅ SIMKL API: No {media_type} activity since last sync, reusing {len(previous['items'])} cached items")
+            return list(previous['items'].values())
         
-        response.raise_for_status()
-        data = response.json()
+        previous_activity = (previous or {}).get('activity') or {}
+        can_use_delta = (
+            previous and section_activity and previous_activity.get('all')
+            and previous_activity.get('removed_from_list') == section_activity.get('removed_from_list')
+        )
+        if can_use_delta:
+            logging.info(f"🔄 SIMKL API: Fetching {media_type} changes since {previous_activity['all']}")
+            response = _simkl_get(url, params={**params, "date_from": previous_activity['all']})
+            response.raise_for_status()
+            snapshot = dict(previous['items'])
+            changed = _parse_simkl_items(response.json(), media_type)
+            for key, item in changed:
+                if item is None:
+                    snapshot.pop(key, None)
+                else:
+                    snapshot[key] = item
+            logging.info(f"✅ SIMKL API: Applied {len(changed)} changed {media_type} items")
+        else:
+            response = _simkl_get(url, params=params)
+            response.raise_for_status()
+            snapshot = {key: item for key, item in _parse_simkl_items(response.json(), media_type) if item}
         
-        media_items = []
-        for item in data:
-            # Extract basic information
-            title = item.get('title', '')
-            year = item.get('year')
-            tmdb_id = item.get('ids', {}).get('tmdb')
-            imdb_id = item.get('ids', {}).get('imdb')
-            tvdb_id = item.get('ids', {}).get('tvdb')
-            
-            # Map SIMKL status to our format
-            status = item.get('status', '')
-            if status in ['watching', 'plantowatch', 'completed', 'hold', 'dropped']:
-                media_items.append({
-                    "title": title,
-                    "media_type": "movie" if media_type == "movies" else "show",
-                    "year": year,
-                    "tmdb_id": tmdb_id,
-                    "imdb_id": imdb_id,
-                    "tvdb_id": tvdb_id,
-                    "status": status
-                })
+        if section_activity:
+            _update_simkl_state(media_type, {'activity': section_activity, 'items': snapshot})
         
+        media_items = list(snapshot.values())
         logging.info(f"✅ SIMKL API: Fetched {len(media_items)} {media_type} items")
         return media_items
         
@@ -152,14 +280,7 @@ def search_simkl_by_title(title: str, year: Optional[int] = None, media_type: st
     logging.info(f"🔍 SIMKL API: Searching for '{title}' ({year}) [{media_type}]")
     
     try:
-        response = requests.get(url, headers=get_simkl_headers(), params=params, timeout=30)
-        
-        # Handle rate limiting
-        if response.status_code == 429:
-            retry_after = int(response.headers.get('Retry-After', 10))
-            logging.warning(f"⚠️  SIMKL API rate limit hit. Waiting {retry_after} seconds...")
-            time.sleep(retry_after)
-            response = requests.get(url, headers=get_simkl_headers(), params=params, timeout=30)
+        response = _simkl_get(url, params=params)
         
         response.raise_for_status()
         data = response.json()
@@ -3,10 +3,11 @@ Steven Lu popular movies provider for ListSync.
 """
 
 import logging
-import requests
+import os
 from typing import List, Dict, Any
 
 from . import register_provider
+from ..utils.http_cache import cached_get_json
 
 
 @register_provider("stevenlu")
@@ -39,19 +40,29 @@ def fetch_stevenlu_list(list_id=None) -> List[Dict[str, Any]]:
     logging.info(f"Fetching Steven Lu movies from: {json_url}")
     
     try:
-        response = requests.get(json_url, timeout=10)
-        response.raise_for_status()  # Raise exception for HTTP errors
-        
-        movies_data = response.json()
+        # Revalidated with ETag/Last-Modified; an unchanged list is served from the HTTP cache
+        movies_data = cached_get_json(json_url, timeout=10)
         logging.info(f"Found {len(movies_data)} movies in Steven Lu's list")
         
-        # Import Trakt search function for enrichment
-        from .trakt import search_trakt_by_imdb_id
+        # Import Trakt lookup for enrichment
+        from .trakt import search_trakt_by_imdb_ids
+        
+        # Items with a TMDB ID resolve by direct lookup during sync, which doesn't need the year
+        always_enrich = os.getenv('LISTSYNC_STEVENLU_ALWAYS_ENRICH', 'false').lower() == 'true'
+        to_enrich = [
+            movie.get('imdb_id') for movie in movies_data
+            if movie.get('imdb_id') and (always_enrich or not movie.get('tmdb_id'))
+        ]
         
-        logging.info(f"Enriching items with year data from Trakt API...")
+        trakt_results = {}
+        if to_enrich:
+            logging.info(f"Enriching {len(to_enrich)} items with year data from Trakt API...")
+            trakt_results = search_trakt_by_imdb_ids(to_enrich)
+        else:
+            logging.info("All items carry TMDB IDs, skipping Trakt enrichment")
         items_enriched = 0
         
-        for idx, movie in enumerate(movies_data):
+        for movie in movies_data:
             try:
                 title = movie.get('title', '').strip()
                 imdb_id = movie.get('imdb_id')
@@ -61,16 +72,12 @@ def fetch_stevenlu_list(list_id=None) -> List[Dict[str, Any]]:
                     logging.warning(f"Skipping movie with empty title: {movie}")
                     continue
                 
-                # Enrich with year data from Trakt if imdb_id is available
+                # Year from Trakt if this item was enriched
                 year = None
-                if imdb_id:
-                    try:
-                        trakt_result = search_trakt_by_imdb_id(imdb_id)
-                        if trakt_result and trakt_result.get('year'):
-                            year = trakt_result['year']
-                            items_enriched += 1
-                    except Exception as e:
-                        logging.debug(f"Could not enrich '{title}' (IMDB: {imdb_id}) with Trakt: {e}")
+                trakt_result = trakt_results.get(imdb_id) if imdb_id else None
+                if trakt_result and trakt_result.get('year'):
+                    year = trakt_result['year']
+                    items_enriched += 1
                 
                 # All items from this source are movies
                 media_items.append({
@@ -81,11 +88,7 @@ def fetch_stevenlu_list(list_id=None) -> List[Dict[str, Any]]:
                     "year": year  # Enriched from Trakt API
                 })
                 
-                # Log progress every 50 items
-                if len(media_items) % 50 == 0:
-                    year_str = f"({year})" if year else "(year unknown)"
-                    logging.info(f"Progress: {len(media_items)}/{len(movies_data)} items processed, {items_enriched} enriched with year data")
-                elif len(media_items) <= 3:
+                if len(media_items) <= 3:
                     year_str = f"({year})" if year else "(year unknown)"
                     logging.info(f"Added movie: {title} {year_str} (IMDB: {imdb_id}, TMDB: {tmdb_id})")
                 
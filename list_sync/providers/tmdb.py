@@ -3,25 +3,43 @@ TMDB (The Movie Database) list provider for ListSync.
 """
 
 import logging
+import os
 import re
 import requests
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, Dict, Any, Optional
 
-from seleniumbase import SB
+from . import register_stream_provider
+from ..utils.http_cache import cached_get_json
+from ..utils.rate_limiter import get_rate_limiter, parse_retry_after
+from ..utils.browser_pool import lease_browser
+from ..utils.scrape_profile import LIGHTWEIGHT_PROFILE
+from ..utils.dom_extract import extract_items, field
 
-from . import register_provider
+# TMDB allows roughly 40 requests per second; stay comfortably below that
+TMDB_RATE_LIMIT_PER_SECOND = 20
+TMDB_MAX_CONCURRENCY = int(os.getenv('LISTSYNC_TMDB_CONCURRENCY', '8') or '8')
 
+# Fields read from each scraped list row in a single round-trip
+TMDB_ITEM_SELECTOR = "div[class*='border-[1px]'][class*='rounded-md']"
+TMDB_ITEM_SPEC = {
+    'title': field("a[class*='font-bold'][href*='/movie/']"),
+    'dates': field("span[class*='whitespace-nowrap']", multiple=True),
+    'hrefs': field("a", 'href', multiple=True),
+    'text': field(),
+}
 
-@register_provider("tmdb")
-def fetch_tmdb_list(list_id: str) -> List[Dict[str, Any]]:
+
+@register_stream_provider("tmdb")
+def fetch_tmdb_list(list_id: str) -> Iterator[List[Dict[str, Any]]]:
     """
     Fetch TMDB list using API if available, otherwise fallback to web scraping
     
     Args:
         list_id (str): TMDB list ID or URL
         
-    Returns:
-        List[Dict[str, Any]]: List of media items
+    Yields:
+        List[Dict[str, Any]]: Media items, one API page at a time
         
     Raises:
         ValueError: If list ID format is invalid
@@ -34,24 +52,29 @@ def fetch_tmdb_list(list_id: str) -> List[Dict[str, Any]]:
     
     if api_key:
         logging.info(f"Using TMDB API for list: {list_id}")
-        return _fetch_tmdb_list_api(list_id, api_key)
+        yield from _iter_tmdb_list_api(list_id, api_key)
     else:
         logging.info(f"Using web scraping fallback for TMDB list: {list_id}")
-        return _fetch_tmdb_list_scraping(list_id)
+        yield _fetch_tmdb_list_scraping(list_id)
 
 
-def _fetch_tmdb_list_api(list_id: str, api_key: str) -> List[Dict[str, Any]]:
+def _iter_tmdb_list_api(list_id: str, api_key: str) -> Iterator[List[Dict[str, Any]]]:
     """
-    Fetch TMDB list using the official API with pagination support
+    Fetch TMDB list using the official API with pagination support.
+    
+    Page 1 is fetched first to learn the page count; the remaining pages are
+    then fetched concurrently (bounded by LISTSYNC_TMDB_CONCURRENCY and the
+    shared TMDB rate limiter) and yielded in page order as soon as each one
+    and all pages before it are available.
     
     Args:
         list_id (str): TMDB list ID
         api_key (str): TMDB API key
         
-    Returns:
-        List[Dict[str, Any]]: List of media items
+    Yields:
+        List[Dict[str, Any]]: Media items of one page
     """
-    media_items = []
+    item_count = 0
     
     try:
         # Extract list ID from URL if needed
@@ -71,56 +94,46 @@ def _fetch_tmdb_list_api(list_id: str, api_key: str) -> List[Dict[str, Any]]:
         
         logging.info(f"Fetching TMDB list {list_id} from API")
         
-        # First, get the list details to understand pagination
-        response = requests.get(base_url, params=params, timeout=30)
-        response.raise_for_status()
-        
-        data = response.json()
-        total_items = data.get('item_count', 0)
-        logging.info(f"List contains {total_items} total items")
-        
-        # Process items from the first page
-        for item in data.get('items', []):
-            processed_item = _process_tmdb_api_item(item)
-            if processed_item:
-                media_items.append(processed_item)
-        
-        # Check if we need to fetch more pages
-        # TMDB API returns 20 items per page by default
-        items_per_page = 20
-        total_pages = (total_items + items_per_page - 1) // items_per_page
-        
-        if total_pages > 1:
-            logging.info(f"Fetching additional pages (2/{total_pages})...")
+        with requests.Session() as session:
+            # First, get the list details to understand pagination
+            data = _fetch_tmdb_api_page(session, base_url, params, 1)
+            total_items = data.get('item_count', 0)
+            logging.info(f"List contains {total_items} total items")
             
-            # Fetch remaining pages
-            for page in range(2, total_pages + 1):
-                try:
-                    page_params = params.copy()
-                    page_params['page'] = page
-                    
-                    logging.info(f"Fetching page {page}/{total_pages}")
-                    response = requests.get(base_url, params=page_params, timeout=30)
-                    response.raise_for_status()
-                    
-                    page_data = response.json()
-                    
-                    # Process items from this page
-                    for item in page_data.get('items', []):
-                        processed_item = _process_tmdb_api_item(item)
-                        if processed_item:
-                            media_items.append(processed_item)
-                    
-                    # Small delay to be respectful to the API
-                    import time
-                    time.sleep(0.1)
-                    
-                except Exception as e:
-                    logging.warning(f"Failed to fetch page {page}: {str(e)}")
-                    continue
-        
-        logging.info(f"Successfully fetched {len(media_items)} items from TMDB API across {total_pages} pages")
-        return media_items
+            # Process items from the first page
+            page_items = _process_tmdb_api_page(data)
+            item_count += len(page_items)
+            yield page_items
+            
+            # Prefer the page count reported by the API; TMDB returns 20 items per page by default
+            items_per_page = 20
+            total_pages = data.get('total_pages') or (total_items + items_per_page - 1) // items_per_page
+            
+            if total_pages > 1:
+                max_workers = min(TMDB_MAX_CONCURRENCY, total_pages - 1)
+                logging.info(f"Fetching {total_pages - 1} additional pages with {max_workers} workers...")
+                
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    futures = [
+                        (page, executor.submit(_fetch_tmdb_api_page, session, base_url, params, page))
+                        for page in range(2, total_pages + 1)
+                    ]
+                    try:
+                        # Yield in page order so the list order matches TMDB
+                        for page, future in futures:
+                            try:
+                                page_items = _process_tmdb_api_page(future.result())
+                            except Exception as e:
+                                logging.warning(f"Failed to fetch page {page}: {str(e)}")
+                                continue
+                            item_count += len(page_items)
+                            yield page_items
+                    finally:
+                        # Stop outstanding requests if the consumer stops early
+                        for _, future in futures:
+                            future.cancel()
+        
+        logging.info(f"Successfully fetched {item_count} items from TMDB API across {total_pages} pages")
         
     except requests.exceptions.RequestException as e:
         logging.error(f"TMDB API request failed: {str(e)}")
@@ -130,6 +143,51 @@ def _fetch_tmdb_list_api(list_id: str, api_key: str) -> List[Dict[str, Any]]:
         raise
 
 
+def _process_tmdb_api_page(data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Convert the items of one TMDB API page into media items."""
+    media_items = []
+    for item in data.get('items', []):
+        processed_item = _process_tmdb_api_item(item)
+        if processed_item:
+            media_items.append(processed_item)
+    return media_items
+
+
+def _fetch_tmdb_api_page(session: requests.Session, base_url: str, params: Dict[str, Any], page: int, max_retries: int = 3) -> Dict[str, Any]:
+    """
+    Fetch a single page of a TMDB list, honouring the shared rate limiter.
+    
+    Args:
+        session (requests.Session): Pooled HTTP session
+        base_url (str): TMDB list endpoint
+        params (Dict[str, Any]): Base query parameters
+        page (int): Page number to fetch
+        max_retries (int): Retries when TMDB answers 429
+        
+    Returns:
+        Dict[str, Any]: Decoded page payload
+    """
+    page_params = params.copy()
+    if page > 1:
+        page_params['page'] = page
+    
+    limiter = get_rate_limiter('tmdb', TMDB_RATE_LIMIT_PER_SECOND, burst=TMDB_MAX_CONCURRENCY)
+    
+    for attempt in range(max_retries + 1):
+        limiter.acquire()
+        logging.debug(f"Fetching TMDB list page {page}")
+        try:
+            return cached_get_json(base_url, params=page_params, timeout=30, session=session)
+        except requests.exceptions.HTTPError as e:
+            response = e.response
+            if response is not None and response.status_code == 429 and attempt < max_retries:
+                retry_after = parse_retry_after(response.headers.get('Retry-After'), 1)
+                logging.warning(f"⚠️  TMDB API rate limit hit on page {page}. Waiting {retry_after:.0f} seconds...")
+                limiter.penalize(retry_after)
+                continue
+            raise
+
+
 def _process_tmdb_api_item(item: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     """
     Process a single item from TMDB API response
@@ -181,7 +239,7 @@ def _fetch_tmdb_list_scraping(list_id: str) -> List[Dict[str, Any]]:
     logging.info(f"Fetching TMDB list via web scraping: {list_id}")
     
     try:
-        with SB(uc=True, headless=True) as sb:
+        with lease_browser(profile=LIGHTWEIGHT_PROFILE) as sb:
             # Handle full URLs vs list IDs
             if list_id.startswith(('http://', 'https://')):
                 url = list_id.rstrip('/')
@@ -257,53 +315,18 @@ def _process_tmdb_list(sb, url) -> List[Dict[str, Any]]:
         logging.error(f"Failed to load TMDB list page: {str(e)}")
         raise
     
-    # Find all movie items using the proven selector
-    items = sb.find_elements("css selector", "div[class*='border-[1px]'][class*='rounded-md']")
-    logging.info(f"Found {len(items)} movie items initially")
+    # Extract all movie items using the proven selector in a single round-trip
+    rows = extract_items(sb, TMDB_ITEM_SELECTOR, TMDB_ITEM_SPEC)
+    logging.info(f"Found {len(rows)} movie items initially")
     
-    if not items:
+    if not rows:
         logging.warning("No movie items found")
         return media_items
     
     # Process all items on the current page
-    for i, item in enumerate(items):
-        try:
-            # Extract title using proven selector
-            title = ""
-            title_links = item.find_elements("css selector", "a[class*='font-bold'][href*='/movie/']")
-            if title_links:
-                title = title_links[0].text.strip()
-            
-            if not title:
-                logging.warning(f"Could not find title for item {i+1}, skipping")
-                continue
-            
-            # Extract year using proven selector
-            year = None
-            date_spans = item.find_elements("css selector", "span[class*='whitespace-nowrap']")
-            for span in date_spans:
-                text = span.text.strip()
-                year = _extract_year_from_text(text)
-                if year:
-                    break
-            
-            # Extract unique ID
-            unique_id = _extract_unique_id(item)
-            
-            # Determine media type
-            media_type = _determine_media_type(item, title)
-            
-            media_items.append({
-                "title": title.strip(),
-                "media_type": media_type,
-                "year": year,
-                "tmdb_id": unique_id
-            })
-            logging.info(f"Added {media_type}: {title} ({year if year else 'year unknown'}) (TMDB ID: {unique_id})")
-            
-        except Exception as e:
-            logging.warning(f"Failed to parse TMDB item {i+1}: {str(e)}")
-            continue
+    for item in _parse_tmdb_rows(rows):
+        media_items.append(item)
+        logging.info(f"Added {item['media_type']}: {item['title']} ({item['year'] if item['year'] else 'year unknown'}) (TMDB ID: {item['tmdb_id']})")
     
     logging.info(f"Successfully extracted {len(media_items)} items from initial page")
     
@@ -430,50 +453,52 @@ def _process_tmdb_list(sb, url) -> List[Dict[str, Any]]:
         logging.warning(f"Reached maximum pagination attempts ({max_pagination_attempts}) - stopping")
     
     # After all pagination is complete, extract all items
-    all_items = sb.find_elements("css selector", "div[class*='border-[1px]'][class*='rounded-md']")
-    logging.info(f"Final extraction: Found {len(all_items)} total items after all pagination")
+    rows = extract_items(sb, TMDB_ITEM_SELECTOR, TMDB_ITEM_SPEC)
+    logging.info(f"Final extraction: Found {len(rows)} total items after all pagination")
     
     # Process all items to get the complete list
-    media_items = []  # Reset and re-extract everything
-    for i, item in enumerate(all_items):
+    media_items = _parse_tmdb_rows(rows)  # Reset and re-extract everything
+    
+    logging.info(f"Successfully extracted {len(media_items)} total items after all pagination")
+    
+    return media_items
+
+
+def _parse_tmdb_rows(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Convert bulk-extracted TMDB list rows into media items.
+    
+    Args:
+        rows (List[Dict[str, Any]]): Rows returned by extract_items with TMDB_ITEM_SPEC
+        
+    Returns:
+        List[Dict[str, Any]]: List of media items
+    """
+    media_items = []
+    for i, row in enumerate(rows):
         try:
-            # Extract title
-            title = ""
-            title_links = item.find_elements("css selector", "a[class*='font-bold'][href*='/movie/']")
-            if title_links:
-                title = title_links[0].text.strip()
-            
+            title = (row.get('title') or '').strip()
             if not title:
+                logging.debug(f"Could not find title for item {i+1}, skipping")
                 continue
             
-            # Extract year
+            # Extract year from the first date span that contains one
             year = None
-            date_spans = item.find_elements("css selector", "span[class*='whitespace-nowrap']")
-            for span in date_spans:
-                text = span.text.strip()
+            for text in row.get('dates') or []:
                 year = _extract_year_from_text(text)
                 if year:
                     break
             
-            # Extract unique ID
-            unique_id = _extract_unique_id(item)
-            
-            # Determine media type
-            media_type = _determine_media_type(item, title)
-            
             media_items.append({
-                "title": title.strip(),
-                "media_type": media_type,
+                "title": title,
+                "media_type": _determine_media_type(row.get('text') or '', title),
                 "year": year,
-                "tmdb_id": unique_id
+                "tmdb_id": _extract_unique_id(row.get('hrefs') or [])
             })
-            
         except Exception as e:
-            logging.warning(f"Failed to parse TMDB item {i+1} after pagination: {str(e)}")
+            logging.warning(f"Failed to parse TMDB item {i+1}: {str(e)}")
             continue
     
-    logging.info(f"Successfully extracted {len(media_items)} total items after all pagination")
-    
     return media_items
 
 
@@ -575,43 +600,32 @@ def _extract_year_from_text(text: str) -> int:
     return None
 
 
-def _extract_unique_id(item) -> str:
-    """Extract unique ID from list item."""
-    try:
-        links = item.find_elements("css selector", "a")
-        for link in links:
-            href = link.get_attribute("href")
-            if href:
-                # Look for TMDB patterns
-                if '/movie/' in href:
-                    # TMDB movie pattern: /movie/19995-avatar -> 19995
-                    id_match = re.search(r'/movie/(\d+)(?:-[^/]+)?', href)
-                    if id_match:
-                        return id_match.group(1)
-                elif '/tv/' in href:
-                    # TMDB TV pattern: /tv/12345-show -> 12345
-                    id_match = re.search(r'/tv/(\d+)(?:-[^/]+)?', href)
-                    if id_match:
-                        return id_match.group(1)
-    except Exception:
-        pass
+def _extract_unique_id(hrefs: List[str]) -> str:
+    """Extract unique ID from the links of a list item."""
+    for href in hrefs:
+        if href:
+            # Look for TMDB patterns
+            if '/movie/' in href:
+                # TMDB movie pattern: /movie/19995-avatar -> 19995
+                id_match = re.search(r'/movie/(\d+)(?:-[^/]+)?', href)
+                if id_match:
+                    return id_match.group(1)
+            elif '/tv/' in href:
+                # TMDB TV pattern: /tv/12345-show -> 12345
+                id_match = re.search(r'/tv/(\d+)(?:-[^/]+)?', href)
+                if id_match:
+                    return id_match.group(1)
     
     return None
 
 
-def _determine_media_type(item, title: str) -> str:
-    """Determine if item is movie or TV show."""
+def _determine_media_type(text: str, title: str) -> str:
+    """Determine if item is movie or TV show from the item's visible text."""
     # Default to movie
     media_type = "movie"
     
-    # Look for TV indicators in title, classes, or other elements
-    try:
-        text = item.text.lower()
-        if any(keyword in text for keyword in ['tv', 'series', 'season', 'episode', 'show']):
-            media_type = "tv"
-    except Exception:
-        pass
+    # Look for TV indicators in the item text
+    if any(keyword in text.lower() for keyword in ['tv', 'series', 'season', 'episode', 'show']):
+        media_type = "tv"
     
     return media_type
-
-
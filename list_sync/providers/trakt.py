@@ -5,12 +5,17 @@ Trakt provider for ListSync - using Trakt API v2.
 import logging
 import os
 import re
-from typing import List, Dict, Any, Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, Dict, Any, Optional, Tuple
 
 import requests
 from dotenv import load_dotenv
 
-from . import register_provider, check_and_raise_if_cancelled, SyncCancelledException
+from . import register_provider, register_stream_provider, check_and_raise_if_cancelled, SyncCancelledException
+from ..utils.http_cache import cached_get_json
+from ..utils.rate_limiter import get_rate_limiter, parse_retry_after
 
 # Load environment variables
 if os.path.exists('.env'):
@@ -20,6 +25,15 @@ if os.path.exists('.env'):
 TRAKT_BASE_URL = "https://api.trakt.tv"
 TRAKT_API_VERSION = "2"
 
+# Trakt allows 1000 GET requests per 5 minutes per application
+TRAKT_RATE_LIMIT_PER_SECOND = 1000 / 300
+TRAKT_MAX_CONCURRENCY = int(os.getenv('LISTSYNC_TRAKT_CONCURRENCY', '4') or '4')
+
+# IMDb ID -> Trakt lookup results, shared by every provider and the sync matcher
+TRAKT_CROSSWALK_TTL = int(os.getenv('LISTSYNC_TRAKT_CROSSWALK_HOURS', '24') or '24') * 3600
+_crosswalk_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+_crosswalk_lock = threading.Lock()
+
 # Cache for config manager
 _config_manager = None
 
@@ -328,10 +342,7 @@ def fetch_trakt_list(list_id: str) -> List[Dict[str, Any]]:
         logging.info(f"Fetching from API endpoint: {url}")
         
         # Make API request
-        response = requests.get(url, headers=get_trakt_headers(), timeout=30)
-        response.raise_for_status()
-        
-        items = response.json()
+        items = _trakt_get_json(url)
         
         if not isinstance(items, list):
             raise ValueError(f"Unexpected API response format: expected list, got {type(items)}")
@@ -385,16 +396,16 @@ def fetch_trakt_list(list_id: str) -> List[Dict[str, Any]]:
         raise
 
 
-@register_provider("trakt_special")
-def fetch_trakt_special_list(url_or_shortcut: str) -> List[Dict[str, Any]]:
+@register_stream_provider("trakt_special")
+def fetch_trakt_special_list(url_or_shortcut: str) -> Iterator[List[Dict[str, Any]]]:
     """
     Fetch special Trakt list (trending, popular, etc.) using Trakt API v2.
     
     Args:
         url_or_shortcut (str): Trakt special list URL or shortcut format (e.g., "trending:movies")
         
-    Returns:
-        List[Dict[str, Any]]: List of media items (max: TRAKT_SPECIAL_ITEMS_LIMIT from config, default 20)
+    Yields:
+        List[Dict[str, Any]]: Media items of each API page (max in total: TRAKT_SPECIAL_ITEMS_LIMIT from config, default 20)
         
     Raises:
         ValueError: If URL format is invalid or API credentials not set
@@ -432,10 +443,7 @@ def fetch_trakt_special_list(url_or_shortcut: str) -> List[Dict[str, Any]]:
             
             logging.info(f"Fetching page {page} with limit {page_limit}...")
             
-            response = requests.get(url, headers=get_trakt_headers(), params=params, timeout=30)
-            response.raise_for_status()
-            
-            items = response.json()
+            items = _trakt_get_json(url, params)
             
             if not isinstance(items, list) or len(items) == 0:
                 logging.info(f"No more items available (page {page})")
@@ -444,6 +452,7 @@ def fetch_trakt_special_list(url_or_shortcut: str) -> List[Dict[str, Any]]:
             logging.info(f"Found {len(items)} items on page {page}")
             
             # Parse items from this page
+            page_start = len(media_items)
             for item in items:
                 if total_items_fetched >= items_limit:
                     break
@@ -466,6 +475,9 @@ def fetch_trakt_special_list(url_or_shortcut: str) -> List[Dict[str, Any]]:
                             f"[{total_items_fetched}/{items_limit}]"
                         )
             
+            # Hand this page to the sync engine while the next one is fetched
+            yield media_items[page_start:]
+            
             # Check if we got fewer items than requested (end of list)
             if len(items) < page_limit:
                 logging.info(f"Reached end of list at page {page}")
@@ -477,10 +489,9 @@ def fetch_trakt_special_list(url_or_shortcut: str) -> List[Dict[str, Any]]:
             f"Special Trakt list fetched successfully. Got {len(media_items)} items "
             f"(target: {items_limit})."
         )
-        return media_items
     
     except SyncCancelledException:
-        logging.warning(f"⚠️ Trakt special list fetch cancelled by user - returning {len(media_items)} items fetched so far")
+        logging.warning(f"⚠️ Trakt special list fetch cancelled by user after {len(media_items)} items")
         raise
         
     except requests.exceptions.HTTPError as e:
@@ -596,6 +607,90 @@ def extract_media_from_special_list_item(item: Dict[str, Any], endpoint: str) ->
         return None
 
 
+def _trakt_get(url: str, params: Optional[Dict[str, Any]] = None) -> requests.Response:
+    """
+    GET a Trakt API URL through the shared Trakt rate limiter.
+    
+    On HTTP 429 every caller is held back for Retry-After seconds and the
+    request is retried once.
+    
+    Args:
+        url (str): Request URL
+        params (Optional[Dict[str, Any]]): Query parameters
+        
+    Returns:
+        requests.Response: Response of the last attempt
+    """
+    limiter = get_rate_limiter('trakt', TRAKT_RATE_LIMIT_PER_SECOND, burst=TRAKT_MAX_CONCURRENCY)
+    limiter.acquire()
+    response = requests.get(url, headers=get_trakt_headers(), params=params, timeout=30)
+    
+    if response.status_code == 429:
+        retry_after = parse_retry_after(response.headers.get('Retry-After'), 10)
+        logging.warning(f"⚠️  Trakt API rate limit hit. Waiting {retry_after:.0f} seconds...")
+        limiter.penalize(retry_after)
+        limiter.acquire()
+        response = requests.get(url, headers=get_trakt_headers(), params=params, timeout=30)
+    
+    return response
+
+
+def _trakt_get_json(url: str, params: Optional[Dict[str, Any]] = None) -> Any:
+    """
+    GET a Trakt list page through the rate limiter and the conditional-request cache.
+    
+    Args:
+        url (str): Request URL
+        params (Optional[Dict[str, Any]]): Query parameters
+        
+    Returns:
+        Any: Decoded JSON body
+        
+    Raises:
+        requests.HTTPError: If the API returns an error status
+    """
+    get_rate_limiter('trakt', TRAKT_RATE_LIMIT_PER_SECOND, burst=TRAKT_MAX_CONCURRENCY).acquire()
+    return cached_get_json(url, params=params, headers=get_trakt_headers(), timeout=30)
+
+
+def _get_cached_crosswalk(imdb_id: str) -> Optional[Dict[str, Any]]:
+    """Return a cached IMDb ID lookup if it has not expired"""
+    with _crosswalk_lock:
+        entry = _crosswalk_cache.get(imdb_id)
+        if entry and time.time() - entry[0] < TRAKT_CROSSWALK_TTL:
+            return entry[1]
+        return None
+
+
+def search_trakt_by_imdb_ids(imdb_ids: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+    """
+    Look up several IMDB IDs on Trakt concurrently.
+    
+    Lookups share the Trakt rate limiter and crosswalk cache, so repeated IDs
+    and IDs already resolved by an earlier sync cost no requests.
+    
+    Args:
+        imdb_ids (List[str]): IMDB IDs to resolve
+        
+    Returns:
+        Dict[str, Optional[Dict[str, Any]]]: IMDB ID -> media info (None if not found)
+    """
+    unique_ids = list(dict.fromkeys(i for i in imdb_ids if i))
+    if not unique_ids:
+        return {}
+    
+    try:
+        get_trakt_client_id()
+    except ValueError as e:
+        logging.warning(f"⚠️ Skipping Trakt lookups: {str(e)}")
+        return {}
+    
+    max_workers = min(TRAKT_MAX_CONCURRENCY, len(unique_ids))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(search_trakt_by_imdb_id, unique_ids)
+        return dict(zip(unique_ids, results))
+
+
 def search_trakt_by_imdb_id(imdb_id: str, max_retries: int = 3) -> Optional[Dict[str, Any]]:
     """
     Search Trakt by IMDB ID to get TMDB ID and other metadata.
@@ -607,9 +702,13 @@ def search_trakt_by_imdb_id(imdb_id: str, max_retries: int = 3) -> Optional[Dict
     Returns:
         Optional[Dict[str, Any]]: Media info with IDs or None if not found
     """
-    import time
     import random
     
+    cached = _get_cached_crosswalk(imdb_id)
+    if cached:
+        logging.debug(f"Trakt crosswalk cache hit for IMDB ID {imdb_id}")
+        return cached
+    
     for attempt in range(max_retries + 1):
         try:
             if attempt > 0:
@@ -621,15 +720,8 @@ def search_trakt_by_imdb_id(imdb_id: str, max_retries: int = 3) -> Optional[Dict
             logging.info(f"🔍 Trakt API: Searching by IMDB ID: {imdb_id}")
             url = f"{TRAKT_BASE_URL}/search/imdb/{imdb_id}"
             
-            response = requests.get(url, headers=get_trakt_headers(), timeout=30)
-            
-            # Handle rate limiting
-            if response.status_code == 429:
-                retry_after = int(response.headers.get('Retry-After', 10))
-                logging.warning(f"⚠️  Trakt API rate limit hit. Waiting {retry_after} seconds...")
-                time.sleep(retry_after)
-                # Retry once
-                response = requests.get(url, headers=get_trakt_headers(), timeout=30)
+            # Rate limiting and 429 back-off are handled by the shared limiter
+            response = _trakt_get(url)
             
             response.raise_for_status()
             results = response.json()
@@ -674,7 +766,7 @@ def search_trakt_by_imdb_id(imdb_id: str, max_retries: int = 3) -> Optional[Dict
             # Log only essential info instead of full media object to reduce log size
             logging.debug(f"Trakt found: {media.get('title', 'Unknown')} ({media.get('year', 'N/A')}) → TMDB {media.get('ids', {}).get('tmdb', 'N/A')}")
             
-            return {
+            result = {
                 "title": title,
                 "year": year,
                 "media_type": media_type,
@@ -682,6 +774,9 @@ def search_trakt_by_imdb_id(imdb_id: str, max_retries: int = 3) -> Optional[Dict
                 "imdb_id": returned_imdb_id,
                 "trakt_id": ids.get('trakt')
             }
+            with _crosswalk_lock:
+                _crosswalk_cache[imdb_id] = (time.time(), result)
+            return result
             
         except requests.exceptions.HTTPError as e:
             if e.response.status_code == 404:
@@ -742,8 +837,8 @@ def get_trakt_metadata(tmdb_id: Optional[int] = None, imdb_id: Optional[str] = N
             search_response = requests.get(search_url, headers=get_trakt_headers(), timeout=30)
             
             if search_response.status_code == 429:
-                retry_after = int(search_response.headers.get('Retry-After', 10))
-                logging.warning(f"⚠️  Trakt API rate limit hit. Waiting {retry_after} seconds...")
+                retry_after = parse_retry_after(search_response.headers.get('Retry-After'), 10)
+                logging.warning(f"⚠️  Trakt API rate limit hit. Waiting {retry_after:.0f} seconds...")
                 time.sleep(retry_after)
                 search_response = requests.get(search_url, headers=get_trakt_headers(), timeout=30)
             
@@ -778,8 +873,8 @@ def get_trakt_metadata(tmdb_id: Optional[int] = None, imdb_id: Optional[str] = N
         
         # Handle rate limiting
         if response.status_code == 429:
-            retry_after = int(response.headers.get('Retry-After', 10))
-            logging.warning(f"⚠️  Trakt API rate limit hit. Waiting {retry_after} seconds...")
+            retry_after = parse_retry_after(response.headers.get('Retry-After'), 10)
+            logging.warning(f"⚠️  Trakt API rate limit hit. Waiting {retry_after:.0f} seconds...")
             time.sleep(retry_after)
             response = requests.get(url, headers=get_trakt_headers(), timeout=30)
         
@@ -864,16 +959,8 @@ def search_trakt_by_title(title: str, year: Optional[int], media_type: str) -> O
         url = f"{TRAKT_BASE_URL}/search/{trakt_type}"
         params = {"query": title}
         
-        response = requests.get(url, headers=get_trakt_headers(), params=params, timeout=30)
-        
-        # Handle rate limiting
-        if response.status_code == 429:
-            retry_after = int(response.headers.get('Retry-After', 10))
-            logging.warning(f"⚠️  Trakt API rate limit hit. Waiting {retry_after} seconds...")
-            import time
-            time.sleep(retry_after)
-            # Retry once
-            response = requests.get(url, headers=get_trakt_headers(), params=params, timeout=30)
+        # Rate limiting and 429 back-off are handled by the shared limiter
+        response = _trakt_get(url, params)
         
         response.raise_for_status()
         results = response.json()
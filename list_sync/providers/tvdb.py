@@ -2,15 +2,44 @@
 TVDB (The TV Database) list provider for ListSync.
 """
 
+import base64
+import hashlib
+import json
 import logging
+import os
 import re
 import requests
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional
 
-from seleniumbase import SB
-
 from . import register_provider
+from ..utils.logger import DATA_DIR
+from ..utils.rate_limiter import get_rate_limiter
+from ..utils.browser_pool import lease_browser
+from ..utils.scrape_profile import LIGHTWEIGHT_PROFILE
+from ..utils.dom_extract import extract_items, field
+
+TVDB_API_BASE_URL = "https://api4.thetvdb.com/v4"
+TVDB_TOKEN_FILE = os.path.join(DATA_DIR, "tvdb_token.json")
+TVDB_SERIES_CACHE_FILE = os.path.join(DATA_DIR, "tvdb_series_cache.json")
+
+# TVDB tokens are valid for one month; used when the JWT carries no exp claim
+TVDB_TOKEN_DEFAULT_TTL = 28 * 24 * 3600
+TVDB_SERIES_CACHE_TTL = int(os.getenv('LISTSYNC_TVDB_SERIES_CACHE_HOURS', '168') or '168') * 3600
+TVDB_MAX_CONCURRENCY = int(os.getenv('LISTSYNC_TVDB_CONCURRENCY', '8') or '8')
+TVDB_RATE_LIMIT_PER_SECOND = 10
+
+# Fields read from each scraped list row in a single round-trip
+TVDB_ROW_SPEC = {
+    'title': field('h3.mt-0.mb-0 a'),
+    'href': field('h3.mt-0.mb-0 a', 'href'),
+    'year_texts': field('div.mb-1', multiple=True),
+    'description': field('p'),
+}
+
+_token_lock = threading.Lock()
 
 
 @register_provider("tvdb")
@@ -41,43 +70,135 @@ def fetch_tvdb_list(list_id: str) -> List[Dict[str, Any]]:
         return _fetch_tvdb_list_scraping(list_id)
 
 
-def _get_tvdb_token(api_key: str) -> Optional[str]:
+def _get_tvdb_token(api_key: str, force_refresh: bool = False) -> Optional[str]:
     """
     Get TVDB API token for authentication.
     
+    The JWT is cached on disk together with its expiry and reused across
+    fetches; a new login is only made when the cached token is missing,
+    expired, issued for a different API key, or ``force_refresh`` is set
+    because the API rejected it.
+    
     Args:
         api_key (str): TVDB API key
+        force_refresh (bool): Ignore the cached token and log in again
         
     Returns:
         Optional[str]: JWT token if successful, None otherwise
     """
-    try:
-        auth_url = "https://api4.thetvdb.com/v4/login"
-        auth_data = {
-            "apikey": api_key
-        }
-        
-        response = requests.post(auth_url, json=auth_data, timeout=30)
-        response.raise_for_status()
-        
-        data = response.json()
-        token = data.get('data', {}).get('token')
+    key_hash = hashlib.sha256(api_key.encode('utf-8')).hexdigest()
+    
+    with _token_lock:
+        if not force_refresh:
+            cached = _load_json_file(TVDB_TOKEN_FILE)
+            if (cached and cached.get('api_key_hash') == key_hash
+                    and cached.get('token') and cached.get('expires_at', 0) > time.time() + 60):
+                logging.debug("Using cached TVDB API token")
+                return cached['token']
         
-        if token:
-            logging.info("Successfully authenticated with TVDB API")
-            return token
-        else:
-            logging.error("Failed to get token from TVDB API response")
-            return None
+        try:
+            auth_url = f"{TVDB_API_BASE_URL}/login"
+            auth_data = {
+                "apikey": api_key
+            }
             
-    except requests.exceptions.RequestException as e:
-        logging.error(f"TVDB API authentication failed: {str(e)}")
-        return None
-    except Exception as e:
-        logging.error(f"Error during TVDB authentication: {str(e)}")
+            response = requests.post(auth_url, json=auth_data, timeout=30)
+            response.raise_for_status()
+            
+            data = response.json()
+            token = data.get('data', {}).get('token')
+            
+            if token:
+                logging.info("Successfully authenticated with TVDB API")
+                _save_json_file(TVDB_TOKEN_FILE, {
+                    'token': token,
+                    'expires_at': _get_token_expiry(token),
+                    'api_key_hash': key_hash
+                })
+                return token
+            else:
+                logging.error("Failed to get token from TVDB API response")
+                return None
+                
+        except requests.exceptions.RequestException as e:
+            logging.error(f"TVDB API authentication failed: {str(e)}")
+            return None
+        except Exception as e:
+            logging.error(f"Error during TVDB authentication: {str(e)}")
+            return None
+
+
+def _get_token_expiry(token: str) -> float:
+    """Read the exp claim from a JWT, falling back to the default TVDB token lifetime."""
+    try:
+        payload = token.split('.')[1]
+        payload += '=' * (-len(payload) % 4)
+        claims = json.loads(base64.urlsafe_b64decode(payload))
+        if claims.get('exp'):
+            return float(claims['exp'])
+    except Exception:
+        pass
+    return time.time() + TVDB_TOKEN_DEFAULT_TTL
+
+
+def _load_json_file(path: str) -> Optional[Dict[str, Any]]:
+    """Load a JSON cache file, returning None if it is missing or corrupt."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
         return None
 
 
+def _save_json_file(path: str, data: Dict[str, Any]) -> None:
+    """Atomically write a JSON cache file."""
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logging.warning(f"Could not write TVDB cache file {path}: {e}")
+
+
+class _TVDBClient:
+    """Authenticated TVDB API client that refreshes its token when rejected."""
+    
+    def __init__(self, api_key: str, token: str):
+        self.api_key = api_key
+        self.token = token
+        self.session = requests.Session()
+        self.limiter = get_rate_limiter('tvdb', TVDB_RATE_LIMIT_PER_SECOND, burst=TVDB_MAX_CONCURRENCY)
+        self._lock = threading.Lock()
+    
+    def get(self, url: str) -> requests.Response:
+        """GET an API URL, logging in again once if the token is rejected."""
+        token = self.token
+        self.limiter.acquire()
+        response = self.session.get(url, headers=self._headers(token), timeout=30)
+        if response.status_code == 401:
+            with self._lock:
+                # Another worker may already have refreshed the token
+                if self.token == token:
+                    logging.info("TVDB API rejected cached token - refreshing")
+                    self.token = _get_tvdb_token(self.api_key, force_refresh=True) or token
+            self.limiter.acquire()
+            response = self.session.get(url, headers=self._headers(self.token), timeout=30)
+        response.raise_for_status()
+        return response
+    
+    @staticmethod
+    def _headers(token: str) -> Dict[str, str]:
+        return {
+            'Authorization': f'Bearer {token}',
+            'Content-Type': 'application/json'
+        }
+    
+    def close(self):
+        self.session.close()
+
+
 def _fetch_tvdb_list_api(list_id: str, api_key: str) -> List[Dict[str, Any]]:
     """
     Fetch TVDB list using web scraping with optional API enhancement
@@ -104,11 +225,11 @@ def _fetch_tvdb_list_api(list_id: str, api_key: str) -> List[Dict[str, Any]]:
             logging.info("Enhancing scraped data with TVDB API information")
             token = _get_tvdb_token(api_key)
             if token:
-                headers = {
-                    'Authorization': f'Bearer {token}',
-                    'Content-Type': 'application/json'
-                }
-                media_items = _enhance_with_tvdb_api(media_items, headers)
+                client = _TVDBClient(api_key, token)
+                try:
+                    media_items = _enhance_with_tvdb_api(media_items, client)
+                finally:
+                    client.close()
         
         logging.info(f"Successfully fetched {len(media_items)} items from TVDB")
         return media_items
@@ -118,13 +239,13 @@ def _fetch_tvdb_list_api(list_id: str, api_key: str) -> List[Dict[str, Any]]:
         raise
 
 
-def _fetch_tvdb_user_favorites(user_id: str, headers: Dict[str, str]) -> List[Dict[str, Any]]:
+def _fetch_tvdb_user_favorites(user_id: str, client: "_TVDBClient") -> List[Dict[str, Any]]:
     """
     Fetch user favorites from TVDB API.
     
     Args:
         user_id (str): TVDB user ID
-        headers (Dict[str, str]): API headers with authentication
+        client (_TVDBClient): Authenticated TVDB API client
         
     Returns:
         List[Dict[str, Any]]: List of favorite series
@@ -133,35 +254,30 @@ def _fetch_tvdb_user_favorites(user_id: str, headers: Dict[str, str]) -> List[Di
     
     try:
         # TVDB API v4 endpoint for user favorites
-        favorites_url = f"https://api4.thetvdb.com/v4/user/{user_id}/favorites"
+        favorites_url = f"{TVDB_API_BASE_URL}/user/{user_id}/favorites"
         
         logging.info(f"Fetching TVDB user favorites from: {favorites_url}")
         
-        response = requests.get(favorites_url, headers=headers, timeout=30)
-        response.raise_for_status()
+        response = client.get(favorites_url)
         
         data = response.json()
         favorites = data.get('data', [])
         
         logging.info(f"Found {len(favorites)} favorites")
         
-        # Process each favorite
-        for favorite in favorites:
+        # Fetch series details for all favorites concurrently
+        series_ids = [favorite.get('seriesId') for favorite in favorites if favorite.get('seriesId')]
+        details_by_id = _get_tvdb_series_details_bulk(series_ids, client)
+        
+        for series_id in series_ids:
             try:
-                # Get series details for each favorite
-                series_id = favorite.get('seriesId')
-                if series_id:
-                    series_details = _get_tvdb_series_details(series_id, headers)
-                    if series_details:
-                        processed_item = _process_tvdb_series_item(series_details)
-                        if processed_item:
-                            media_items.append(processed_item)
-                
-                # Small delay to be respectful to the API
-                time.sleep(0.1)
-                
+                series_details = details_by_id.get(str(series_id))
+                if series_details:
+                    processed_item = _process_tvdb_series_item(series_details)
+                    if processed_item:
+                        media_items.append(processed_item)
             except Exception as e:
-                logging.warning(f"Failed to process favorite {favorite}: {str(e)}")
+                logging.warning(f"Failed to process favorite {series_id}: {str(e)}")
                 continue
         
         return media_items
@@ -174,22 +290,21 @@ def _fetch_tvdb_user_favorites(user_id: str, headers: Dict[str, str]) -> List[Di
         raise
 
 
-def _get_tvdb_series_details(series_id: str, headers: Dict[str, str]) -> Optional[Dict[str, Any]]:
+def _get_tvdb_series_details(series_id: str, client: _TVDBClient) -> Optional[Dict[str, Any]]:
     """
     Get detailed series information from TVDB API.
     
     Args:
         series_id (str): TVDB series ID
-        headers (Dict[str, str]): API headers with authentication
+        client (_TVDBClient): Authenticated TVDB API client
         
     Returns:
         Optional[Dict[str, Any]]: Series details or None if failed
     """
     try:
-        series_url = f"https://api4.thetvdb.com/v4/series/{series_id}"
+        series_url = f"{TVDB_API_BASE_URL}/series/{series_id}"
         
-        response = requests.get(series_url, headers=headers, timeout=30)
-        response.raise_for_status()
+        response = client.get(series_url)
         
         data = response.json()
         return data.get('data', {})
@@ -202,6 +317,50 @@ def _get_tvdb_series_details(series_id: str, headers: Dict[str, str]) -> Optiona
         return None
 
 
+def _get_tvdb_series_details_bulk(series_ids: List[str], client: _TVDBClient) -> Dict[str, Dict[str, Any]]:
+    """
+    Get series details for many series, using the on-disk per-series cache.
+    
+    Cached responses younger than LISTSYNC_TVDB_SERIES_CACHE_HOURS are reused;
+    the rest are fetched concurrently and written back to the cache.
+    
+    Args:
+        series_ids (List[str]): TVDB series IDs
+        client (_TVDBClient): Authenticated TVDB API client
+        
+    Returns:
+        Dict[str, Dict[str, Any]]: Series details keyed by series ID
+    """
+    cache = _load_json_file(TVDB_SERIES_CACHE_FILE) or {}
+    now = time.time()
+    details_by_id = {}
+    to_fetch = []
+    
+    for series_id in dict.fromkeys(str(sid) for sid in series_ids):
+        entry = cache.get(series_id)
+        if entry and now - entry.get('fetched_at', 0) < TVDB_SERIES_CACHE_TTL:
+            details_by_id[series_id] = entry['data']
+        else:
+            to_fetch.append(series_id)
+    
+    logging.info(f"TVDB series details: {len(details_by_id)} cached, {len(to_fetch)} to fetch")
+    
+    if to_fetch:
+        with ThreadPoolExecutor(max_workers=min(TVDB_MAX_CONCURRENCY, len(to_fetch))) as executor:
+            results = executor.map(lambda sid: _get_tvdb_series_details(sid, client), to_fetch)
+            for series_id, series_details in zip(to_fetch, results):
+                if series_details:
+                    details_by_id[series_id] = series_details
+                    cache[series_id] = {'fetched_at': now, 'data': series_details}
+        
+        # Drop expired entries so the cache file doesn't grow forever
+        cache = {sid: entry for sid, entry in cache.items()
+                 if now - entry.get('fetched_at', 0) < TVDB_SERIES_CACHE_TTL}
+        _save_json_file(TVDB_SERIES_CACHE_FILE, cache)
+    
+    return details_by_id
+
+
 def _process_tvdb_series_item(series: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     """
     Process a single series from TVDB API response
@@ -253,7 +412,7 @@ def _fetch_tvdb_list_scraping(list_id: str) -> List[Dict[str, Any]]:
     logging.info(f"Fetching TVDB list via web scraping: {list_id}")
     
     try:
-        with SB(uc=True, headless=True) as sb:
+        with lease_browser(profile=LIGHTWEIGHT_PROFILE) as sb:
             # Handle full URLs vs list IDs
             if list_id.startswith(('http://', 'https://')):
                 url = list_id.rstrip('/')
@@ -322,8 +481,8 @@ def _process_tvdb_list(sb, url) -> List[Dict[str, Any]]:
         # Additional wait to ensure everything is loaded
         sb.sleep(3)
         
-        # Find all list items (each item is in a div.row)
-        items = sb.find_elements("css selector", 'div.row')
+        # Extract all list items (each item is in a div.row) in a single round-trip
+        items = extract_items(sb, 'div.row', TVDB_ROW_SPEC)
         logging.info(f"Found {len(items)} potential list items")
         
         if not items:
@@ -333,18 +492,13 @@ def _process_tvdb_list(sb, url) -> List[Dict[str, Any]]:
         # Process all items
         for i, item in enumerate(items):
             try:
-                # Look for the title link within this row
-                title_links = item.find_elements("css selector", 'h3.mt-0.mb-0 a')
-                if not title_links:
-                    continue
-                
-                title_link = title_links[0]
-                title = title_link.text.strip()
+                # Rows without a title link are layout rows, not list items
+                title = (item.get('title') or '').strip()
                 if not title:
                     continue
                 
                 # Extract ID and determine media type from href
-                href = title_link.get_attribute("href")
+                href = item.get('href')
                 media_id = None
                 media_type = "unknown"
                 
@@ -360,27 +514,15 @@ def _process_tvdb_list(sb, url) -> List[Dict[str, Any]]:
                         if id_match:
                             media_id = id_match.group(1)
                 
-                # Extract year from the same row
+                # Extract year from the div with fa-film icon in the same row
                 year = None
-                try:
-                    # Look for the year in the div with fa-film icon
-                    year_divs = item.find_elements("css selector", 'div.mb-1')
-                    for year_div in year_divs:
-                        year_text = year_div.text.strip()
-                        year = _extract_year_from_text(year_text)
-                        if year:
-                            break
-                except Exception:
-                    pass
+                for year_text in item.get('year_texts') or []:
+                    year = _extract_year_from_text(year_text)
+                    if year:
+                        break
                 
                 # Extract description if available
-                description = ""
-                try:
-                    desc_p = item.find_elements("css selector", 'p')
-                    if desc_p:
-                        description = desc_p[0].text.strip()
-                except Exception:
-                    pass
+                description = (item.get('description') or '').strip()
                 
                 media_items.append({
                     "title": title,
@@ -404,25 +546,28 @@ def _process_tvdb_list(sb, url) -> List[Dict[str, Any]]:
         return media_items
 
 
-def _enhance_with_tvdb_api(media_items: List[Dict[str, Any]], headers: Dict[str, str]) -> List[Dict[str, Any]]:
+def _enhance_with_tvdb_api(media_items: List[Dict[str, Any]], client: _TVDBClient) -> List[Dict[str, Any]]:
     """
     Enhance scraped data with TVDB API information.
     
     Args:
         media_items (List[Dict[str, Any]]): List of scraped media items
-        headers (Dict[str, str]): API headers with authentication
+        client (_TVDBClient): Authenticated TVDB API client
         
     Returns:
         List[Dict[str, Any]]: Enhanced media items
     """
     enhanced_items = []
     
+    # For TV series, get series details (concurrently, with per-series caching)
+    series_ids = [item['tvdb_id'] for item in media_items
+                  if item.get('tvdb_id') and item.get('media_type') == 'tv']
+    details_by_id = _get_tvdb_series_details_bulk(series_ids, client) if series_ids else {}
+    
     for item in media_items:
         try:
-            # Try to get additional details from TVDB API
             if item.get('tvdb_id') and item.get('media_type') == 'tv':
-                # For TV series, get series details
-                series_details = _get_tvdb_series_details(item['tvdb_id'], headers)
+                series_details = details_by_id.get(str(item['tvdb_id']))
                 if series_details:
                     # Enhance with API data
                     item.update({
@@ -0,0 +1,329 @@
+"""
+Retention, archiving and incremental vacuum for the ListSync database.
+
+Every sync adds a sync_history row and one sync_items row per processed item,
+so the history tables grow without bound. The retention job moves detail rows
+past their retention window to gzip-compressed JSONL files in data/archive/,
+keeps per-session rollups of the archived sync_items, and then hands freed
+pages back to the filesystem in small incremental_vacuum steps while no sync
+is running.
+"""
+
+import gzip
+import json
+import logging
+import os
+import sqlite3
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+from .database import enable_incremental_auto_vacuum, get_connection, get_current_sync_status
+from .utils.logger import DATA_DIR
+
+ARCHIVE_DIR = os.path.join(DATA_DIR, "archive")
+
+# Rows archived per transaction, so the sync process and API are never blocked for long
+RETENTION_BATCH_SIZE = 1000
+
+VACUUM_STEP_PAGES = int(os.getenv('LISTSYNC_VACUUM_STEP_PAGES', '1000') or '1000')
+VACUUM_STEP_PAUSE = 0.1
+VACUUM_MAX_SECONDS = float(os.getenv('LISTSYNC_VACUUM_MAX_SECONDS', '60') or '60')
+
+
+@dataclass(frozen=True)
+class RetentionPolicy:
+    """Days to keep rows of each table; 0 keeps them forever"""
+    sync_items_days: int
+    sync_history_days: int
+    synced_items_days: int
+
+
+def _env_days(name: str, default: int) -> int:
+    """Read a retention period in days from the environment"""
+    try:
+        return max(int(os.getenv(name, str(default)) or default), 0)
+    except ValueError:
+        logging.warning(f"⚠️ Invalid {name}, using {default} days")
+        return default
+
+
+def get_retention_policy() -> RetentionPolicy:
+    """
+    Get the retention policy from the environment.
+
+    Returns:
+        RetentionPolicy: LISTSYNC_RETENTION_SYNC_ITEMS_DAYS (default 30),
+            LISTSYNC_RETENTION_SYNC_HISTORY_DAYS (default 365) and
+            LISTSYNC_RETENTION_SYNCED_ITEMS_DAYS (default 0, keep forever)
+    """
+    return RetentionPolicy(
+        sync_items_days=_env_days('LISTSYNC_RETENTION_SYNC_ITEMS_DAYS', 30),
+        sync_history_days=_env_days('LISTSYNC_RETENTION_SYNC_HISTORY_DAYS', 365),
+        synced_items_days=_env_days('LISTSYNC_RETENTION_SYNCED_ITEMS_DAYS', 0),
+    )
+
+
+def _write_archive(table: str, rows: List[Dict]) -> str:
+    """
+    Write rows to a new gzip-compressed JSONL file in the archive directory.
+
+    Args:
+        table: Table the rows come from, used as the file name prefix
+        rows: Rows as dicts
+
+    Returns:
+        str: Path of the archive file
+    """
+    os.makedirs(ARCHIVE_DIR, exist_ok=True)
+    stamp = datetime.utcnow().strftime('%Y%m%d-%H%M%S-%f')
+    path = os.path.join(ARCHIVE_DIR, f"{table}-{stamp}.jsonl.gz")
+    tmp_path = f"{path}.tmp"
+    with gzip.open(tmp_path, 'wt', encoding='utf-8') as f:
+        for row in rows:
+            f.write(json.dumps(row, default=str) + "\n")
+    os.replace(tmp_path, path)
+    return path
+
+
+def _archive_and_delete(conn: sqlite3.Connection, table: str, rows: List[Dict], statements: List[tuple]) -> None:
+    """
+    Archive rows, then run the statements that remove them and commit.
+
+    The archive file is written before the delete, and removed again if the
+    transaction fails, so rows are never lost or archived twice.
+    """
+    path = _write_archive(table, rows)
+    try:
+        for sql, params in statements:
+            conn.execute(sql, params)
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        os.remove(path)
+        raise
+
+
+def archive_sync_items(days: int) -> int:
+    """
+    Archive sync_items of finished sessions older than days, keeping per-session rollups.
+
+    Args:
+        days: Age of the session in days after which its items are archived
+
+    Returns:
+        int: Number of sync_items rows archived
+    """
+    archived = 0
+    while True:
+        with get_connection() as conn:
+            conn.row_factory = sqlite3.Row
+            session_ids = [row[0] for row in conn.execute('''
+                SELECT id FROM sync_history
+                WHERE in_progress = 0 AND start_time < datetime('now', ?)
+                  AND EXISTS (SELECT 1 FROM sync_items WHERE sync_id = sync_history.id)
+                ORDER BY id
+                LIMIT 50
+            ''', (f'-{days} days',))]
+            if not session_ids:
+                break
+
+            placeholders = ','.join('?' * len(session_ids))
+            rows = [dict(row) for row in conn.execute(f'''
+                SELECT * FROM sync_items WHERE sync_id IN ({placeholders}) ORDER BY id LIMIT ?
+            ''', (*session_ids, RETENTION_BATCH_SIZE))]
+            max_id = rows[-1]['id']
+            batch = f'sync_id IN ({placeholders}) AND id <= ?'
+            _archive_and_delete(conn, 'sync_items', rows, [
+                (f'''
+                    INSERT INTO sync_item_rollups (sync_id, status, media_type, list_type, list_id, count)
+                    SELECT sync_id, COALESCE(status, ''), COALESCE(media_type, ''),
+                           COALESCE(list_type, ''), COALESCE(list_id, ''), COUNT(*)
+                    FROM sync_items WHERE {batch}
+                    GROUP BY 1, 2, 3, 4, 5
+                    ON CONFLICT(sync_id, status, media_type, list_type, list_id)
+                    DO UPDATE SET count = count + excluded.count
+                ''', (*session_ids, max_id)),
+                (f'DELETE FROM sync_items WHERE {batch}', (*session_ids, max_id)),
+            ])
+            archived += len(rows)
+    return archived
+
+
+def archive_sync_history(days: int) -> int:
+    """
+    Archive finished sync_history sessions older than days, with their rollups.
+
+    Run archive_sync_items with the same or a shorter period first, so the
+    sessions' detail rows are archived rather than orphaned.
+
+    Args:
+        days: Age of the session in days after which it is archived
+
+    Returns:
+        int: Number of sessions archived
+    """
+    archived = 0
+    while True:
+        with get_connection() as conn:
+            conn.row_factory = sqlite3.Row
+            sessions = [dict(row) for row in conn.execute('''
+                SELECT * FROM sync_history
+                WHERE in_progress = 0 AND start_time < datetime('now', ?)
+                ORDER BY id
+                LIMIT ?
+            ''', (f'-{days} days', RETENTION_BATCH_SIZE))]
+            if not sessions:
+                break
+
+            session_ids = [session['id'] for session in sessions]
+            placeholders = ','.join('?' * len(session_ids))
+            rollups: Dict[int, List[Dict]] = {}
+            for row in conn.execute(f'SELECT * FROM sync_item_rollups WHERE sync_id IN ({placeholders})', session_ids):
+                rollups.setdefault(row['sync_id'], []).append(dict(row))
+            for session in sessions:
+                session['rollups'] = rollups.get(session['id'], [])
+
+            _archive_and_delete(conn, 'sync_history', sessions, [
+                (f'DELETE FROM sync_item_rollups WHERE sync_id IN ({placeholders})', session_ids),
+                (f'DELETE FROM sync_history WHERE id IN ({placeholders})', session_ids),
+            ])
+            archived += len(sessions)
+    return archived
+
+
+def archive_synced_items(days: int) -> int:
+    """
+    Archive synced_items not synced for more than days, with their list memberships.
+
+    Args:
+        days: Days since last_synced after which an item is archived
+
+    Returns:
+        int: Number of synced_items rows archived
+    """
+    archived = 0
+    while True:
+        with get_connection() as conn:
+            conn.row_factory = sqlite3.Row
+            items = [dict(row) for row in conn.execute('''
+                SELECT * FROM synced_items
+                WHERE last_synced < datetime('now', ?)
+                ORDER BY id
+                LIMIT ?
+            ''', (f'-{days} days', RETENTION_BATCH_SIZE))]
+            if not items:
+                break
+
+            item_ids = [item['id'] for item in items]
+            placeholders = ','.join('?' * len(item_ids))
+            lists: Dict[int, List[Dict]] = {}
+            for row in conn.execute(f'SELECT item_id, list_type, list_id FROM item_lists WHERE item_id IN ({placeholders})', item_ids):
+                lists.setdefault(row['item_id'], []).append({'list_type': row['list_type'], 'list_id': row['list_id']})
+            for item in items:
+                item['lists'] = lists.get(item['id'], [])
+
+            _archive_and_delete(conn, 'synced_items', items, [
+                (f'DELETE FROM item_lists WHERE item_id IN ({placeholders})', item_ids),
+                (f'DELETE FROM synced_items WHERE id IN ({placeholders})', item_ids),
+            ])
+            archived += len(items)
+    return archived
+
+
+def apply_retention(policy: Optional[RetentionPolicy] = None) -> Dict[str, int]:
+    """
+    Archive and delete rows past their retention period.
+
+    Args:
+        policy: Retention periods, defaults to get_retention_policy()
+
+    Returns:
+        Dict[str, int]: Number of rows archived per table
+    """
+    policy = policy or get_retention_policy()
+    archived = {'sync_items': 0, 'sync_history': 0, 'synced_items': 0}
+
+    # Sessions about to be archived take their remaining detail rows with them
+    sync_items_days = [days for days in (policy.sync_items_days, policy.sync_history_days) if days]
+    if sync_items_days:
+        archived['sync_items'] = archive_sync_items(min(sync_items_days))
+    if policy.sync_history_days:
+        archived['sync_history'] = archive_sync_history(policy.sync_history_days)
+    if policy.synced_items_days:
+        archived['synced_items'] = archive_synced_items(policy.synced_items_days)
+
+    if any(archived.values()):
+        logging.info(
+            f"🗄️ Archived {archived['sync_items']} sync items, {archived['sync_history']} sync sessions "
+            f"and {archived['synced_items']} synced items to {ARCHIVE_DIR}"
+        )
+    return archived
+
+
+def run_incremental_vacuum(should_stop: Optional[Callable[[], bool]] = None) -> int:
+    """
+    Release free database pages to the filesystem in small steps.
+
+    Each step is a short write transaction, with a pause between steps so
+    readers and writers get in. Does nothing unless auto_vacuum is INCREMENTAL.
+
+    Args:
+        should_stop: Called between steps; stop early when it returns True
+
+    Returns:
+        int: Number of pages released
+    """
+    with get_connection() as conn:
+        if conn.execute('PRAGMA auto_vacuum').fetchone()[0] != 2:
+            return 0
+
+    released = 0
+    deadline = time.time() + VACUUM_MAX_SECONDS
+    while time.time() < deadline and not (should_stop and should_stop()):
+        with get_connection() as conn:
+            free_pages = conn.execute('PRAGMA freelist_count').fetchone()[0]
+            if not free_pages:
+                break
+            step = min(free_pages, VACUUM_STEP_PAGES)
+            # executescript steps the pragma to completion; execute() frees only one page
+            conn.executescript(f'PRAGMA incremental_vacuum({step})')
+            released += step
+        time.sleep(VACUUM_STEP_PAUSE)
+
+    if released:
+        logging.info(f"Released {released} free database pages")
+    return released
+
+
+_last_maintenance = 0.0
+
+
+def run_idle_maintenance(should_stop: Optional[Callable[[], bool]] = None) -> None:
+    """
+    Apply retention and vacuum between syncs, at most every LISTSYNC_MAINTENANCE_HOURS (default 24).
+
+    The first run after upgrading a large database also rebuilds it once to
+    enable incremental auto-vacuum (see database.enable_incremental_auto_vacuum).
+
+    Args:
+        should_stop: Called between vacuum steps; stop early when it returns True
+            (e.g. when an immediate sync was requested)
+    """
+    global _last_maintenance
+    interval = float(os.getenv('LISTSYNC_MAINTENANCE_HOURS', '24') or '24') * 3600
+    if time.time() - _last_maintenance < interval:
+        return
+
+    try:
+        if get_current_sync_status():
+            # A sync (e.g. a single-list sync started from the UI) is writing
+            return
+        _last_maintenance = time.time()
+        apply_retention()
+        if not (should_stop and should_stop()):
+            enable_incremental_auto_vacuum()
+        run_incremental_vacuum(should_stop)
+    except Exception as e:
+        logging.warning(f"⚠️ Database maintenance failed: {e}")
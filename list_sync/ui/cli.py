@@ -427,10 +427,9 @@ def edit_lists():
         })
     
     # Update database
-    import sqlite3
-    from ..database import DB_FILE
+    from ..database import get_connection
     
-    with sqlite3.connect(DB_FILE) as conn:
+    with get_connection() as conn:
         cursor = conn.cursor()
         cursor.execute("DELETE FROM lists")
         cursor.executemany(
@@ -0,0 +1,215 @@
+"""
+Offline AniList/MyAnimeList → TMDB mapping for anime list items.
+
+Anime titles rarely match TMDB by name, so title searches through Trakt are
+slow and often miss. This module keeps a local copy of the community
+anime-lists mapping (refreshed periodically) and loads it into sorted integer
+arrays, so an AniList or MAL ID resolves to a TMDB ID and media type with a
+binary search and no network calls.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from array import array
+from bisect import bisect_left
+from typing import Any, Dict, List, Optional, Tuple
+
+import requests
+
+from .logger import DATA_DIR
+
+ANIME_MAPPING_URL = os.getenv(
+    'LISTSYNC_ANIME_MAPPING_URL',
+    'https://raw.githubusercontent.com/Fribb/anime-lists/master/anime-list-mini.json'
+)
+ANIME_MAPPING_FILE = os.path.join(DATA_DIR, "anime_mapping.json")
+ANIME_MAPPING_TTL = float(os.getenv('LISTSYNC_ANIME_MAPPING_HOURS', '168') or '168') * 3600
+# After a failed download or load, wait this long before trying again
+ANIME_MAPPING_RETRY_INTERVAL = float(os.getenv('LISTSYNC_ANIME_MAPPING_RETRY_MINUTES', '30') or '30') * 60
+
+# Mapping entry types that TMDB lists as movies; everything else is requested as TV
+_MOVIE_TYPES = {'MOVIE'}
+
+
+def is_anime_mapping_enabled() -> bool:
+    """
+    Check whether the offline anime mapping should be used.
+
+    Returns:
+        bool: False if LISTSYNC_ANIME_MAPPING is set to 'false'
+    """
+    return os.getenv('LISTSYNC_ANIME_MAPPING', 'true').lower() != 'false'
+
+
+class _IdIndex:
+    """Sorted source IDs with packed (tmdb_id << 1 | is_movie) values"""
+
+    def __init__(self, pairs: List[Tuple[int, int]]):
+        pairs.sort()
+        self.keys = array('L', (key for key, _ in pairs))
+        self.values = array('L', (value for _, value in pairs))
+
+    def get(self, key: int) -> Optional[Tuple[int, str]]:
+        pos = bisect_left(self.keys, key)
+        if pos == len(self.keys) or self.keys[pos] != key:
+            return None
+        packed = self.values[pos]
+        return packed >> 1, "movie" if packed & 1 else "tv"
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+
+class AnimeMapping:
+    """Lookup of TMDB ID and media type by AniList or MAL ID"""
+
+    def __init__(self, entries: List[Dict[str, Any]]):
+        """
+        Build the lookup from mapping entries.
+
+        Args:
+            entries: Entries with anilist_id/mal_id, themoviedb_id and type
+        """
+        anilist_pairs = []
+        mal_pairs = []
+        for entry in entries:
+            tmdb_id = _as_int(entry.get('themoviedb_id'))
+            if not tmdb_id:
+                continue
+            packed = (tmdb_id << 1) | (1 if str(entry.get('type', '')).upper() in _MOVIE_TYPES else 0)
+            anilist_id = _as_int(entry.get('anilist_id'))
+            if anilist_id:
+                anilist_pairs.append((anilist_id, packed))
+            mal_id = _as_int(entry.get('mal_id'))
+            if mal_id:
+                mal_pairs.append((mal_id, packed))
+
+        self._anilist = _IdIndex(anilist_pairs)
+        self._mal = _IdIndex(mal_pairs)
+
+    def lookup(self, anilist_id: Any = None, mal_id: Any = None) -> Optional[Tuple[int, str]]:
+        """
+        Resolve an anime to TMDB, trying the AniList ID before the MAL ID.
+
+        Args:
+            anilist_id: AniList media ID
+            mal_id: MyAnimeList ID
+
+        Returns:
+            Optional[Tuple[int, str]]: (tmdb_id, media_type) or None if unmapped
+        """
+        anilist_id = _as_int(anilist_id)
+        if anilist_id:
+            result = self._anilist.get(anilist_id)
+            if result:
+                return result
+        mal_id = _as_int(mal_id)
+        if mal_id:
+            return self._mal.get(mal_id)
+        return None
+
+    def __len__(self) -> int:
+        return len(self._anilist) + len(self._mal)
+
+
+def _as_int(value: Any) -> Optional[int]:
+    """Convert an ID to a positive int, or None"""
+    if isinstance(value, list):
+        # Some entries list several TMDB IDs; the first is the primary one
+        value = value[0] if value else None
+    try:
+        value = int(value)
+    except (TypeError, ValueError):
+        return None
+    return value if value > 0 else None
+
+
+def _refresh_mapping_file() -> bool:
+    """
+    Download the mapping if the local copy is missing or older than the refresh interval.
+
+    Returns:
+        bool: False if a download was due and failed
+    """
+    try:
+        age = time.time() - os.path.getmtime(ANIME_MAPPING_FILE)
+    except OSError:
+        age = None
+    if age is not None and age < ANIME_MAPPING_TTL:
+        return True
+
+    logging.info(f"Downloading anime ID mapping from {ANIME_MAPPING_URL}")
+    tmp_path = f"{ANIME_MAPPING_FILE}.tmp"
+    try:
+        response = requests.get(ANIME_MAPPING_URL, timeout=60)
+        response.raise_for_status()
+        # Validate before replacing a working copy
+        if not isinstance(response.json(), list):
+            raise ValueError("mapping is not a JSON array")
+        os.makedirs(os.path.dirname(ANIME_MAPPING_FILE), exist_ok=True)
+        with open(tmp_path, 'wb') as f:
+            f.write(response.content)
+        os.replace(tmp_path, ANIME_MAPPING_FILE)
+        return True
+    except Exception as e:
+        if age is None:
+            logging.warning(f"⚠️ Could not download anime ID mapping: {e}")
+        else:
+            logging.warning(f"⚠️ Could not refresh anime ID mapping, using copy from {age / 3600:.0f}h ago: {e}")
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        return False
+
+
+_anime_mapping: Optional[AnimeMapping] = None
+_anime_mapping_loaded_at = 0.0
+_anime_mapping_failed_at = 0.0
+_anime_mapping_lock = threading.Lock()
+
+
+def get_anime_mapping() -> Optional[AnimeMapping]:
+    """
+    Get the anime mapping, downloading or refreshing it when due.
+
+    A failed download or load is remembered for ANIME_MAPPING_RETRY_INTERVAL,
+    so resolving many items while the mapping source is offline does not
+    retry the download for every item.
+
+    Returns:
+        Optional[AnimeMapping]: Loaded mapping, or None if disabled or unavailable
+    """
+    global _anime_mapping, _anime_mapping_loaded_at, _anime_mapping_failed_at
+    if not is_anime_mapping_enabled():
+        return None
+
+    with _anime_mapping_lock:
+        if _anime_mapping is not None and time.time() - _anime_mapping_loaded_at < ANIME_MAPPING_TTL:
+            return _anime_mapping
+        if time.time() - _anime_mapping_failed_at < ANIME_MAPPING_RETRY_INTERVAL:
+            return _anime_mapping
+
+        if not _refresh_mapping_file():
+            _anime_mapping_failed_at = time.time()
+            if _anime_mapping is not None:
+                # Keep using the mapping already in memory until the next retry
+                return _anime_mapping
+        try:
+            with open(ANIME_MAPPING_FILE, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+        except FileNotFoundError:
+            _anime_mapping_failed_at = time.time()
+            return _anime_mapping
+        except (OSError, ValueError) as e:
+            logging.warning(f"⚠️ Could not read anime ID mapping: {e}")
+            _anime_mapping_failed_at = time.time()
+            return _anime_mapping
+
+        _anime_mapping = AnimeMapping(entries)
+        _anime_mapping_loaded_at = time.time()
+        logging.info(f"Loaded anime ID mapping with {len(_anime_mapping)} AniList/MAL IDs")
+        return _anime_mapping
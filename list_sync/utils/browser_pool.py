@@ -0,0 +1,299 @@
+"""
+Shared pool of long-lived headless browser sessions for the scraping providers.
+
+Launching Chrome and patching the undetected driver for every list is the most
+expensive part of a scrape, and concurrent launches contend on the driver lock.
+Providers lease a warm SeleniumBase session from this pool instead and return
+it when they are done; the pool health-checks sessions on lease, recycles a
+browser after a configurable number of page loads, closes idle browsers and
+caps how many browsers can run at once.
+"""
+
+import atexit
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional, Tuple
+
+from seleniumbase import SB
+
+from .scrape_profile import log_page_stats, prepare_browser, profile_sb_options, resolve_profile
+
+# Default SeleniumBase options used by every scraping provider
+DEFAULT_SB_OPTIONS = {'uc': True, 'headless': True}
+
+
+class _PooledBrowser:
+    """A SeleniumBase session kept open outside of a `with` block"""
+
+    def __init__(self, key: Tuple, sb_options: Dict[str, Any], profile: Optional[str] = None):
+        self.key = key
+        self._context = SB(**sb_options)
+        self.sb = self._context.__enter__()
+        self.pages_loaded = 0
+        self.created_at = time.monotonic()
+        self.last_used = self.created_at
+
+        prepare_browser(self.sb, profile)
+
+        # Count navigations so the pool can recycle the browser after N pages
+        original_open = _instrument_open(self.sb, profile)
+
+        def counting_open(url, *args, **kwargs):
+            self.pages_loaded += 1
+            return original_open(url, *args, **kwargs)
+
+        self.sb.open = counting_open
+
+    def is_healthy(self) -> bool:
+        """Check that the browser still responds to commands"""
+        try:
+            return self.sb.execute_script("return 1") == 1
+        except Exception:
+            return False
+
+    def reset(self) -> None:
+        """Leave the browser on a blank page so the next lease starts clean"""
+        self.sb.driver.get("about:blank")
+
+    def close(self) -> None:
+        try:
+            self._context.__exit__(None, None, None)
+        except Exception as e:
+            logging.debug(f"Error closing pooled browser: {e}")
+
+
+class BrowserPool:
+    """Thread-safe pool of warm SeleniumBase browser sessions"""
+
+    def __init__(self, max_browsers: int = 2, max_pages_per_browser: int = 50, idle_timeout: int = 300):
+        """
+        Initialize browser pool
+
+        Args:
+            max_browsers: Maximum number of browsers running (leased or idle) at once
+            max_pages_per_browser: Page loads after which a browser is recycled
+            idle_timeout: Seconds an unused browser is kept before it is closed
+        """
+        self.max_browsers = max(int(max_browsers), 1)
+        self.max_pages_per_browser = max(int(max_pages_per_browser), 1)
+        self.idle_timeout = idle_timeout
+        self._slots = threading.BoundedSemaphore(self.max_browsers)
+        self._idle: List[_PooledBrowser] = []
+        self._lock = threading.Lock()
+        # Serialize launches so undetected-driver patching never runs concurrently
+        self._launch_lock = threading.Lock()
+        self._reaper: Optional[threading.Thread] = None
+        self._closed = False
+
+    @contextmanager
+    def lease(self, profile: Optional[str] = None, **sb_options):
+        """
+        Lease a browser session for the duration of a `with` block.
+
+        Args:
+            profile: Optional scraping profile (see scrape_profile)
+            **sb_options: SeleniumBase options; browsers are only reused for identical options
+
+        Yields:
+            SeleniumBase instance
+        """
+        options = {**DEFAULT_SB_OPTIONS, **profile_sb_options(profile), **sb_options}
+        key = (profile,) + tuple(sorted(options.items()))
+
+        self._slots.acquire()
+        browser = None
+        try:
+            browser = self._checkout(key, options, profile)
+            failed = False
+            try:
+                yield browser.sb
+            except BaseException:
+                failed = True
+                raise
+            finally:
+                self._checkin(browser, check_health=failed)
+        finally:
+            self._slots.release()
+
+    def _checkout(self, key: Tuple, options: Dict[str, Any], profile: Optional[str] = None) -> _PooledBrowser:
+        """Take a healthy idle browser with matching options, or launch a new one"""
+        stale = []
+        browser = None
+        with self._lock:
+            for candidate in list(self._idle):
+                if candidate.key == key:
+                    self._idle.remove(candidate)
+                    browser = candidate
+                    break
+            # Free the slot held by an idle browser with different options
+            if browser is None and self._idle:
+                stale.append(self._idle.pop(0))
+
+        for old in stale:
+            old.close()
+
+        if browser is not None:
+            if browser.is_healthy():
+                logging.debug(f"Reusing pooled browser ({browser.pages_loaded} pages loaded)")
+                return browser
+            logging.warning("Pooled browser failed health check - launching a new one")
+            browser.close()
+
+        with self._launch_lock:
+            started = time.monotonic()
+            browser = _PooledBrowser(key, options, profile)
+            logging.info(f"Launched pooled browser in {time.monotonic() - started:.1f}s")
+        self._ensure_reaper()
+        return browser
+
+    def _checkin(self, browser: _PooledBrowser, check_health: bool = False) -> None:
+        """Return a browser to the pool, recycling it if worn out or broken"""
+        if self._closed:
+            browser.close()
+            return
+
+        if browser.pages_loaded >= self.max_pages_per_browser:
+            logging.info(f"Recycling pooled browser after {browser.pages_loaded} pages")
+            browser.close()
+            return
+
+        if check_health and not browser.is_healthy():
+            logging.warning("Discarding pooled browser that stopped responding")
+            browser.close()
+            return
+
+        try:
+            browser.reset()
+        except Exception:
+            browser.close()
+            return
+
+        browser.last_used = time.monotonic()
+        with self._lock:
+            self._idle.append(browser)
+
+    def _ensure_reaper(self) -> None:
+        """Start the background thread that closes idle browsers"""
+        with self._lock:
+            if self._reaper is None or not self._reaper.is_alive():
+                self._reaper = threading.Thread(target=self._reap_idle, name="browser-pool-reaper", daemon=True)
+                self._reaper.start()
+
+    def _reap_idle(self) -> None:
+        while not self._closed:
+            time.sleep(min(60, max(self.idle_timeout, 1)))
+            self.close_idle(self.idle_timeout)
+
+    def close_idle(self, older_than: float = 0) -> int:
+        """
+        Close idle browsers that have not been used recently.
+
+        Args:
+            older_than: Only close browsers idle for at least this many seconds
+
+        Returns:
+            int: Number of browsers closed
+        """
+        now = time.monotonic()
+        with self._lock:
+            expired = [b for b in self._idle if now - b.last_used >= older_than]
+            self._idle = [b for b in self._idle if b not in expired]
+        for browser in expired:
+            browser.close()
+        if expired:
+            logging.info(f"Closed {len(expired)} idle pooled browser(s)")
+        return len(expired)
+
+    def shutdown(self) -> None:
+        """Close every idle browser and stop pooling new ones"""
+        self._closed = True
+        self.close_idle()
+
+
+_browser_pool: Optional[BrowserPool] = None
+_browser_pool_lock = threading.Lock()
+
+
+def is_browser_pool_enabled() -> bool:
+    """
+    Check whether browser sessions should be pooled.
+
+    Returns:
+        bool: False if LISTSYNC_BROWSER_POOL is set to 'false'
+    """
+    return os.getenv('LISTSYNC_BROWSER_POOL', 'true').lower() != 'false'
+
+
+def get_browser_pool_size() -> int:
+    """
+    Get the maximum number of browsers the pool runs at once.
+
+    Returns:
+        int: LISTSYNC_BROWSER_POOL_SIZE (default 2)
+    """
+    return max(int(os.getenv('LISTSYNC_BROWSER_POOL_SIZE', '2') or '2'), 1)
+
+
+def get_browser_pool() -> BrowserPool:
+    """
+    Get the process-wide browser pool, creating it on first use.
+
+    Returns:
+        BrowserPool: Shared browser pool
+    """
+    global _browser_pool
+    with _browser_pool_lock:
+        if _browser_pool is None:
+            _browser_pool = BrowserPool(
+                max_browsers=get_browser_pool_size(),
+                max_pages_per_browser=int(os.getenv('LISTSYNC_BROWSER_MAX_PAGES', '50') or '50'),
+                idle_timeout=int(os.getenv('LISTSYNC_BROWSER_IDLE_TIMEOUT', '300') or '300'),
+            )
+            atexit.register(_browser_pool.shutdown)
+        return _browser_pool
+
+
+def _instrument_open(sb, profile: Optional[str]):
+    """Log page stats after each `sb.open` for profiles that track them; returns the wrapped open"""
+    original_open = sb.open
+    if profile is None:
+        return original_open
+
+    def open_with_stats(url, *args, **kwargs):
+        result = original_open(url, *args, **kwargs)
+        log_page_stats(sb, url)
+        return result
+
+    sb.open = open_with_stats
+    return open_with_stats
+
+
+@contextmanager
+def lease_browser(profile: Optional[str] = None, **sb_options):
+    """
+    Lease a headless browser session for scraping.
+
+    Uses the shared pool unless LISTSYNC_BROWSER_POOL=false, in which case a
+    fresh browser is launched and closed around the `with` block.
+
+    Args:
+        profile: Optional scraping profile, e.g. scrape_profile.LIGHTWEIGHT_PROFILE
+        **sb_options: Extra SeleniumBase options
+
+    Yields:
+        SeleniumBase instance
+    """
+    profile = resolve_profile(profile)
+
+    if not is_browser_pool_enabled():
+        with SB(**{**DEFAULT_SB_OPTIONS, **profile_sb_options(profile), **sb_options}) as sb:
+            prepare_browser(sb, profile)
+            _instrument_open(sb, profile)
+            yield sb
+        return
+
+    with get_browser_pool().lease(profile, **sb_options) as sb:
+        yield sb
@@ -0,0 +1,140 @@
+"""
+Pooled SQLite connections for the ListSync database.
+
+Opening a connection per query throws away SQLite's page cache and its
+prepared-statement cache, and the default rollback journal makes readers and
+the writer block each other while the sync process and the API server share
+the same file. Connections handed out here are long-lived, run in WAL mode
+with tuned pragmas and a busy timeout, and go back to an idle pool when they
+are closed, so their prepared statements are reused by later calls.
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import List, Optional
+
+# Pragmas applied to every new connection
+CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA temp_store = MEMORY",
+    f"PRAGMA cache_size = -{int(os.getenv('LISTSYNC_DB_CACHE_KB', '16000') or '16000')}",
+    f"PRAGMA mmap_size = {int(os.getenv('LISTSYNC_DB_MMAP_MB', '128') or '128') * 1024 * 1024}",
+)
+
+DB_BUSY_TIMEOUT = float(os.getenv('LISTSYNC_DB_BUSY_TIMEOUT', '30') or '30')
+DB_STATEMENT_CACHE_SIZE = 256
+
+
+class PooledConnection(sqlite3.Connection):
+    """SQLite connection whose close() returns it to its pool instead of closing it"""
+
+    pool: Optional["SQLitePool"] = None
+
+    def close(self) -> None:
+        if self.pool is None:
+            super().close()
+        else:
+            self.pool.release(self)
+
+    def close_for_real(self) -> None:
+        super().close()
+
+
+class SQLitePool:
+    """Thread-safe pool of idle SQLite connections to one database file"""
+
+    def __init__(self, path: str, max_idle: int = 8):
+        """
+        Initialize connection pool
+
+        Args:
+            path: Database file path
+            max_idle: Idle connections kept open; extra connections are closed on release
+        """
+        self.path = path
+        self.max_idle = max_idle
+        self._idle: List[PooledConnection] = []
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+        self._wal_enabled = False
+
+    def _connect(self) -> PooledConnection:
+        conn = sqlite3.connect(
+            self.path,
+            timeout=DB_BUSY_TIMEOUT,
+            factory=PooledConnection,
+            check_same_thread=False,
+            cached_statements=DB_STATEMENT_CACHE_SIZE,
+        )
+        if not self._wal_enabled:
+            # journal_mode is stored in the database file, so this only needs to succeed once
+            try:
+                mode = conn.execute("PRAGMA journal_mode = WAL").fetchone()[0]
+                self._wal_enabled = str(mode).lower() == 'wal'
+                if not self._wal_enabled:
+                    logging.warning(f"⚠️ SQLite WAL mode unavailable, using journal mode '{mode}'")
+            except sqlite3.DatabaseError as e:
+                logging.warning(f"⚠️ Could not enable SQLite WAL mode: {e}")
+        for pragma in CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        conn.pool = self
+        return conn
+
+    def acquire(self) -> PooledConnection:
+        """
+        Check out a connection; call close() on it to return it to the pool.
+
+        Returns:
+            PooledConnection: Open connection with no transaction in progress
+        """
+        with self._lock:
+            if self._pid != os.getpid():
+                # Connections must not cross a fork; the child starts with an empty pool
+                self._idle = []
+                self._pid = os.getpid()
+            conn = self._idle.pop() if self._idle else None
+        return conn or self._connect()
+
+    def release(self, conn: PooledConnection) -> None:
+        """Return a connection to the pool, discarding any uncommitted work"""
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+            conn.row_factory = None
+        except sqlite3.Error:
+            conn.close_for_real()
+            return
+
+        with self._lock:
+            if self._pid == os.getpid() and len(self._idle) < self.max_idle:
+                self._idle.append(conn)
+                return
+        conn.close_for_real()
+
+    @contextmanager
+    def connection(self):
+        """
+        Lease a connection for a `with` block.
+
+        Commits when the block succeeds and rolls back when it raises, like
+        `with sqlite3.connect(...)`, then returns the connection to the pool.
+
+        Yields:
+            PooledConnection: Open connection
+        """
+        conn = self.acquire()
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def close_all(self) -> None:
+        """Close every idle connection"""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close_for_real()
@@ -0,0 +1,84 @@
+"""
+Bulk DOM extraction for the Selenium scrapers.
+
+Reading attributes element by element costs one WebDriver round-trip per
+call, which adds up to thousands of calls on long lists. Providers instead
+declare an extraction spec once and `extract_items` collects every field for
+every item on the page with a single execute_script call.
+"""
+
+import logging
+from typing import Any, Dict, List, Optional
+
+# Attributes read as DOM properties so URLs come back absolute, matching get_attribute()
+_PROPERTY_ATTRIBUTES = ('href', 'src')
+
+_EXTRACT_JS = """
+var itemSelector = arguments[0], spec = arguments[1], propertyAttrs = arguments[2];
+
+function read(el, attr) {
+    if (!el) { return null; }
+    if (attr === 'text') {
+        var text = el.innerText !== undefined ? el.innerText : el.textContent;
+        return text ? text.trim() : '';
+    }
+    if (propertyAttrs.indexOf(attr) !== -1) { return el[attr] || el.getAttribute(attr); }
+    return el.getAttribute(attr);
+}
+
+var results = [];
+var items = document.querySelectorAll(itemSelector);
+for (var i = 0; i < items.length; i++) {
+    var row = {};
+    for (var name in spec) {
+        var field = spec[name];
+        if (field.multiple) {
+            var matches = field.selector ? items[i].querySelectorAll(field.selector) : [items[i]];
+            var values = [];
+            for (var j = 0; j < matches.length; j++) { values.push(read(matches[j], field.attr)); }
+            row[name] = values;
+        } else {
+            var el = field.selector ? items[i].querySelector(field.selector) : items[i];
+            row[name] = read(el, field.attr);
+        }
+    }
+    results.push(row);
+}
+return results;
+"""
+
+
+def field(selector: Optional[str] = None, attr: str = 'text', multiple: bool = False) -> Dict[str, Any]:
+    """
+    Describe one value to extract from each item.
+
+    Args:
+        selector (Optional[str]): CSS selector relative to the item; None for the item itself
+        attr (str): Attribute name, or 'text' for the element's visible text
+        multiple (bool): Return a list of values from every match instead of the first
+
+    Returns:
+        Dict[str, Any]: Field spec for `extract_items`
+    """
+    return {'selector': selector, 'attr': attr, 'multiple': multiple}
+
+
+def extract_items(sb, item_selector: str, spec: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Extract fields from every element matching `item_selector` in one round-trip.
+
+    Missing elements come back as None (or an empty list for `multiple` fields).
+
+    Args:
+        sb: SeleniumBase instance
+        item_selector (str): CSS selector for the list items
+        spec (Dict[str, Dict[str, Any]]): Output key -> field spec built with `field()`
+
+    Returns:
+        List[Dict[str, Any]]: One dict per item, in document order
+    """
+    rows = sb.execute_script(_EXTRACT_JS, item_selector, spec, list(_PROPERTY_ATTRIBUTES))
+    if rows is None:
+        logging.warning(f"Bulk extraction returned nothing for selector: {item_selector}")
+        return []
+    return rows
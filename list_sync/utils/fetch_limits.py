@@ -0,0 +1,73 @@
+"""
+Concurrency limits for fetching several lists at once.
+
+Lists are fetched in parallel, but each provider only gets a few lists in
+flight at a time so one source's rate limit is not hammered, and providers
+that drive a headless browser share a single limit sized to the browser pool
+(so queued scrapes wait for a slot here instead of holding a worker thread
+inside the pool).
+"""
+
+import os
+import threading
+from contextlib import contextmanager
+from typing import Dict
+
+from .browser_pool import get_browser_pool_size
+
+# Providers that scrape with a headless browser
+BROWSER_PROVIDERS = frozenset({'imdb', 'letterboxd', 'mdblist', 'tvdb'})
+
+# Lists fetched at once per API provider, overridable with LISTSYNC_<PROVIDER>_LIST_CONCURRENCY
+API_PROVIDER_LIMITS = {
+    'trakt': 3,
+    'trakt_special': 2,
+    'tmdb': 3,
+    'anilist': 2,
+    'simkl': 2,
+    'stevenlu': 1,
+    'collections': 2,
+}
+DEFAULT_PROVIDER_LIMIT = 2
+
+
+def get_list_fetch_concurrency() -> int:
+    """
+    Get how many lists are fetched at once across all providers.
+
+    Returns:
+        int: LISTSYNC_LIST_CONCURRENCY (default 4); 1 fetches lists one after another
+    """
+    return max(int(os.getenv('LISTSYNC_LIST_CONCURRENCY', '4') or '4'), 1)
+
+
+class ProviderFetchLimits:
+    """Per-provider semaphores plus one shared semaphore for browser providers"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._semaphores: Dict[str, threading.BoundedSemaphore] = {}
+        self._browser_semaphore = threading.BoundedSemaphore(get_browser_pool_size())
+
+    def _provider_semaphore(self, provider_type: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            semaphore = self._semaphores.get(provider_type)
+            if semaphore is None:
+                default = API_PROVIDER_LIMITS.get(provider_type, DEFAULT_PROVIDER_LIMIT)
+                env_name = f"LISTSYNC_{provider_type.upper()}_LIST_CONCURRENCY"
+                limit = max(int(os.getenv(env_name, str(default)) or default), 1)
+                semaphore = threading.BoundedSemaphore(limit)
+                self._semaphores[provider_type] = semaphore
+            return semaphore
+
+    @contextmanager
+    def slot(self, provider_type: str):
+        """
+        Hold a fetch slot for one list of the given provider.
+
+        Args:
+            provider_type (str): Provider type of the list being fetched
+        """
+        semaphore = self._browser_semaphore if provider_type in BROWSER_PROVIDERS else self._provider_semaphore(provider_type)
+        with semaphore:
+            yield
@@ -0,0 +1,267 @@
+"""
+On-disk conditional-request cache for JSON list endpoints.
+
+Responses are stored together with their ETag/Last-Modified validators so the
+next fetch can be revalidated with If-None-Match/If-Modified-Since. A 304 reply
+is answered from disk instead of downloading the full body again. Entries are
+keyed by method, URL, query parameters, a hash of the request body (for
+GraphQL-style POSTs) and a hash of the credential headers, so a response fetched
+with one user's token is never replayed for another. The cache directory is kept
+under a size limit by evicting the least recently used entries.
+
+The cache is opt-in (LISTSYNC_HTTP_CACHE=true) because it writes response
+bodies, including those of private, user-scoped lists, to the data directory.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, Optional
+
+import requests
+
+from .logger import DATA_DIR
+
+HTTP_CACHE_DIR = os.path.join(DATA_DIR, "http_cache")
+HTTP_CACHE_MAX_BYTES = int(os.getenv('LISTSYNC_HTTP_CACHE_MAX_MB', '100') or '100') * 1024 * 1024
+
+# Request headers that identify the caller; responses may be scoped to them
+CREDENTIAL_HEADERS = ('authorization', 'cookie', 'trakt-api-key', 'x-api-key', 'x-plex-token')
+
+
+def is_http_cache_enabled() -> bool:
+    """
+    Check whether the conditional-request cache is enabled.
+
+    Returns:
+        bool: True if LISTSYNC_HTTP_CACHE is set to 'true'
+    """
+    return os.getenv('LISTSYNC_HTTP_CACHE', 'false').lower() == 'true'
+
+
+class HTTPCache:
+    """Stores response bodies and their validators as JSON files"""
+
+    def __init__(self, cache_dir: str = HTTP_CACHE_DIR, max_bytes: int = HTTP_CACHE_MAX_BYTES):
+        """
+        Initialize HTTP cache
+
+        Args:
+            cache_dir: Directory where cache entries are written
+            max_bytes: Total size above which least recently used entries are evicted
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._total_bytes: Optional[int] = None
+
+    def make_key(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        body: Any = None,
+        headers: Optional[Dict[str, str]] = None
+    ) -> str:
+        """Build a stable cache key for a request from its method, URL, parameters, body and credentials"""
+        credentials = sorted(
+            (name.lower(), value) for name, value in (headers or {}).items()
+            if name.lower() in CREDENTIAL_HEADERS
+        )
+        credentials_hash = hashlib.sha256(json.dumps(credentials).encode('utf-8')).hexdigest() if credentials else None
+        if body is None:
+            body_hash = None
+        else:
+            encoded = body if isinstance(body, (bytes, str)) else json.dumps(body, sort_keys=True, default=str)
+            if isinstance(encoded, str):
+                encoded = encoded.encode('utf-8')
+            body_hash = hashlib.sha256(encoded).hexdigest()
+        raw = json.dumps([method.upper(), url, sorted((params or {}).items()), body_hash, credentials_hash], default=str)
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def load(self, key: str) -> Optional[Dict[str, Any]]:
+        """Load a cache entry, or None if missing or unreadable"""
+        path = self._path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+            # Record the access so eviction is least-recently-used
+            os.utime(path, None)
+            return entry
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logging.debug(f"Ignoring unreadable HTTP cache entry {key}: {e}")
+            return None
+
+    def store(self, key: str, url: str, response: requests.Response) -> None:
+        """Store a response if the server sent any validators"""
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if not etag and not last_modified:
+            return
+
+        entry = {
+            'url': url,
+            'etag': etag,
+            'last_modified': last_modified,
+            'stored_at': time.time(),
+            'body': response.text,
+        }
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with self._lock:
+                os.makedirs(self.cache_dir, exist_ok=True)
+            previous_size = os.path.getsize(path) if os.path.exists(path) else 0
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, path)
+            self._account(os.path.getsize(path) - previous_size)
+        except OSError as e:
+            logging.debug(f"Could not write HTTP cache entry for {url}: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+    def _account(self, delta: int) -> None:
+        """Track the cache size and evict entries once it exceeds the limit"""
+        with self._lock:
+            if self._total_bytes is None:
+                self._total_bytes = sum(size for _, size, _ in self._entries())
+            else:
+                self._total_bytes += delta
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def _entries(self):
+        """List (path, size, last access) for every cache entry"""
+        entries = []
+        try:
+            with os.scandir(self.cache_dir) as it:
+                for dir_entry in it:
+                    if dir_entry.name.endswith('.json'):
+                        stat = dir_entry.stat()
+                        entries.append((dir_entry.path, stat.st_size, stat.st_mtime))
+        except OSError:
+            pass
+        return entries
+
+    def _evict(self) -> None:
+        """Remove least recently used entries until the cache is back under 90% of its limit"""
+        entries = sorted(self._entries(), key=lambda e: e[2])
+        total = sum(size for _, size, _ in entries)
+        target = self.max_bytes * 0.9
+        evicted = 0
+        for path, size, _ in entries:
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+                total -= size
+                evicted += 1
+            except OSError:
+                pass
+        self._total_bytes = total
+        if evicted:
+            logging.debug(f"Evicted {evicted} HTTP cache entries ({total} bytes remain)")
+
+
+_http_cache: Optional[HTTPCache] = None
+
+
+def get_http_cache() -> HTTPCache:
+    """Get the shared HTTP cache instance"""
+    global _http_cache
+    if _http_cache is None:
+        _http_cache = HTTPCache()
+    return _http_cache
+
+
+def cached_get_json(
+    url: str,
+    params: Optional[Dict[str, Any]] = None,
+    headers: Optional[Dict[str, str]] = None,
+    timeout: int = 30,
+    session: Optional[requests.Session] = None
+) -> Any:
+    """
+    GET a JSON document, revalidating against the on-disk cache when enabled.
+
+    Args:
+        url (str): Request URL
+        params (Optional[Dict[str, Any]]): Query parameters
+        headers (Optional[Dict[str, str]]): Request headers; credential headers are part of the cache key
+        timeout (int): Request timeout in seconds
+        session (Optional[requests.Session]): Session to reuse pooled connections
+
+    Returns:
+        Any: Decoded JSON body (from the network or from cache on a 304)
+
+    Raises:
+        requests.HTTPError: If the server returns an error status
+    """
+    return cached_request_json('GET', url, params=params, headers=headers, timeout=timeout, session=session)
+
+
+def cached_request_json(
+    method: str,
+    url: str,
+    params: Optional[Dict[str, Any]] = None,
+    json_body: Any = None,
+    headers: Optional[Dict[str, str]] = None,
+    timeout: int = 30,
+    session: Optional[requests.Session] = None
+) -> Any:
+    """
+    Send a request for a JSON document, revalidating against the on-disk cache when enabled.
+
+    Args:
+        method (str): HTTP method, e.g. 'GET' or 'POST' for GraphQL endpoints
+        url (str): Request URL
+        params (Optional[Dict[str, Any]]): Query parameters
+        json_body (Any): JSON request body; part of the cache key
+        headers (Optional[Dict[str, str]]): Request headers; credential headers are part of the cache key
+        timeout (int): Request timeout in seconds
+        session (Optional[requests.Session]): Session to reuse pooled connections
+
+    Returns:
+        Any: Decoded JSON body (from the network or from cache on a 304)
+
+    Raises:
+        requests.HTTPError: If the server returns an error status
+    """
+    http = session or requests
+
+    if not is_http_cache_enabled():
+        response = http.request(method, url, params=params, json=json_body, headers=headers, timeout=timeout)
+        response.raise_for_status()
+        return response.json()
+
+    cache = get_http_cache()
+    key = cache.make_key(method, url, params, json_body, headers)
+    entry = cache.load(key)
+
+    request_headers = dict(headers or {})
+    if entry:
+        if entry.get('etag'):
+            request_headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            request_headers['If-Modified-Since'] = entry['last_modified']
+
+    response = http.request(method, url, params=params, json=json_body, headers=request_headers, timeout=timeout)
+
+    if response.status_code == 304 and entry:
+        logging.debug(f"HTTP cache revalidated (304): {url}")
+        return json.loads(entry['body'])
+
+    response.raise_for_status()
+    cache.store(key, url, response)
+    return response.json()
@@ -0,0 +1,169 @@
+"""
+Readiness conditions for Selenium page loads.
+
+These replace fixed sleeps in the scraping providers: each helper polls the
+page with a single execute_script round-trip and returns as soon as the
+condition holds, falling back to a short timeout.
+"""
+
+import logging
+import time
+from typing import List, Optional
+
+_FIRST_MATCHING_SELECTOR_JS = """
+var selectors = arguments[0];
+for (var i = 0; i < selectors.length; i++) {
+    if (document.querySelector(selectors[i])) { return selectors[i]; }
+}
+return null;
+"""
+
+_NETWORK_STATE_JS = """
+return [document.readyState,
+        performance.getEntriesByType('resource').length];
+"""
+
+
+def wait_for_any_selector(sb, selectors: List[str], timeout: float = 10, poll_interval: float = 0.2) -> Optional[str]:
+    """
+    Wait until any of the given selectors is present in the DOM.
+
+    Args:
+        sb: SeleniumBase instance
+        selectors (List[str]): CSS selectors, in order of preference
+        timeout (float): Maximum seconds to wait
+        poll_interval (float): Seconds between checks
+
+    Returns:
+        Optional[str]: The first matching selector, or None on timeout
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            match = sb.execute_script(_FIRST_MATCHING_SELECTOR_JS, selectors)
+            if match:
+                return match
+        except Exception as e:
+            logging.debug(f"Selector readiness check failed: {e}")
+        if time.monotonic() >= deadline:
+            return None
+        time.sleep(poll_interval)
+
+
+def wait_for_network_idle(sb, idle_time: float = 0.5, timeout: float = 10, poll_interval: float = 0.2) -> bool:
+    """
+    Wait until the document has loaded and no new resources were requested for `idle_time` seconds.
+
+    Args:
+        sb: SeleniumBase instance
+        idle_time (float): Quiet period that counts as idle
+        timeout (float): Maximum seconds to wait
+        poll_interval (float): Seconds between checks
+
+    Returns:
+        bool: True if the page went idle, False on timeout
+    """
+    deadline = time.monotonic() + timeout
+    last_count = -1
+    quiet_since = time.monotonic()
+    while True:
+        try:
+            ready_state, resource_count = sb.execute_script(_NETWORK_STATE_JS)
+            now = time.monotonic()
+            if resource_count != last_count:
+                last_count = resource_count
+                quiet_since = now
+            elif ready_state == 'complete' and now - quiet_since >= idle_time:
+                return True
+        except Exception as e:
+            logging.debug(f"Network idle check failed: {e}")
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(poll_interval)
+
+
+def wait_for_item_count_stable(sb, selector: str, timeout: float = 8, settle_time: float = 0.6,
+                               poll_interval: float = 0.2, min_count: int = 1) -> int:
+    """
+    Wait until the number of elements matching `selector` stops changing.
+
+    Args:
+        sb: SeleniumBase instance
+        selector (str): CSS selector for list items
+        timeout (float): Maximum seconds to wait
+        settle_time (float): How long the count must stay unchanged
+        poll_interval (float): Seconds between checks
+        min_count (int): Count that must be reached before the page can settle
+
+    Returns:
+        int: Last observed item count
+    """
+    deadline = time.monotonic() + timeout
+    last_count = -1
+    stable_since = time.monotonic()
+    while True:
+        try:
+            count = sb.execute_script("return document.querySelectorAll(arguments[0]).length;", selector)
+        except Exception as e:
+            logging.debug(f"Item count check failed: {e}")
+            count = last_count
+        now = time.monotonic()
+        if count != last_count:
+            last_count = count
+            stable_since = now
+        elif count >= min_count and now - stable_since >= settle_time:
+            return count
+        if now >= deadline:
+            return max(last_count, 0)
+        time.sleep(poll_interval)
+
+
+class PageTimer:
+    """Records how long each scraped page took to become ready and to parse"""
+
+    def __init__(self, source: str):
+        """
+        Initialize page timer
+
+        Args:
+            source: Provider name used in log messages
+        """
+        self.source = source
+        self.timings = []
+        self._page = None
+        self._started = None
+        self._ready = None
+
+    def start(self, page: int) -> None:
+        """Mark the start of a page load"""
+        self._page = page
+        self._started = time.monotonic()
+        self._ready = None
+
+    def ready(self) -> None:
+        """Mark the page content as present"""
+        self._ready = time.monotonic()
+
+    def finish(self, item_count: int) -> None:
+        """Mark the page as parsed and log its timings"""
+        if self._started is None:
+            return
+        finished = time.monotonic()
+        ready = self._ready or finished
+        timing = {
+            'page': self._page,
+            'ready_seconds': round(ready - self._started, 2),
+            'parse_seconds': round(finished - ready, 2),
+            'items': item_count,
+        }
+        self.timings.append(timing)
+        logging.info(
+            f"{self.source} page {timing['page']}: ready in {timing['ready_seconds']}s, "
+            f"parsed {item_count} items in {timing['parse_seconds']}s"
+        )
+        self._started = None
+
+    def summary(self) -> str:
+        """Summarize timings across all pages"""
+        total = sum(t['ready_seconds'] + t['parse_seconds'] for t in self.timings)
+        return f"{self.source}: {len(self.timings)} page(s) in {total:.2f}s"
@@ -0,0 +1,112 @@
+"""
+Thread-safe rate limiting shared by the API-based list providers.
+"""
+
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+
+
+class RateLimiter:
+    """Token bucket limiter that can be shared between worker threads"""
+
+    def __init__(self, rate_per_second: float, burst: int = 1):
+        """
+        Initialize rate limiter
+
+        Args:
+            rate_per_second: Sustained number of calls allowed per second
+            burst: Number of calls that may be made back-to-back before throttling
+        """
+        self.rate_per_second = max(float(rate_per_second), 0.001)
+        self.burst = max(int(burst), 1)
+        self._tokens = float(self.burst)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        self._tokens = min(self.burst, self._tokens + elapsed * self.rate_per_second)
+
+    def acquire(self) -> None:
+        """Block until a call is allowed under the configured rate"""
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait_time = (1 - self._tokens) / self.rate_per_second
+            time.sleep(wait_time)
+
+    def penalize(self, seconds: float) -> None:
+        """
+        Drain the bucket so every caller backs off, e.g. after an HTTP 429
+
+        Args:
+            seconds: How long callers should pause before the next request
+        """
+        with self._lock:
+            self._refill()
+            self._tokens = min(self._tokens, 0) - seconds * self.rate_per_second
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+
+_limiters: Dict[str, RateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(name: str, rate_per_second: float, burst: int = 1) -> RateLimiter:
+    """
+    Get the process-wide rate limiter for a service, creating it on first use.
+
+    Args:
+        name (str): Service name (e.g., 'tmdb', 'trakt')
+        rate_per_second (float): Sustained calls per second for a new limiter
+        burst (int): Burst size for a new limiter
+
+    Returns:
+        RateLimiter: Shared limiter for the service
+    """
+    with _limiters_lock:
+        limiter = _limiters.get(name)
+        if limiter is None:
+            limiter = RateLimiter(rate_per_second, burst)
+            _limiters[name] = limiter
+        return limiter
+
+
+def parse_retry_after(value: Optional[str], default: float) -> float:
+    """
+    Parse a Retry-After header given in seconds or as an HTTP-date.
+
+    Args:
+        value (Optional[str]): Header value
+        default (float): Seconds to wait when the header is missing or invalid
+
+    Returns:
+        float: Seconds to wait (never negative)
+    """
+    if not value:
+        return default
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return default
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
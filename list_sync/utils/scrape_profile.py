@@ -0,0 +1,120 @@
+"""
+Lightweight browser profile for headless scraping.
+
+The scrapers only read text and data attributes, so images, media, fonts and
+third-party trackers are pure overhead. Sessions leased with
+`profile=LIGHTWEIGHT_PROFILE` launch with images and ads blocked and GPU
+compositing disabled, block heavy resources by URL pattern through the
+DevTools protocol, use a smaller viewport, and log the bytes transferred and
+load time of every page they open.
+"""
+
+import logging
+import os
+from typing import Any, Dict, Optional
+
+LIGHTWEIGHT_PROFILE = 'lightweight'
+
+# SeleniumBase launch options for the lightweight profile
+LIGHTWEIGHT_SB_OPTIONS = {
+    'block_images': True,
+    'ad_block_on': True,
+    'chromium_arg': (
+        '--disable-gpu,--disable-gpu-compositing,--disable-software-rasterizer,'
+        '--disable-smooth-scrolling,--mute-audio,--autoplay-policy=user-gesture-required'
+    ),
+}
+
+LIGHTWEIGHT_WINDOW_SIZE = (1280, 900)
+
+# Resources blocked by URL pattern (media, fonts and common trackers)
+BLOCKED_URL_PATTERNS = [
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.avif', '*.svg', '*.ico',
+    '*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot',
+    '*.mp4', '*.webm', '*.m3u8', '*.mp3', '*.ts',
+    '*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*',
+    '*googlesyndication.com*', '*amazon-adsystem.com*', '*scorecardresearch.com*',
+    '*facebook.net*', '*quantserve.com*', '*adsrvr.org*', '*criteo.com*',
+    '*hotjar.com*', '*chartbeat.com*', '*jwplayer.com*', '*jwpcdn.com*',
+]
+
+_PAGE_STATS_JS = """
+var nav = performance.getEntriesByType('navigation')[0];
+var resources = performance.getEntriesByType('resource');
+var bytes = nav ? (nav.transferSize || 0) : 0;
+for (var i = 0; i < resources.length; i++) { bytes += resources[i].transferSize || 0; }
+var loadMs = nav ? (nav.loadEventEnd || nav.domContentLoadedEventEnd || nav.duration) : 0;
+return [bytes, loadMs, resources.length];
+"""
+
+
+def is_lightweight_profile_enabled() -> bool:
+    """
+    Check whether providers that opt into the lightweight profile should use it.
+
+    Returns:
+        bool: False if LISTSYNC_BROWSER_LIGHTWEIGHT is set to 'false'
+    """
+    return os.getenv('LISTSYNC_BROWSER_LIGHTWEIGHT', 'true').lower() != 'false'
+
+
+def resolve_profile(profile: Optional[str]) -> Optional[str]:
+    """Return the profile to use, honouring the LISTSYNC_BROWSER_LIGHTWEIGHT switch"""
+    if profile == LIGHTWEIGHT_PROFILE and not is_lightweight_profile_enabled():
+        return None
+    return profile
+
+
+def profile_sb_options(profile: Optional[str]) -> Dict[str, Any]:
+    """
+    Get the SeleniumBase launch options for a profile.
+
+    Args:
+        profile (Optional[str]): Profile name, or None for the default profile
+
+    Returns:
+        Dict[str, Any]: Extra SeleniumBase options
+    """
+    if profile == LIGHTWEIGHT_PROFILE:
+        return dict(LIGHTWEIGHT_SB_OPTIONS)
+    return {}
+
+
+def prepare_browser(sb, profile: Optional[str]) -> None:
+    """
+    Apply runtime settings for a profile to a freshly launched browser.
+
+    Args:
+        sb: SeleniumBase instance
+        profile (Optional[str]): Profile name
+    """
+    if profile != LIGHTWEIGHT_PROFILE:
+        return
+    try:
+        sb.set_window_size(*LIGHTWEIGHT_WINDOW_SIZE)
+    except Exception as e:
+        logging.debug(f"Could not resize browser window: {e}")
+    try:
+        sb.driver.execute_cdp_cmd('Network.enable', {})
+        sb.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
+    except Exception as e:
+        logging.warning(f"⚠️ Could not enable request blocking for lightweight profile: {e}")
+
+
+def log_page_stats(sb, url: str) -> None:
+    """
+    Log bytes transferred and load time for the page that was just opened.
+
+    Args:
+        sb: SeleniumBase instance
+        url (str): URL that was opened
+    """
+    try:
+        transferred, load_ms, requests_count = sb.execute_script(_PAGE_STATS_JS)
+    except Exception as e:
+        logging.debug(f"Could not read page stats for {url}: {e}")
+        return
+    logging.info(
+        f"Page stats for {url}: {transferred / 1024:.0f} KB transferred over "
+        f"{requests_count} requests, loaded in {load_ms / 1000:.2f}s"
+    )
@@ -212,6 +212,7 @@ export interface PaginatedResponse<T> {
   page: number
   limit: number
   total_pages: number
+  next_cursor?: string | null
 }
 
 // API Response types
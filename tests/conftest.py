@@ -0,0 +1,18 @@
+"""Shared fixtures for the ListSync test suite"""
+
+import pytest
+
+from list_sync import database
+from list_sync.utils.db_pool import SQLitePool
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    """Point the database module at a fresh, fully migrated database in a temp directory"""
+    db_file = str(tmp_path / "list_sync.db")
+    pool = SQLitePool(db_file)
+    monkeypatch.setattr(database, "DB_FILE", db_file)
+    monkeypatch.setattr(database, "_db_pool", pool)
+    database.init_database()
+    yield database
+    pool.close_all()
@@ -0,0 +1,65 @@
+"""Tests for the item listing endpoints of the API server"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+import api_server
+
+
+@pytest.fixture
+def client(db, monkeypatch):
+    """API client backed by the temp database, without Trakt metadata lookups"""
+    monkeypatch.setattr(api_server, "DB_FILE", db.DB_FILE)
+    monkeypatch.setattr("list_sync.providers.trakt.get_trakt_metadata", lambda **kwargs: None)
+    monkeypatch.setattr(api_server, "_metadata_cache", {})
+    return TestClient(api_server.app)
+
+
+def _save_items(db, count):
+    for i in range(count):
+        db.save_sync_result(
+            f"Movie {i}", "movie", f"tt{i:07d}", 1000 + i, "requested",
+            year=2000 + i, list_type="imdb", list_id="ls000000001",
+        )
+
+
+def test_enriched_items_without_cursor(db, client):
+    _save_items(db, 3)
+
+    response = client.get("/api/items/enriched", params={"limit": 2})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["total"] == 3
+    assert len(body["items"]) == 2
+    assert body["next_cursor"]
+    assert body["items"][0]["list_sources"][0]["list_id"] == "ls000000001"
+
+
+def test_enriched_items_with_cursor(db, client):
+    _save_items(db, 5)
+
+    first = client.get("/api/items/enriched", params={"limit": 2}).json()
+    second = client.get("/api/items/enriched", params={"limit": 2, "cursor": first["next_cursor"]}).json()
+    third = client.get("/api/items/enriched", params={"limit": 2, "cursor": second["next_cursor"]}).json()
+
+    ids = [item["id"] for page in (first, second, third) for item in page["items"]]
+    assert len(ids) == 5
+    assert len(set(ids)) == 5
+    assert third["next_cursor"] is None
+
+
+def test_enriched_items_cursor_matches_page_numbers(db, client):
+    _save_items(db, 4)
+
+    first = client.get("/api/items/enriched", params={"limit": 2}).json()
+    by_cursor = client.get("/api/items/enriched", params={"limit": 2, "cursor": first["next_cursor"]}).json()
+    by_page = client.get("/api/items/enriched", params={"limit": 2, "page": 2}).json()
+
+    assert [item["id"] for item in by_cursor["items"]] == [item["id"] for item in by_page["items"]]
+
+
+def test_enriched_items_invalid_cursor(db, client):
+    response = client.get("/api/items/enriched", params={"cursor": "not-a-cursor"})
+
+    assert response.status_code == 400
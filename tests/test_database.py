@@ -0,0 +1,43 @@
+"""Tests for synced item storage in list_sync.database"""
+
+from list_sync.database import get_connection
+
+
+def _rows(title):
+    with get_connection() as conn:
+        return conn.execute(
+            'SELECT id, identity_key FROM synced_items WHERE title = ?', (title,)
+        ).fetchall()
+
+
+def test_identity_upgrade_merges_into_existing_tmdb_row(db):
+    tmdb_row = db.save_sync_result("Heat", "movie", None, 949, "already_available", year=1995,
+                                   list_type="trakt", list_id="a")
+    db.save_sync_result("Heat", "movie", None, None, "not_found", year=1995,
+                        list_type="letterboxd", list_id="b")
+    db.save_sync_result("Heat", "movie", "tt0113277", None, "not_found", year=1995,
+                        list_type="imdb", list_id="c")
+    assert len(_rows("Heat")) == 2
+
+    item_id = db.save_sync_result("Heat", "movie", "tt0113277", 949, "requested", year=1995,
+                                  list_type="imdb", list_id="d")
+
+    assert item_id == tmdb_row
+    assert _rows("Heat") == [(tmdb_row, "tmdb:movie:949")]
+    assert sorted(entry['id'] for entry in db.get_item_lists(item_id)) == ["a", "b", "c", "d"]
+    assert db.count_unique_items() == 1
+    assert db.get_unique_status_counts() == {"requested": 1}
+    assert db.reconcile_status_counters() == 0
+
+
+def test_identity_upgrade_without_existing_row(db):
+    first = db.save_sync_result("Ronin", "movie", None, None, "not_found", year=1998,
+                                list_type="letterboxd", list_id="a")
+    second = db.save_sync_result("Ronin", "movie", "tt0122690", None, "not_found", year=1998,
+                                 list_type="imdb", list_id="b")
+    third = db.save_sync_result("Ronin", "movie", "tt0122690", 8195, "requested", year=1998,
+                                list_type="trakt", list_id="c")
+
+    assert first == second == third
+    assert _rows("Ronin") == [(first, "tmdb:movie:8195")]
+    assert sorted(entry['id'] for entry in db.get_item_lists(first)) == ["a", "b", "c"]
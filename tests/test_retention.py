@@ -0,0 +1,38 @@
+"""Tests for the database maintenance job in list_sync.retention"""
+
+import sqlite3
+
+from list_sync import database, retention
+from list_sync.utils.db_pool import SQLitePool
+
+
+def _auto_vacuum():
+    with database.get_connection() as conn:
+        return conn.execute('PRAGMA auto_vacuum').fetchone()[0]
+
+
+def test_new_database_uses_incremental_auto_vacuum(db):
+    assert _auto_vacuum() == 2
+
+
+def test_large_database_is_rebuilt_between_syncs(tmp_path, monkeypatch):
+    db_file = str(tmp_path / "list_sync.db")
+    with sqlite3.connect(db_file) as conn:
+        conn.execute('CREATE TABLE filler (data BLOB)')
+        conn.executemany('INSERT INTO filler VALUES (?)',
+                         [(b'x' * 4000,) for _ in range(database.AUTO_VACUUM_MIGRATION_MAX_PAGES)])
+    conn.close()
+
+    pool = SQLitePool(db_file)
+    monkeypatch.setattr(database, "DB_FILE", db_file)
+    monkeypatch.setattr(database, "_db_pool", pool)
+    monkeypatch.setattr(retention, "_last_maintenance", 0.0)
+    try:
+        database.init_database()
+        assert database.get_schema_version() == database.MIGRATIONS[-1][0]
+        assert _auto_vacuum() == 0
+
+        retention.run_idle_maintenance()
+        assert _auto_vacuum() == 2
+    finally:
+        pool.close_all()
@@ -0,0 +1,48 @@
+"""Tests for streaming list fetches in list_sync.main"""
+
+import pytest
+
+from list_sync import main, providers
+
+
+@pytest.fixture
+def list_providers(monkeypatch):
+    """Replace the imdb and letterboxd providers with list-returning fakes"""
+    lists = {
+        "ls001": [{"title": "Heat", "year": 1995, "media_type": "movie", "imdb_id": "tt0113277"},
+                  {"title": "Ronin", "year": 1998, "media_type": "movie", "imdb_id": "tt0122690"}],
+        "user/list/crime": [{"title": "Heat", "year": 1995, "media_type": "movie", "imdb_id": "tt0113277"}],
+    }
+    for provider_type in ("imdb", "letterboxd"):
+        monkeypatch.delitem(providers.STREAM_PROVIDERS, provider_type, raising=False)
+        monkeypatch.setitem(providers.PROVIDERS, provider_type, lambda list_id: [dict(item) for item in lists[list_id]])
+    monkeypatch.setattr(main, "check_cancellation_requested", lambda session_id=None: False)
+
+
+def test_non_streaming_providers_go_through_the_queue(list_providers):
+    synced_lists = []
+    items = list(main.stream_media_from_lists(
+        [{"type": "imdb", "id": "ls001"}, {"type": "letterboxd", "id": "user/list/crime"}], synced_lists
+    ))
+
+    assert [item["title"] for item in items] == ["Heat", "Ronin"]
+    assert [(entry["type"], entry["item_count"]) for entry in synced_lists] == [("imdb", 2), ("letterboxd", 1)]
+    assert [source["type"] for source in items[0]["_source_lists"]] == ["imdb", "letterboxd"]
+
+
+def test_lists_found_after_an_item_was_saved_are_linked(db, list_providers):
+    stream = main.stream_media_from_lists(
+        [{"type": "imdb", "id": "ls001"}, {"type": "letterboxd", "id": "user/list/crime"}], []
+    )
+
+    heat = next(stream)
+    # Save it as process_media_item would, before the letterboxd list has been read
+    heat["_synced_item_id"] = db.save_sync_result(
+        heat["title"], "movie", heat["imdb_id"], 949, "requested", heat["year"], None, "imdb", "ls001"
+    )
+    assert [entry["id"] for entry in db.get_item_lists(heat["_synced_item_id"])] == ["ls001"]
+
+    remaining = list(stream)
+
+    assert [item["title"] for item in remaining] == ["Ronin"]
+    assert sorted(entry["id"] for entry in db.get_item_lists(heat["_synced_item_id"])) == ["ls001", "user/list/crime"]